@@ -0,0 +1,139 @@
+"""End-to-end load test of the bot's commands against the fake Apify server.
+
+Starts a FakeApifyServer, builds the real client, cogs and outbound queue
+on top of it, and fires a mix of truth-posts and filter-posts commands
+from many users at once. Discord itself is replaced by contexts that
+record what would have been sent. Reports command throughput, latency
+percentiles and how many actor runs the commands cost.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_load --commands 500 --concurrency 100 --accounts 25 --latency 1
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+from benchmarks.fake_apify import FakeApifyServer
+from discord_bot.commands.filter_posts import FilterPostsCommand
+from discord_bot.commands.truth_posts import TruthPostsCommand
+from truth_social.client import TruthSocialClient
+from truth_social.config import ApifyConfig
+from truth_social.index import AsyncPostIndex
+
+class LoadContext:
+    """Stand-in for a command context that records sends instead of calling Discord."""
+
+    def __init__(self, user_id: int, channel_id: int):
+        self.author = SimpleNamespace(id=user_id, name=f"user{user_id}")
+        self.channel = SimpleNamespace(id=channel_id, send=self.send)
+        self.messages = 0
+        self.embeds = 0
+        self.errors = []
+
+    async def send(self, content=None, embed=None, embeds=None, **kwargs):
+        self.messages += 1
+        self.embeds += len(embeds or []) + (embed is not None)
+        if content and content.startswith("Error"):
+            self.errors.append(content)
+
+    def typing(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def run(args: argparse.Namespace) -> None:
+    os.environ.setdefault("APIFY_API_TOKEN", "load-test")
+    rng = random.Random(args.seed)
+    server = FakeApifyServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                             seed=args.seed)
+    await server.start()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        index = AsyncPostIndex(os.path.join(data_dir, "posts.db")) if args.index else None
+        client = TruthSocialClient(
+            ApifyConfig(api_token="load-test", actor_id="fake/truth-social-scraper", base_url=server.url),
+            index=index
+        )
+        bot = SimpleNamespace(truth_client=client)
+        posts_cog, filter_cog = TruthPostsCommand(bot), FilterPostsCommand(bot)
+        accounts = [f"account{i}" for i in range(args.accounts)]
+
+        async def invoke(n):
+            ctx = LoadContext(user_id=n, channel_id=n % args.channels)
+            username = rng.choice(accounts)
+            start = time.perf_counter()
+            if rng.random() < args.filter_share:
+                await filter_cog.filter_posts.callback(filter_cog, ctx, username, "economy, -poll", 7)
+            else:
+                await posts_cog.truth_posts.callback(posts_cog, ctx, username)
+            return time.perf_counter() - start, ctx
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def limited(n):
+            async with semaphore:
+                return await invoke(n)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(limited(n) for n in range(args.commands)))
+        elapsed = time.perf_counter() - started
+
+        latencies = [latency for latency, _ in results]
+        errors = sum(len(ctx.errors) for _, ctx in results)
+        embeds = sum(ctx.embeds for _, ctx in results)
+        server_stats = server.stats()
+        outbound_stats = bot.outbound.stats()
+
+        print(f"{args.commands} commands, {args.concurrency} concurrent, {args.accounts} accounts, "
+              f"{args.latency}s actor runs, {args.error_rate:.0%} run failures")
+        print(f"  throughput:   {args.commands / elapsed:8.1f} commands/s over {elapsed:.2f}s")
+        print(f"  latency p50:  {statistics.median(latencies) * 1000:8.1f} ms")
+        print(f"  latency p95:  {percentile(latencies, 0.95) * 1000:8.1f} ms")
+        print(f"  latency max:  {max(latencies) * 1000:8.1f} ms")
+        print(f"  errors:       {errors:8d}")
+        print(f"  embeds sent:  {embeds:8d} in {outbound_stats.messages_sent} messages")
+        print(f"  actor runs:   {server_stats.runs:8d} ({server_stats.failed_runs} failed), "
+              f"{server_stats.requests} HTTP requests")
+        governor_stats = client.governor.stats()
+        print(f"  governor:     {governor_stats.shed:8d} shed, "
+              f"{governor_stats.compute_units_last_hour:.4f} compute units, "
+              f"{client.stale_served} stale responses")
+
+        await bot.outbound.close()
+        await client.close()
+    await server.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--accounts", type=int, default=20)
+    parser.add_argument("--channels", type=int, default=20)
+    parser.add_argument("--filter-share", type=float, default=0.5,
+                        help="fraction of commands that are filter-posts")
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds per actor run")
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--no-index", dest="index", action="store_false",
+                        help="run without the local post index")
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Memory benchmark: bytes per cached post.
+
+Parses a batch of dataset items the way the client does, stores the
+result in the response cache, and measures the allocation with
+tracemalloc. The same posts are also built as plain (dict-backed)
+dataclasses with a fresh author per fetch, which is how the models
+worked before, for comparison.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_models [posts] [fetches]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from truth_social.cache import ResponseCache
+from truth_social.client import TruthSocialClient
+from truth_social.config import ApifyConfig
+from truth_social.models import Post, PostList, UserProfile
+from truth_social.parser import parse_post, parse_profile, parse_timestamp
+
+@dataclass
+class DictUserProfile:
+    username: str
+    display_name: str
+    bio: Optional[str]
+    followers_count: int
+    following_count: int
+    posts_count: int
+    created_at: datetime
+    is_verified: bool
+    location: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+@dataclass
+class DictPost:
+    id: str
+    content: str
+    created_at: datetime
+    likes_count: int
+    replies_count: int
+    reposts_count: int
+    is_repost: bool = False
+    user: Any = None
+    original_post: Any = None
+
+def make_items(count):
+    """Build raw dataset items shaped like the scraper's output."""
+    now = datetime.now(timezone.utc)
+    account = {
+        'username': 'benchuser',
+        'display_name': 'Bench User',
+        'note': '<p>Benchmark account</p>',
+        'followers_count': 1000,
+        'following_count': 10,
+        'statuses_count': count,
+        'created_at': '2022-01-01T00:00:00+00:00',
+        'verified': True
+    }
+    return [{
+        'id': str(10**17 + i),
+        'content': f"Post number {i} about the economy, the border and the election",
+        'created_at': (now - timedelta(minutes=i)).isoformat(),
+        'favourites_count': i,
+        'replies_count': i // 2,
+        'reblogs_count': i // 3,
+        'reblog': None,
+        'account': dict(account)
+    } for i in range(count)]
+
+def measure(build):
+    """Bytes still allocated after ``build()``, keeping its result alive."""
+    # Start each run without timestamps parsed by an earlier one
+    parse_timestamp.cache_clear()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+def build_slotted(client, pages):
+    """Cache each fetch as the client does, with interned authors."""
+    for i, items in enumerate(pages):
+        client.cache.set(("benchuser", True, i), client._parse_post_list(items))
+    return client.cache
+
+def build_dicts(pages):
+    """Cache each fetch with dict-backed models and a fresh author each time."""
+    cache = ResponseCache(ttl=3600, max_entries=len(pages))
+    profile_names = [f.name for f in fields(UserProfile)]
+    post_names = [f.name for f in fields(Post)]
+    for i, items in enumerate(pages):
+        parsed = parse_profile(items[0]['account'])
+        author = DictUserProfile(**{name: getattr(parsed, name) for name in profile_names})
+        posts = []
+        for item in items:
+            post = parse_post(item, None)
+            values = {name: getattr(post, name) for name in post_names}
+            values['user'] = author
+            posts.append(DictPost(**values))
+        cache.set(("benchuser", True, i), PostList(posts=posts))
+    return cache
+
+def main(post_count=2000, fetches=5):
+    pages = [make_items(post_count) for _ in range(fetches)]
+    total = post_count * fetches
+
+    client = TruthSocialClient(ApifyConfig(api_token="bench", actor_id="bench", cache_ttl=3600,
+                                           cache_max_entries=fetches))
+    slotted, _ = measure(lambda: build_slotted(client, pages))
+    plain, _ = measure(lambda: build_dicts(pages))
+
+    print(f"{total} cached posts ({fetches} fetches of {post_count})")
+    print(f"  dict-backed models: {plain / total:8.1f} bytes/post")
+    print(f"  slotted + interned: {slotted / total:8.1f} bytes/post")
+    print(f"  saving:             {1 - slotted / plain:8.1%}")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
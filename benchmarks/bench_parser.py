@@ -0,0 +1,105 @@
+"""Micro-benchmark: parsing Apify dataset items into models.
+
+Parses 10k synthetic items spread over a handful of accounts with the
+ItemParser, first cold and then again as a re-fetch of the same posts
+(the steady state for background ingestion). The per-item parsing the
+client used to do, with fromisoformat on every timestamp and a new
+profile per account list, is timed on the same items for comparison.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parser [items] [accounts]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from truth_social.models import Post, UserProfile
+from truth_social.parser import ItemParser, html_to_text, parse_timestamp
+
+def make_items(count, accounts):
+    """Build raw dataset items shaped like the scraper's output."""
+    now = datetime.now(timezone.utc)
+    profiles = [{
+        'username': f"account{a}",
+        'display_name': f"Account {a}",
+        'note': f"<p>Bio of account {a} &amp; friends</p><p>Second line</p>",
+        'followers_count': 1000 + a,
+        'following_count': 10,
+        'statuses_count': count,
+        'created_at': '2022-01-01T00:00:00+00:00',
+        'verified': True
+    } for a in range(accounts)]
+    return [{
+        'id': str(10**17 + i),
+        'content': f"Post number {i} about the economy, the border and the election",
+        'created_at': (now - timedelta(minutes=i)).isoformat(),
+        'favourites_count': i,
+        'replies_count': i // 2,
+        'reblogs_count': i // 3,
+        'reblog': None,
+        'account': profiles[i % accounts]
+    } for i in range(count)]
+
+def legacy_parse(items):
+    """The client's previous parsing: every field converted per item."""
+    authors = {}
+    posts = []
+    for item in items:
+        data = item['account']
+        author = authors.get(data['username'])
+        if author is None:
+            author = authors[data['username']] = UserProfile(
+                username=data['username'],
+                display_name=data['display_name'],
+                bio=data.get('note', '').replace('<p>', '').replace('</p>', ''),
+                followers_count=data['followers_count'],
+                following_count=data['following_count'],
+                posts_count=data['statuses_count'],
+                created_at=datetime.fromisoformat(data['created_at']),
+                is_verified=data['verified']
+            )
+        posts.append(Post(
+            id=item['id'],
+            content=item['content'],
+            user=author,
+            created_at=datetime.fromisoformat(item['created_at']),
+            likes_count=item['favourites_count'],
+            replies_count=item['replies_count'],
+            reposts_count=item['reblogs_count'],
+            is_repost=item['reblog'] is not None
+        ))
+    return posts
+
+def clear_caches():
+    parse_timestamp.cache_clear()
+    html_to_text.cache_clear()
+
+def timed(parse, items, repeat=7, setup=None):
+    """Best wall time of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        parse(items)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(count=10_000, accounts=10):
+    items = make_items(count, accounts)
+    parser = ItemParser()
+
+    legacy = timed(legacy_parse, items)
+    cold = timed(parser.parse_items, items, setup=clear_caches)
+    warm = timed(parser.parse_items, items)
+
+    print(f"{count} items over {accounts} accounts")
+    for label, seconds in (("legacy per-item parsing", legacy),
+                           ("ItemParser, cold", cold),
+                           ("ItemParser, re-fetch", warm)):
+        print(f"  {label:24} {seconds * 1000:7.1f} ms  {count / seconds:10,.0f} items/s")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
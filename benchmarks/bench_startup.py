@@ -0,0 +1,102 @@
+"""Bot startup time, from process start to ``on_ready``.
+
+Each run starts a fresh interpreter that imports the bot, builds the real
+TruthBot and starts it. Only the Discord login call and the gateway
+connection are stubbed out, so everything the bot itself does before it
+is ready is measured. The parent times the run from spawning the process
+to the child reporting ``on_ready``. The child reports how long the
+import and ``setup_hook`` took, and which data files existed by the time
+it was ready.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def child() -> None:
+    """Start the bot offline and print a JSON report once it is ready."""
+    started = time.perf_counter()
+    import asyncio
+    from types import SimpleNamespace
+    from discord_bot.bot import TruthBot
+    imported = time.perf_counter()
+
+    class OfflineBot(TruthBot):
+        """TruthBot with Discord's login and gateway replaced by no-ops."""
+
+        async def login(self, token):
+            # What Client.login does, minus the HTTP calls
+            await self._async_setup_hook()
+            setup_started = time.perf_counter()
+            await self.setup_hook()
+            self.setup_seconds = time.perf_counter() - setup_started
+            self._connection.user = SimpleNamespace(name="bench", id=0)
+
+        async def connect(self, *, reconnect=True):
+            await self.on_ready()
+            report = {
+                "ready_at": time.time(),
+                "import": imported - started,
+                "setup_hook": self.setup_seconds,
+                "modules": sorted(m for m in ("apify_client", "httpx") if m in sys.modules),
+                "files": sorted(
+                    os.path.join(root, name)[2:]
+                    for root, _, names in os.walk(".") for name in names
+                ),
+            }
+            print(json.dumps(report), flush=True)
+
+    async def run():
+        bot = OfflineBot()
+        try:
+            await bot.start("offline")
+        finally:
+            await bot.close()
+
+    asyncio.run(run())
+
+def spawn() -> dict:
+    """Run one child in an empty directory and return its report plus the wall time to ready."""
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {**os.environ, "PYTHONPATH": REPO_ROOT, "DISCORD_TOKEN": "offline",
+               "APIFY_API_TOKEN": "offline", "LOG_FILE": os.path.join(workdir, "bot.log")}
+        spawned = time.time()
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+            cwd=workdir, env=env, capture_output=True, text=True, check=True
+        ).stdout
+    report = json.loads(output.strip().splitlines()[-1])
+    report["total"] = report["ready_at"] - spawned
+    return report
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return
+
+    reports = [spawn() for _ in range(args.runs)]
+    for phase in ("total", "import", "setup_hook"):
+        values = [report[phase] * 1000 for report in reports]
+        print(f"{phase:>11}: median {statistics.median(values):7.1f} ms, "
+              f"min {min(values):7.1f} ms, max {max(values):7.1f} ms")
+    last = reports[-1]
+    print(f"    modules: {', '.join(last['modules']) or 'no Apify client imported'}")
+    print(f"      files: {', '.join(last['files']) or 'none written before ready'}")
+
+if __name__ == "__main__":
+    main()
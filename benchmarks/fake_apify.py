@@ -0,0 +1,256 @@
+"""Local stand-in for the Apify API, for offline load testing.
+
+Serves the three endpoints the bot uses -- starting an actor run, waiting
+on it, and paging through its dataset -- with configurable run latency,
+failure rate and data volume. Point the bot at it with
+``APIFY_BASE_URL=http://127.0.0.1:8765/v2/`` (or ``ApifyConfig.base_url``)
+and it talks to it through the real ``ApifyClientAsync``.
+
+Every account has a synthetic timeline with a new post every
+``post_interval`` seconds, so incremental fetches with ``lastPostId``
+see new posts appear over time the way monitoring does in production.
+
+Run standalone from the repository root:
+
+    python -m benchmarks.fake_apify --port 8765 --latency 2 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+# Snowflake-style base so post IDs sort by length then lexically, like the real ones
+POST_ID_BASE = 110_000_000_000_000_000
+
+@dataclass
+class FakeApifyStats:
+    """Counters for the fake Apify server."""
+    requests: int = 0
+    runs: int = 0
+    failed_runs: int = 0
+    items_served: int = 0
+
+class FakeApifyServer:
+    """In-process HTTP server that behaves like the Apify API for the scraper actor.
+
+    ``latency`` (plus up to ``jitter``) is how long each actor run takes,
+    ``error_rate`` the fraction of runs that finish as FAILED,
+    ``posts_per_account`` how deep each account's history goes and
+    ``page_latency`` the delay before each page of dataset items.
+    """
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.0, error_rate: float = 0.0,
+                 posts_per_account: int = 200, post_interval: float = 60.0,
+                 page_latency: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.posts_per_account = posts_per_account
+        self.post_interval = post_interval
+        self.page_latency = page_latency
+        self._random = random.Random(seed)
+        self._epoch = time.time()
+        self._ids = itertools.count(1)
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        self._datasets: Dict[str, List[Dict[str, Any]]] = {}
+        self._stats = FakeApifyStats()
+        self._runner: Optional[web.AppRunner] = None
+        self.url: Optional[str] = None
+
+        self.app = web.Application(middlewares=[self._count_requests])
+        self.app.add_routes([
+            web.post("/v2/acts/{actor_id}/runs", self._start_run),
+            web.get("/v2/actor-runs/{run_id}", self._get_run),
+            web.get("/v2/datasets/{dataset_id}/items", self._list_items),
+        ])
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening and return the base URL to put in ``ApifyConfig.base_url``."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}/v2/"
+        return self.url
+
+    async def close(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'FakeApifyServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def stats(self) -> FakeApifyStats:
+        """Return a snapshot of the server counters."""
+        return FakeApifyStats(**vars(self._stats))
+
+    @web.middleware
+    async def _count_requests(self, request, handler):
+        self._stats.requests += 1
+        return await handler(request)
+
+    def _account(self, username: str) -> Dict[str, Any]:
+        """Account record shaped like the scraper's output."""
+        return {
+            'username': username,
+            'display_name': username.title(),
+            'note': f"<p>Synthetic account {username}</p>",
+            'followers_count': 1000,
+            'following_count': 100,
+            'statuses_count': self.posts_per_account,
+            'created_at': '2022-01-01T00:00:00+00:00',
+            'verified': False
+        }
+
+    def _timeline(self, username: str, max_posts: int,
+                  last_post_id: Optional[str]) -> List[Dict[str, Any]]:
+        """The newest posts of an account, newest first."""
+        account = self._account(username)
+        # One post every post_interval seconds since the server started
+        newest = self.posts_per_account + int((time.time() - self._epoch) / self.post_interval)
+        # Keep accounts apart so their IDs never collide
+        offset = (sum(map(ord, username)) % 1000) * 10_000_000
+        now = datetime.now(timezone.utc)
+        items = []
+        for n in range(newest, max(newest - max_posts, 0), -1):
+            post_id = str(POST_ID_BASE + offset + n)
+            if last_post_id and (len(post_id), post_id) <= (len(last_post_id), last_post_id):
+                break
+            items.append({
+                'id': post_id,
+                'content': f"Post {n} by {username} about the economy and the election",
+                'created_at': (now - timedelta(seconds=(newest - n) * self.post_interval)).isoformat(),
+                'favourites_count': n % 500,
+                'replies_count': n % 50,
+                'reblogs_count': n % 20,
+                'reblog': None,
+                'account': account
+            })
+        return items
+
+    def _items_for(self, run_input: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Dataset items an actor run with this input would produce."""
+        identifiers = run_input.get("identifiers", [])
+        if not run_input.get("fetchPosts", True):
+            return [{'account': self._account(username)} for username in identifiers]
+        last_post_id = run_input.get("lastPostId") if run_input.get("useLastPostId") else None
+        items = []
+        for username in identifiers:
+            items.extend(self._timeline(username, run_input.get("maxPosts", 20), last_post_id))
+        return items
+
+    def _run_record(self, run_id: str) -> Dict[str, Any]:
+        """Current state of a run, as the API reports it."""
+        run = self._runs[run_id]
+        finished = time.monotonic() >= run["finishes_at"]
+        return {
+            "id": run_id,
+            "status": run["final_status"] if finished else "RUNNING",
+            "defaultDatasetId": run["dataset_id"],
+            "startedAt": run["started_at"],
+            # A compute unit is one GB-hour; runs use the actor's default 1 GB
+            "stats": {"computeUnits": run["duration"] / 3600 if finished else 0.0},
+        }
+
+    async def _start_run(self, request: web.Request) -> web.Response:
+        run_input = await request.json() if request.can_read_body else {}
+        run_id = f"run{next(self._ids)}"
+        dataset_id = f"dataset{run_id}"
+        failed = self._random.random() < self.error_rate
+        duration = self.latency + self._random.uniform(0, self.jitter)
+        self._datasets[dataset_id] = [] if failed else self._items_for(run_input)
+        self._runs[run_id] = {
+            "dataset_id": dataset_id,
+            "final_status": "FAILED" if failed else "SUCCEEDED",
+            "duration": duration,
+            "finishes_at": time.monotonic() + duration,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._stats.runs += 1
+        self._stats.failed_runs += failed
+        return web.json_response({"data": self._run_record(run_id)}, status=201)
+
+    async def _get_run(self, request: web.Request) -> web.Response:
+        run_id = request.match_info["run_id"]
+        if run_id not in self._runs:
+            return web.json_response(
+                {"error": {"type": "record-not-found", "message": "Actor run was not found"}},
+                status=404
+            )
+        # Hold the request until the run finishes, up to waitForFinish seconds
+        wait = float(request.query.get("waitForFinish", 0))
+        remaining = self._runs[run_id]["finishes_at"] - time.monotonic()
+        if remaining > 0 and wait > 0:
+            await asyncio.sleep(min(remaining, wait))
+        return web.json_response({"data": self._run_record(run_id)})
+
+    async def _list_items(self, request: web.Request) -> web.Response:
+        dataset_id = request.match_info["dataset_id"]
+        if dataset_id not in self._datasets:
+            return web.json_response(
+                {"error": {"type": "record-not-found", "message": "Dataset was not found"}},
+                status=404
+            )
+        if self.page_latency:
+            await asyncio.sleep(self.page_latency)
+        items = self._datasets[dataset_id]
+        offset = int(request.query.get("offset", 0))
+        limit = int(request.query.get("limit", 999_999_999_999))
+        page = items[offset:offset + limit]
+        self._stats.items_served += len(page)
+        return web.json_response(page, headers={
+            "x-apify-pagination-total": str(len(items)),
+            "x-apify-pagination-offset": str(offset),
+            "x-apify-pagination-count": str(len(page)),
+            "x-apify-pagination-limit": str(limit),
+            "x-apify-pagination-desc": "",
+        })
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run the server until interrupted."""
+    server = FakeApifyServer(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        posts_per_account=args.posts_per_account, post_interval=args.post_interval,
+        page_latency=args.page_latency, seed=args.seed
+    )
+    url = await server.start(args.host, args.port)
+    print(f"Fake Apify API listening on {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds per actor run")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random seconds per run")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of runs that fail")
+    parser.add_argument("--posts-per-account", type=int, default=200)
+    parser.add_argument("--post-interval", type=float, default=60.0,
+                        help="seconds between new posts on each account")
+    parser.add_argument("--page-latency", type=float, default=0.0,
+                        help="seconds before each page of dataset items")
+    parser.add_argument("--seed", type=int, default=None)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
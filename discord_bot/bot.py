@@ -1,39 +1,44 @@
 import os
 import discord
 import logging
-import asyncio
-from dotenv import load_dotenv
-from .config import config
+from typing import Optional
+from .config import get_config
+from .commands.truth import create_client
+from .ingestion import IngestionService
+from .outbound import OutboundQueue
+from .ratelimit import RateLimiter
 from discord.ext import commands
 
-# Ensure logs directory exists
-os.makedirs("logs", exist_ok=True)
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename='logs/bot.log'
-)
+# Logging and .env are set up by main(), so importing this module has no
+# side effects.
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
-DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
-BOT_PREFIX = os.getenv("BOT_PREFIX", "!t")
-
 # Bot configuration
 class TruthBot(commands.Bot):
-    def __init__(self):
+    def __init__(self, prefix: Optional[str] = None):
         intents = discord.Intents.default()
         intents.message_content = True
+        self.bot_prefix = prefix or os.getenv("BOT_PREFIX", "!t")
         super().__init__(
-            command_prefix=BOT_PREFIX,
+            command_prefix=self.bot_prefix,
             intents=intents,
             help_command=None
         )
+        # Shared by every cog; created in setup_hook
+        self.truth_client = None
+        # Every cog sends embeds through this queue
+        self.outbound = OutboundQueue()
+        # Command rate limits shared by every cog
+        self.rate_limiter = RateLimiter()
+        # Fills the local post store in the background; created in setup_hook
+        self.ingestion = None
         
     async def setup_hook(self):
+        # One Truth Social client for the whole bot. It is cheap to build:
+        # the Apify connection pool and the local stores open on first use.
+        self.truth_client = create_client()
+        self.ingestion = IngestionService.from_env(self.truth_client)
+        
         # Load command cogs
         await self.load_extension("discord_bot.commands.truth_profile")
         await self.load_extension("discord_bot.commands.truth_posts")
@@ -41,14 +46,27 @@ class TruthBot(commands.Bot):
         await self.load_extension("discord_bot.commands.monitor_posts")
         await self.load_extension("discord_bot.commands.help")
         
+        # Cogs have registered the accounts they need; start pulling them
+        # one interval from now, since the index and cache survived the restart
+        self.ingestion.start(delay=self.ingestion.interval)
+        
+    async def close(self):
+        """Stop ingestion and close the Truth Social client and outbound queue."""
+        if self.ingestion is not None:
+            await self.ingestion.close()
+        if self.truth_client is not None:
+            await self.truth_client.close()
+        await self.outbound.close()
+        await super().close()
+        
     async def on_ready(self):
         """Called when the bot is ready and connected to Discord."""
-        config.logger.info(f'Logged in as {self.user.name}')
-        config.logger.info(f'Bot ID: {self.user.id}')
-        config.logger.info('------')
+        logger.info(f'Logged in as {self.user.name}')
+        logger.info(f'Bot ID: {self.user.id}')
+        logger.info('------')
         # Print all servers the bot is in
         for guild in self.guilds:
-            config.logger.info(f'Bot is in server: {guild.name}')
+            logger.info(f'Bot is in server: {guild.name}')
             # Send a message to each server with instructions
             try:
                 channel = guild.system_channel or next((c for c in guild.text_channels if c.permissions_for(guild.me).send_messages), None)
@@ -62,35 +80,35 @@ class TruthBot(commands.Bot):
                     # Add command information
                     embed.add_field(
                         name="Profile Information",
-                        value=f"`{BOT_PREFIX}truth-profile @username` - View a user's profile information",
+                        value=f"`{self.bot_prefix}truth-profile @username` - View a user's profile information",
                         inline=False
                     )
                     
                     embed.add_field(
                         name="Post Filtering",
-                        value=f"`{BOT_PREFIX}filter-posts @username [keywords] [days]` - Filter posts by keywords and date range\n"
-                              f"• Use quotes for phrases: `{BOT_PREFIX}filter-posts @user \"election fraud\" 7`\n"
-                              f"• Or separate keywords: `{BOT_PREFIX}filter-posts @user election fraud 7`",
+                        value=f"`{self.bot_prefix}filter-posts @username [keywords] [days]` - Filter posts by keywords and date range\n"
+                              f"• Use quotes for phrases: `{self.bot_prefix}filter-posts @user \"election fraud\" 7`\n"
+                              f"• Or separate keywords: `{self.bot_prefix}filter-posts @user election fraud 7`",
                         inline=False
                     )
                     
                     embed.add_field(
                         name="Post Monitoring",
-                        value=f"`{BOT_PREFIX}monitor-posts @username keyword` - Monitor for new posts containing a keyword\n"
-                              f"`{BOT_PREFIX}stop-monitoring` - Stop monitoring posts\n"
-                              f"`{BOT_PREFIX}monitoring-status` - Check current monitoring status",
+                        value=f"`{self.bot_prefix}monitor-posts @username keyword` - Monitor for new posts containing a keyword\n"
+                              f"`{self.bot_prefix}stop-monitoring` - Stop monitoring posts\n"
+                              f"`{self.bot_prefix}monitoring-status` - Check current monitoring status",
                         inline=False
                     )
                     
                     embed.add_field(
                         name="Help",
-                        value=f"`{BOT_PREFIX}help` - Show all commands\n"
-                              f"`{BOT_PREFIX}help <command>` - Show detailed help for a specific command",
+                        value=f"`{self.bot_prefix}help` - Show all commands\n"
+                              f"`{self.bot_prefix}help <command>` - Show detailed help for a specific command",
                         inline=False
                     )
                     
                     # Add footer
-                    embed.set_footer(text=f"Use {BOT_PREFIX}help for more information")
+                    embed.set_footer(text=f"Use {self.bot_prefix}help for more information")
                     
                     await channel.send(embed=embed)
             except Exception as e:
@@ -106,8 +124,10 @@ class TruthBot(commands.Bot):
         await self.process_commands(message)
 
 def main():
-    bot = TruthBot()
-    bot.run(DISCORD_TOKEN)
+    config = get_config()
+    config.setup_logging()
+    bot = TruthBot(prefix=config.bot_prefix)
+    bot.run(config.discord_token)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
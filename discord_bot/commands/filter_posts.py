@@ -5,33 +5,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 import shlex
 import asyncio
-from collections import defaultdict
 
 class FilterPostsCommand(TruthSocialCommand):
     """Command to filter Truth Social posts by various criteria."""
     
     def __init__(self, bot):
         super().__init__(bot)
-        self._cooldowns = defaultdict(list)
         self._max_results = 5  # Maximum number of posts to return
-        self._cooldown_time = 30  # Cooldown in seconds
-        self._max_requests_per_hour = 20  # Maximum API requests per hour per user
         self._max_days = 30  # Maximum number of days to look back
-        
-    def _is_on_cooldown(self, user_id: int) -> bool:
-        """Check if a user is on cooldown."""
-        now = datetime.now()
-        # Remove expired cooldowns
-        self._cooldowns[user_id] = [t for t in self._cooldowns[user_id] 
-                                  if (now - t).total_seconds() < self._cooldown_time]
-        # Check if user has exceeded hourly limit
-        hour_ago = now - timedelta(hours=1)
-        recent_requests = [t for t in self._cooldowns[user_id] if t > hour_ago]
-        return len(recent_requests) >= self._max_requests_per_hour
-    
-    def _add_cooldown(self, user_id: int):
-        """Add a cooldown for a user."""
-        self._cooldowns[user_id].append(datetime.now())
     
     @commands.command(name="filter-posts")
     async def filter_posts(self, ctx, username: str, keywords: Optional[str] = None, days: Optional[int] = None):
@@ -40,6 +21,10 @@ class FilterPostsCommand(TruthSocialCommand):
         Usage: !filter-posts username [keywords] [days]
         Example: !filter-posts realDonaldTrump "election fraud" 7
         
+        Separate several keywords or phrases with commas; a post matches
+        if it contains any of them. Prefix a keyword with - to exclude
+        posts containing it, e.g. "election, -poll".
+        
         Rate Limits:
         - Maximum 5 results per search
         - 30 second cooldown between searches
@@ -47,10 +32,8 @@ class FilterPostsCommand(TruthSocialCommand):
         - Maximum 30 days lookback period
         """
         try:
-            # Check cooldown
-            if self._is_on_cooldown(ctx.author.id):
-                remaining = self._cooldown_time - (datetime.now() - self._cooldowns[ctx.author.id][-1]).total_seconds()
-                await ctx.send(f"Please wait {int(remaining)} seconds before using this command again.")
+            # Check cooldown and hourly limit
+            if not await self.check_rate_limit(ctx, "filter-posts"):
                 return
             
             # Default to 7 days if not specified
@@ -66,23 +49,11 @@ class FilterPostsCommand(TruthSocialCommand):
             
             # Show typing indicator while fetching
             async with ctx.typing():
-                # Get posts
-                posts = await self.client.get_user_posts(username)
-                
-                # Filter by date range
+                # Get matching posts, from the local index where it covers the range
+                self.track(username)
                 cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-                filtered_posts = [
-                    post for post in posts.posts 
-                    if post.created_at >= cutoff_date
-                ]
-                
-                # Filter by keywords if provided
-                if keywords:
-                    keyword_list = [k.strip().lower() for k in keywords.split(',')]
-                    filtered_posts = [
-                        post for post in filtered_posts
-                        if any(keyword in post.content.lower() for keyword in keyword_list)
-                    ]
+                posts = await self.client.search_posts(username, since=cutoff_date, query=keywords)
+                filtered_posts = posts.posts
                 
                 if not filtered_posts:
                     await ctx.send(f"No posts found for {username} matching the criteria.")
@@ -94,6 +65,7 @@ class FilterPostsCommand(TruthSocialCommand):
                     filtered_posts = filtered_posts[:self._max_results]
                 
                 # Send filtered posts
+                embeds = []
                 for post in filtered_posts:
                     embed = discord.Embed(
                         title=f"Post by {post.user.display_name}",
@@ -112,11 +84,9 @@ class FilterPostsCommand(TruthSocialCommand):
                     if keywords:
                         filter_info += f"\nContains keywords: {keywords}"
                     embed.set_footer(text=filter_info)
-                    
-                    await ctx.send(embed=embed)
+                    embeds.append(embed)
                 
-                # Add cooldown
-                self._add_cooldown(ctx.author.id)
+                await self.outbound.send(ctx, embeds)
                 
                 await ctx.send(f"Found {len(filtered_posts)} posts matching your criteria.")
             
@@ -1,7 +1,12 @@
 import discord
 from discord.ext import commands
 from .truth import TruthSocialCommand
-from ..database import Database
+from ..database import AsyncDatabase
+from ..notifier import Notifier
+from ..scheduler import WatchScheduler
+from truth_social.client import post_id_key
+from truth_social.governor import current_tenant
+from truth_social.matcher import MAX_QUERY_LENGTH, compile_query
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 import asyncio
@@ -11,73 +16,137 @@ class MonitorPostsCommand(TruthSocialCommand):
     
     def __init__(self, bot):
         super().__init__(bot)
-        self.db = Database()
+        self.db = AsyncDatabase()
+        self.notifier = Notifier(bot, self.outbound)
         self._monitoring_task = None
         self._check_interval = 300  # 5 minutes in seconds
+        self.scheduler = WatchScheduler(
+            self.db.get_active_configs,
+            self._check_group,
+            interval=self._check_interval,
+            max_concurrency=10,
+            fetch=self._fetch_watched
+        )
+        # The checks below already fetch watched accounts, and store what
+        # they fetch, so ingestion doesn't pull them a second time
+        if self.ingestion is not None:
+            self.ingestion.add_exclusion(self._watched_accounts)
         
+    async def cog_load(self):
+        """Resume checking the watches saved before a restart."""
+        self._start_monitoring()
+        
+    def _start_monitoring(self):
+        """Start the background check task if it isn't running."""
+        if self._monitoring_task is None or self._monitoring_task.done():
+            self._monitoring_task = self.bot.loop.create_task(self._check_for_new_posts())
+        
+    async def cog_unload(self):
+        """Stop the monitoring task and close the database."""
+        if self._monitoring_task:
+            self._monitoring_task.cancel()
+        if self.ingestion is not None:
+            self.ingestion.remove_exclusion(self._watched_accounts)
+        await self.db.close()
+        
+    async def _watched_accounts(self):
+        """Usernames with at least one active watch."""
+        return [config['username'] for config in await self.db.get_active_configs()]
+    
     async def _check_for_new_posts(self):
-        """Background task to check for new posts."""
-        while True:
-            try:
-                if not self.db.is_monitoring_active():
-                    await asyncio.sleep(self._check_interval)
-                    continue
-                    
-                config = self.db.get_monitoring_config()
-                if not config:
-                    await asyncio.sleep(self._check_interval)
-                    continue
-                
-                # Get new posts
-                posts = await self.client.get_user_posts(config['username'])
-                
-                # Filter by keyword
-                keyword = config['filter_keyword'].lower()
-                new_posts = [
-                    post for post in posts.posts
-                    if keyword in post.content.lower()
-                ]
-                
-                # If we have a last checked post, only show newer ones
-                if config['last_post_id']:
-                    new_posts = [
-                        post for post in new_posts
-                        if post.id != config['last_post_id']
-                    ]
-                
-                # Send notifications for new posts
-                for post in new_posts:
-                    embed = discord.Embed(
-                        title=f"New post by {post.user.display_name}",
-                        description=post.content,
-                        color=discord.Color.green(),
-                        timestamp=post.created_at
-                    )
-                    
-                    # Add engagement metrics
-                    embed.add_field(name="Likes", value=post.likes_count, inline=True)
-                    embed.add_field(name="Replies", value=post.replies_count, inline=True)
-                    embed.add_field(name="Reposts", value=post.reposts_count, inline=True)
-                    
-                    # Add filter info
-                    embed.set_footer(text=f"Matching keyword: {config['filter_keyword']}")
-                    
-                    # Send to all channels where the command was used
-                    for channel in self.bot.get_all_channels():
-                        if isinstance(channel, discord.TextChannel):
-                            await channel.send(embed=embed)
-                
-                # Update last checked
-                if new_posts:
-                    self.db.update_last_checked(
-                        new_posts[0].id,
-                        datetime.now(timezone.utc).isoformat()
-                    )
-                
-            except Exception as e:
-                print(f"Error in monitoring task: {str(e)}")
+        """Background task that checks every active watch on schedule."""
+        # Not the server whose command happened to start the task
+        current_tenant.set("monitor")
+        await self.scheduler.run_forever()
+    
+    async def _fetch_watched(self, usernames):
+        """Fetch every account due on a tick in one actor run, bypassing the cache."""
+        return await self.client.refresh_accounts(usernames)
+    
+    async def _check_group(self, username, configs, posts=None):
+        """Process every watch on a user against one fetch of their posts.
+        
+        The scheduler normally passes ``posts`` from its batched fetch;
+        without them the user's posts are fetched here.
+        """
+        if posts is None:
+            # Fetch from the oldest cursor so every watch sees its new posts
+            cursors = [config.get('post_cursor') for config in configs]
+            since_id = min(cursors, key=post_id_key) if all(cursors) else None
+            posts = await self.client.get_user_posts(username, since_id=since_id)
+        
+        # Watches deliver to their own channels, so they can run side by side
+        await asyncio.gather(*(self._check_watch(config, posts) for config in configs))
+    
+    async def _check_watch(self, config, posts):
+        """Filter and announce new posts for a single watch."""
+        cursor = config.get('post_cursor')
+        if cursor is None:
+            # A new watch's first check only sets its baseline; what was
+            # posted before it was created is not news. "0" sorts before
+            # every ID, for accounts with no posts yet.
+            await self.db.update_post_cursor(posts.next_cursor or "0", config['id'])
+            return
+        cursor_key = post_id_key(cursor) if cursor else None
+        
+        # Only the delta past this watch's high-water mark, deduplicated
+        delta = {}
+        for post in posts.posts:
+            if cursor_key is None or post_id_key(post.id) > cursor_key:
+                delta.setdefault(post.id, post)
+        
+        # Filter by keyword
+        new_posts = compile_query(config['filter_keyword']).filter(delta.values())
+        
+        # Drop anything already delivered to this watch
+        if new_posts:
+            seen = await self.db.get_seen_posts(config['id'], [post.id for post in new_posts])
+            new_posts = [post for post in new_posts if post.id not in seen]
+        
+        # Build notifications for new posts
+        embeds = []
+        for post in new_posts:
+            embed = discord.Embed(
+                title=f"New post by {post.user.display_name}",
+                description=post.content,
+                color=discord.Color.green(),
+                timestamp=post.created_at
+            )
+            
+            # Add engagement metrics
+            embed.add_field(name="Likes", value=post.likes_count, inline=True)
+            embed.add_field(name="Replies", value=post.replies_count, inline=True)
+            embed.add_field(name="Reposts", value=post.reposts_count, inline=True)
             
-            await asyncio.sleep(self._check_interval)
+            # Add filter info
+            embed.set_footer(text=f"Matching keyword: {config['filter_keyword']}")
+            embeds.append(embed)
+        
+        # Send only to the channel the watch was created in. If that fails,
+        # leave the seen set and cursor alone so the next check retries.
+        if embeds and not await self.notifier.send(config.get('channel_id'), *embeds):
+            return
+        
+        if new_posts:
+            # Oldest first, so the bounded history keeps the newest IDs
+            delivered = sorted((post.id for post in new_posts), key=post_id_key)
+            await self.db.mark_posts_seen(config['id'], delivered)
+            await self.db.update_last_checked(
+                delivered[-1],
+                datetime.now(timezone.utc).isoformat(),
+                config['id']
+            )
+        
+        # Only ever move the high-water mark forward
+        next_cursor = posts.next_cursor
+        if next_cursor and (cursor_key is None or post_id_key(next_cursor) > cursor_key):
+            await self.db.update_post_cursor(next_cursor, config['id'])
+    
+    @staticmethod
+    def _scope(ctx):
+        """Return the (guild_id, channel_id) a command was used in."""
+        guild_id = ctx.guild.id if ctx.guild else None
+        return guild_id, ctx.channel.id
     
     @commands.command(name="monitor-posts")
     async def monitor_posts(self, ctx, username: str, keyword: str):
@@ -85,22 +154,37 @@ class MonitorPostsCommand(TruthSocialCommand):
         
         Usage: !monitor-posts username keyword
         Example: !monitor-posts realDonaldTrump "election"
+        
+        Each channel can watch several accounts, one keyword per account.
+        The keyword accepts the same comma-separated, "-"-to-exclude syntax
+        as !filter-posts.
         """
         try:
+            if not await self.check_rate_limit(ctx, "monitor-posts"):
+                return
+            
+            # Every check compiles the keyword, so refuse ones it can't handle
+            if len(keyword) > MAX_QUERY_LENGTH:
+                await ctx.send(f"Keywords must be at most {MAX_QUERY_LENGTH} characters.")
+                return
+            
             # Remove @ if present
             username = username.lstrip('@')
+            guild_id, channel_id = self._scope(ctx)
             
-            # Check if monitoring is already active
-            if self.db.is_monitoring_active():
-                await ctx.send("Monitoring is already active. Use !stop-monitoring to stop first.")
+            # Check if this account is already watched here
+            if await self.db.is_monitoring_active(username, guild_id, channel_id):
+                await ctx.send(
+                    f"Monitoring is already active for @{username} in this channel. "
+                    f"Use !stop-monitoring {username} to stop first."
+                )
                 return
             
             # Add new monitoring configuration
-            self.db.add_monitoring_config(username, keyword)
+            await self.db.add_monitoring_config(username, keyword, guild_id, channel_id)
             
             # Start monitoring task if not already running
-            if not self._monitoring_task:
-                self._monitoring_task = self.bot.loop.create_task(self._check_for_new_posts())
+            self._start_monitoring()
             
             await ctx.send(
                 f"Started monitoring posts from @{username} for keyword: {keyword}\n"
@@ -111,14 +195,24 @@ class MonitorPostsCommand(TruthSocialCommand):
             await ctx.send(f"Error setting up monitoring: {str(e)}")
     
     @commands.command(name="stop-monitoring")
-    async def stop_monitoring(self, ctx):
-        """Stop monitoring posts."""
+    async def stop_monitoring(self, ctx, username: Optional[str] = None):
+        """Stop monitoring posts in this channel.
+        
+        Usage: !stop-monitoring [username]
+        Without a username every watch in this channel is stopped.
+        """
         try:
-            if not self.db.is_monitoring_active():
+            if username:
+                username = username.lstrip('@')
+            guild_id, channel_id = self._scope(ctx)
+            
+            if not await self.db.is_monitoring_active(username, guild_id, channel_id):
                 await ctx.send("No active monitoring to stop.")
                 return
             
-            self.db.deactivate_monitoring()
+            await self.db.deactivate_monitoring(
+                guild_id=guild_id, channel_id=channel_id, username=username
+            )
             await ctx.send("Monitoring stopped successfully.")
             
         except Exception as e:
@@ -126,10 +220,11 @@ class MonitorPostsCommand(TruthSocialCommand):
     
     @commands.command(name="monitoring-status")
     async def monitoring_status(self, ctx):
-        """Check the current monitoring status."""
+        """Check the monitoring status for this channel."""
         try:
-            config = self.db.get_monitoring_config()
-            if not config:
+            guild_id, channel_id = self._scope(ctx)
+            configs = await self.db.get_active_configs(guild_id=guild_id, channel_id=channel_id)
+            if not configs:
                 await ctx.send("No active monitoring configuration.")
                 return
             
@@ -138,17 +233,38 @@ class MonitorPostsCommand(TruthSocialCommand):
                 color=discord.Color.blue()
             )
             
-            embed.add_field(name="Username", value=config['username'], inline=True)
-            embed.add_field(name="Keyword", value=config['filter_keyword'], inline=True)
-            embed.add_field(name="Active", value="Yes", inline=True)
-            
-            if config['last_checked_timestamp']:
-                last_checked = datetime.fromisoformat(config['last_checked_timestamp'])
-                embed.add_field(
-                    name="Last Checked",
-                    value=last_checked.strftime("%Y-%m-%d %H:%M:%S"),
-                    inline=False
-                )
+            if len(configs) == 1:
+                config = configs[0]
+                embed.add_field(name="Username", value=config['username'], inline=True)
+                embed.add_field(name="Keyword", value=config['filter_keyword'], inline=True)
+                embed.add_field(name="Active", value="Yes", inline=True)
+                
+                next_run = self.scheduler.next_run_at(config.get('id'))
+                if next_run:
+                    embed.add_field(
+                        name="Next Check",
+                        value=next_run.strftime("%Y-%m-%d %H:%M:%S UTC"),
+                        inline=False
+                    )
+                
+                if config['last_checked_timestamp']:
+                    last_checked = datetime.fromisoformat(config['last_checked_timestamp'])
+                    embed.add_field(
+                        name="Last Checked",
+                        value=last_checked.strftime("%Y-%m-%d %H:%M:%S"),
+                        inline=False
+                    )
+            else:
+                # Discord allows at most 25 fields per embed
+                for config in configs[:25]:
+                    value = f"Keyword: {config['filter_keyword']}"
+                    if config['last_checked_timestamp']:
+                        last_checked = datetime.fromisoformat(config['last_checked_timestamp'])
+                        value += f"\nLast checked: {last_checked.strftime('%Y-%m-%d %H:%M:%S')}"
+                    next_run = self.scheduler.next_run_at(config.get('id'))
+                    if next_run:
+                        value += f"\nNext check: {next_run.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+                    embed.add_field(name=f"@{config['username']}", value=value, inline=False)
             
             await ctx.send(embed=embed)
             
@@ -20,6 +20,9 @@ class ProfileCommand(TruthSocialCommand):
         username = username.lstrip('@')
         
         try:
+            if not await self.check_rate_limit(ctx, "profile"):
+                return
+            
             # Show typing indicator while fetching
             async with ctx.typing():
                 # Get user profile
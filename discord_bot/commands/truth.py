@@ -2,23 +2,69 @@ import discord
 from discord.ext import commands
 from truth_social.client import TruthSocialClient
 from truth_social.config import ApifyConfig
+from truth_social.governor import current_tenant
+from truth_social.index import AsyncPostIndex
+from truth_social.store import AsyncResponseStore
+from truth_social.models import Served
+from ..ingestion import IngestionService
+from ..outbound import get_outbound_queue
+from ..ratelimit import describe, get_rate_limiter
 import os
 
+def create_client() -> TruthSocialClient:
+    """Build a Truth Social client from the environment."""
+    return TruthSocialClient(
+        # Without a token commands refuse to run, so the client may still be built
+        ApifyConfig.from_env(require_token=False),
+        index=AsyncPostIndex(os.getenv("POST_INDEX_PATH", "data/posts.db")),
+        cache_store=AsyncResponseStore(os.getenv("RESPONSE_CACHE_PATH", "data/cache.db"))
+    )
+
 class TruthSocialCommand(commands.Cog):
     """Base class for Truth Social commands."""
     
     def __init__(self, bot):
         self.bot = bot
-        self.client = TruthSocialClient(
-            ApifyConfig(
-                api_token=os.getenv("APIFY_API_TOKEN"),
-                actor_id=os.getenv("APIFY_ACTOR_ID", "muhammetakkurtt/truth-social-scraper")
-            )
-        )
+        # Every cog shares the bot's client so they share its connection
+        # pool, response cache and in-flight requests.
+        if getattr(bot, "truth_client", None) is None:
+            bot.truth_client = create_client()
+        self.client = bot.truth_client
+        # Embeds go through the bot-wide queue so they are batched and paced
+        self.outbound = get_outbound_queue(bot)
+        # Per-user, per-guild and bot-wide limits, shared by every cog
+        self.rate_limiter = get_rate_limiter(bot)
+        # Background ingestion, when the bot runs it
+        ingestion = getattr(bot, "ingestion", None)
+        self.ingestion = ingestion if isinstance(ingestion, IngestionService) else None
+        
+    def track(self, username: str):
+        """Keep an account's posts ingested in the background once someone asks for it."""
+        if self.ingestion is not None:
+            self.ingestion.track(username)
+        
+    def footer(self, ctx, served: Served) -> str:
+        """Embed footer naming who asked and, for a stale answer, when its data is from."""
+        text = f"Requested by {ctx.author.name}"
+        if served.stale:
+            text += f" • As of {served.as_of:%b %d, %H:%M} UTC, refreshing"
+        return text
+        
+    async def check_rate_limit(self, ctx, command: str) -> bool:
+        """Count a use of a command; tell the user to wait and return False if over a limit."""
+        guild = getattr(ctx, "guild", None)
+        limited = self.rate_limiter.acquire(command, ctx.author.id, getattr(guild, "id", None))
+        if limited is None:
+            return True
+        await ctx.send(describe(limited))
+        return False
         
     async def cog_before_invoke(self, ctx):
         """Verify the command has the required configuration."""
+        # Actor runs for this command queue fairly against other servers'
+        guild = getattr(ctx, "guild", None)
+        current_tenant.set(guild.id if guild is not None else ("dm", ctx.author.id))
         if not os.getenv("APIFY_API_TOKEN"):
             await ctx.send("Error: Apify API token not configured. Please check your .env file.")
             return False
-        return True 
\ No newline at end of file
+        return True
@@ -17,11 +17,18 @@ class TruthPostsCommand(TruthSocialCommand):
         username = username.lstrip('@')
         
         try:
+            if not await self.check_rate_limit(ctx, "truth-posts"):
+                return
+            
             # Show typing indicator while fetching
             async with ctx.typing():
-                posts = await self.client.get_user_posts(username, limit=5)
+                self.track(username)
+                # Stale posts are answered at once and refreshed in the background
+                served = await self.client.serve_user_posts(username, limit=5)
+                posts = served.value
                 
                 # Create embed for each post
+                embeds = []
                 for i, post in enumerate(posts.posts, 1):
                     embed = discord.Embed(
                         title=f"Post {i} by {post.user.display_name}",
@@ -37,9 +44,10 @@ class TruthPostsCommand(TruthSocialCommand):
                     embed.add_field(name="Reposts", value=f"{post.reposts_count:,}", inline=True)
                     
                     # Set footer
-                    embed.set_footer(text=f"Requested by {ctx.author.name}")
-                    
-                    await ctx.send(embed=embed)
+                    embed.set_footer(text=self.footer(ctx, served))
+                    embeds.append(embed)
+                
+                await self.outbound.send(ctx, embeds)
                     
         except Exception as e:
             await ctx.send(f"Error fetching posts: {str(e)}")
@@ -17,9 +17,15 @@ class TruthProfileCommand(TruthSocialCommand):
         username = username.lstrip('@')
         
         try:
+            if not await self.check_rate_limit(ctx, "truth-profile"):
+                return
+            
             # Show typing indicator while fetching
             async with ctx.typing():
-                profile = await self.client.get_user_profile(username)
+                self.track(username)
+                # A stale profile is answered at once and refreshed in the background
+                served = await self.client.serve_user_profile(username)
+                profile = served.value
                 
                 # Create embed
                 embed = discord.Embed(
@@ -40,8 +46,8 @@ class TruthProfileCommand(TruthSocialCommand):
                     embed.add_field(name="Bio", value=profile.bio, inline=False)
                 
                 # Set footer with timestamp
-                embed.set_footer(text=f"Requested by {ctx.author.name}")
-                embed.timestamp = datetime.utcnow()
+                embed.set_footer(text=self.footer(ctx, served))
+                embed.timestamp = served.as_of or datetime.utcnow()
                 
                 await ctx.send(embed=embed)
                 
@@ -1,10 +1,8 @@
 import os
 import logging
+from typing import Optional
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 class ConfigError(Exception):
     """Custom exception for configuration errors."""
     pass
@@ -26,8 +24,7 @@ class BotConfig:
         # Validate configurations
         self._validate_config()
         
-        # Setup logging
-        self._setup_logging()
+        self.logger = logging.getLogger(__name__)
 
     def _get_required_env(self, key: str) -> str:
         """Get a required environment variable."""
@@ -46,8 +43,12 @@ class BotConfig:
         if self.log_level not in valid_log_levels:
             raise ConfigError(f"LOG_LEVEL must be one of {valid_log_levels}")
 
-    def _setup_logging(self) -> None:
-        """Configure logging based on the settings."""
+    def setup_logging(self) -> None:
+        """Configure logging based on the settings.
+        
+        Called by the entry point, so importing the bot never touches the
+        root logger or creates the log file.
+        """
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         logging.basicConfig(
             level=getattr(logging, self.log_level),
@@ -57,12 +58,25 @@ class BotConfig:
                 logging.StreamHandler()
             ]
         )
-        self.logger = logging.getLogger(__name__)
         self.logger.info("Logging configured successfully")
 
-# Create a global config instance
-try:
-    config = BotConfig()
-except ConfigError as e:
-    logging.error(f"Configuration error: {e}")
-    raise 
\ No newline at end of file
+_config: Optional[BotConfig] = None
+
+def get_config() -> BotConfig:
+    """Load .env and build the bot configuration on first use."""
+    global _config
+    if _config is None:
+        load_dotenv()
+        try:
+            _config = BotConfig()
+        except ConfigError as e:
+            logging.error(f"Configuration error: {e}")
+            raise
+    return _config
+
+def __getattr__(name: str):
+    # ``from discord_bot.config import config`` still works, but only
+    # loads the configuration when it is actually imported by name
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
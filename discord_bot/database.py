@@ -1,147 +1,319 @@
-import sqlite3
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Set
+import functools
 import json
-import os
+from truth_social.sqlite_worker import AsyncSQLiteWorker, SQLiteDatabase
+
+def _add_column(cursor, table: str, column: str, definition: str):
+    """Add a column unless a pre-versioned database already has it."""
+    cursor.execute(f"PRAGMA table_info({table})")
+    if column not in [col[1] for col in cursor.fetchall()]:
+        cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+def _create_monitoring_configs(cursor):
+    """v1: the original single-watch table."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS monitoring_configs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            filter_keyword TEXT NOT NULL,
+            last_checked_timestamp TEXT,
+            last_post_id TEXT,
+            created_at TEXT NOT NULL,
+            is_active INTEGER DEFAULT 1
+        )
+    """)
+
+def _add_post_cursor(cursor):
+    """v2: cursor for incremental fetching."""
+    _add_column(cursor, "monitoring_configs", "post_cursor", "TEXT")
+
+def _add_watch_scope(cursor):
+    """v3: many watches per guild/channel, with indexes for the hot lookups."""
+    _add_column(cursor, "monitoring_configs", "guild_id", "INTEGER")
+    _add_column(cursor, "monitoring_configs", "channel_id", "INTEGER")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_monitoring_configs_active_username
+        ON monitoring_configs (is_active, username)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_monitoring_configs_guild_channel
+        ON monitoring_configs (guild_id, channel_id)
+    """)
+
+def _create_seen_posts(cursor):
+    """v4: bounded per-watch record of delivered post IDs."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS seen_posts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            config_id INTEGER NOT NULL,
+            post_id TEXT NOT NULL,
+            UNIQUE (config_id, post_id)
+        )
+    """)
+
+def _retire_unscoped_watches(cursor):
+    """v5: stop watches from before v3, which have no channel to deliver to.
+
+    No channel's commands can see or stop them, so they would otherwise
+    keep being fetched forever with nowhere to send the results.
+    """
+    cursor.execute("""
+        UPDATE monitoring_configs
+        SET is_active = 0
+        WHERE is_active = 1 AND channel_id IS NULL
+    """)
+
+def _lowercase_usernames(cursor):
+    """v6: store usernames lowercased, as Truth Social handles ignore case."""
+    cursor.execute("UPDATE monitoring_configs SET username = lower(username)")
+
+# Applied in order; a database at user_version N has run the first N entries.
+# Each step is idempotent so databases created before versioning upgrade cleanly.
+MIGRATIONS = [
+    _create_monitoring_configs,
+    _add_post_cursor,
+    _add_watch_scope,
+    _create_seen_posts,
+    _retire_unscoped_watches,
+    _lowercase_usernames,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# Post IDs remembered per watch; older ones are covered by the post cursor
+SEEN_POSTS_LIMIT = 500
+
+class Database(SQLiteDatabase):
+    """Database manager for storing monitoring configurations.
+
+    A single connection is opened on first use and kept for the lifetime of
+    the instance. Call ``close()`` (or use the instance as a context manager)
+    to release it.
+    """
+
+    migrations = MIGRATIONS
 
-class Database:
-    """Database manager for storing monitoring configurations."""
-    
     def __init__(self, db_path: str = "data/monitoring.db"):
-        self.db_path = db_path
-        self.connection = None
-        # Only create directories if not using in-memory database
-        if db_path != ":memory:":
-            os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        self._init_db()
-    
-    def _get_connection(self):
-        """Get a database connection."""
-        if self.db_path == ":memory:":
-            if self.connection is None:
-                self.connection = sqlite3.connect(self.db_path)
-            return self.connection
-        return sqlite3.connect(self.db_path)
-    
-    def _init_db(self):
-        """Initialize the database with required tables."""
+        super().__init__(db_path)
+
+    @staticmethod
+    def _row_to_config(row) -> Dict[str, Any]:
+        """Convert a monitoring_configs row into a dict."""
+        config = dict(row)
+        config['is_active'] = bool(config['is_active'])
+        return config
+
+    @staticmethod
+    def _scope(username: Optional[str] = None, guild_id: Optional[int] = None,
+               channel_id: Optional[int] = None, config_id: Optional[int] = None):
+        """Build a WHERE clause selecting active watches matching the filters."""
+        clauses = ["is_active = 1"]
+        params = []
+        # Stored lowercased, so any spelling of a handle finds its watches
+        username = username.lower() if username is not None else None
+        for column, value in (("id", config_id), ("username", username),
+                              ("guild_id", guild_id), ("channel_id", channel_id)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def add_monitoring_config(self, username: str, filter_keyword: str,
+                              guild_id: Optional[int] = None,
+                              channel_id: Optional[int] = None) -> int:
+        """Add a new watch. Existing watches stay active.
+
+        The username is stored lowercased, since handles ignore case.
+        """
         conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            # Create monitoring_configs table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS monitoring_configs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT NOT NULL,
-                    filter_keyword TEXT NOT NULL,
-                    last_checked_timestamp TEXT,
-                    last_post_id TEXT,
-                    created_at TEXT NOT NULL,
-                    is_active INTEGER DEFAULT 1
-                )
-            """)
-            
-            conn.commit()
-        finally:
-            if self.db_path != ":memory:" and conn:
-                conn.close()
-    
-    def add_monitoring_config(self, username: str, filter_keyword: str) -> int:
-        """Add a new monitoring configuration."""
+        cursor = conn.execute("""
+            INSERT INTO monitoring_configs
+            (username, filter_keyword, created_at, is_active, guild_id, channel_id)
+            VALUES (?, ?, ?, 1, ?, ?)
+        """, (username.lower(), filter_keyword, datetime.now().isoformat(), guild_id, channel_id))
+        conn.commit()
+        return cursor.lastrowid
+
+    def get_monitoring_config(self, config_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get an active watch by ID, or the most recently added one."""
+        where, params = self._scope(config_id=config_id)
+        row = self._get_connection().execute(f"""
+            SELECT * FROM monitoring_configs
+            WHERE {where}
+            ORDER BY id DESC
+            LIMIT 1
+        """, params).fetchone()
+        return self._row_to_config(row) if row else None
+
+    def get_active_configs(self, username: Optional[str] = None,
+                           guild_id: Optional[int] = None,
+                           channel_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get every active watch, optionally limited to a user or channel."""
+        where, params = self._scope(username, guild_id, channel_id)
+        rows = self._get_connection().execute(f"""
+            SELECT * FROM monitoring_configs
+            WHERE {where}
+            ORDER BY id
+        """, params).fetchall()
+        return [self._row_to_config(row) for row in rows]
+
+    def update_last_checked(self, post_id: str, timestamp: str,
+                            config_id: Optional[int] = None):
+        """Update the last checked timestamp and post ID.
+
+        Applies to one watch when ``config_id`` is given, otherwise to all
+        active watches.
+        """
+        where, params = self._scope(config_id=config_id)
         conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            # First deactivate all existing configurations
-            cursor.execute("""
-                UPDATE monitoring_configs 
-                SET is_active = 0 
-                WHERE is_active = 1
-            """)
-            
-            # Then add the new configuration
-            cursor.execute("""
-                INSERT INTO monitoring_configs 
-                (username, filter_keyword, created_at, is_active)
-                VALUES (?, ?, ?, 1)
-            """, (username, filter_keyword, datetime.now().isoformat()))
-            
-            conn.commit()
-            return cursor.lastrowid
-        finally:
-            if self.db_path != ":memory:" and conn:
-                conn.close()
-    
-    def get_monitoring_config(self) -> Optional[Dict[str, Any]]:
-        """Get the current monitoring configuration."""
+        conn.execute(f"""
+            UPDATE monitoring_configs
+            SET last_checked_timestamp = ?, last_post_id = ?
+            WHERE {where}
+        """, [timestamp, post_id, *params])
+        conn.commit()
+
+    def update_post_cursor(self, post_cursor: str, config_id: Optional[int] = None):
+        """Store the newest post ID fetched, for the next incremental fetch."""
+        where, params = self._scope(config_id=config_id)
         conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT * FROM monitoring_configs 
-                WHERE is_active = 1 
-                ORDER BY created_at DESC 
-                LIMIT 1
-            """)
-            
-            row = cursor.fetchone()
-            if row:
-                return {
-                    'id': row[0],
-                    'username': row[1],
-                    'filter_keyword': row[2],
-                    'last_checked_timestamp': row[3],
-                    'last_post_id': row[4],
-                    'created_at': row[5],
-                    'is_active': bool(row[6])
-                }
-            return None
-        finally:
-            if self.db_path != ":memory:" and conn:
-                conn.close()
-    
-    def update_last_checked(self, post_id: str, timestamp: str):
-        """Update the last checked timestamp and post ID."""
+        conn.execute(f"""
+            UPDATE monitoring_configs
+            SET post_cursor = ?
+            WHERE {where}
+        """, [post_cursor, *params])
+        conn.commit()
+
+    def get_seen_posts(self, config_id: int, post_ids: Iterable[str]) -> Set[str]:
+        """Return which of ``post_ids`` have already been delivered for a watch."""
+        post_ids = list(post_ids)
+        if not post_ids:
+            return set()
+        placeholders = ", ".join("?" * len(post_ids))
+        rows = self._get_connection().execute(f"""
+            SELECT post_id FROM seen_posts
+            WHERE config_id = ? AND post_id IN ({placeholders})
+        """, [config_id, *post_ids]).fetchall()
+        return {row['post_id'] for row in rows}
+
+    def mark_posts_seen(self, config_id: int, post_ids: Iterable[str],
+                        limit: int = SEEN_POSTS_LIMIT):
+        """Record delivered post IDs, keeping only the newest ``limit`` per watch.
+
+        Pass IDs oldest first so the newest are the ones kept.
+        """
         conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                UPDATE monitoring_configs 
-                SET last_checked_timestamp = ?, last_post_id = ?
-                WHERE is_active = 1
-            """, (timestamp, post_id))
-            
-            conn.commit()
-        finally:
-            if self.db_path != ":memory:" and conn:
-                conn.close()
-    
-    def deactivate_monitoring(self):
-        """Deactivate the current monitoring configuration."""
+        conn.executemany("""
+            INSERT OR IGNORE INTO seen_posts (config_id, post_id)
+            VALUES (?, ?)
+        """, [(config_id, post_id) for post_id in post_ids])
+        conn.execute("""
+            DELETE FROM seen_posts
+            WHERE config_id = ? AND id NOT IN (
+                SELECT id FROM seen_posts
+                WHERE config_id = ?
+                ORDER BY id DESC
+                LIMIT ?
+            )
+        """, (config_id, config_id, limit))
+        conn.commit()
+
+    def deactivate_monitoring(self, config_id: Optional[int] = None,
+                              guild_id: Optional[int] = None,
+                              channel_id: Optional[int] = None,
+                              username: Optional[str] = None) -> int:
+        """Deactivate matching watches (all of them by default).
+
+        Returns the number of watches deactivated.
+        """
+        where, params = self._scope(username, guild_id, channel_id, config_id)
         conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                UPDATE monitoring_configs 
-                SET is_active = 0 
-                WHERE is_active = 1
-            """)
-            
-            conn.commit()
-        finally:
-            if self.db_path != ":memory:" and conn:
-                conn.close()
-    
-    def is_monitoring_active(self) -> bool:
-        """Check if monitoring is currently active."""
-        config = self.get_monitoring_config()
-        return config is not None and config['is_active']
-    
-    def __del__(self):
-        """Clean up database connection."""
-        if self.connection:
-            self.connection.close() 
\ No newline at end of file
+        # Stopped watches no longer need their delivery history
+        conn.execute(f"""
+            DELETE FROM seen_posts
+            WHERE config_id IN (SELECT id FROM monitoring_configs WHERE {where})
+        """, params)
+        cursor = conn.execute(f"""
+            UPDATE monitoring_configs
+            SET is_active = 0
+            WHERE {where}
+        """, params)
+        conn.commit()
+        return cursor.rowcount
+
+    def is_monitoring_active(self, username: Optional[str] = None,
+                             guild_id: Optional[int] = None,
+                             channel_id: Optional[int] = None) -> bool:
+        """Check if any matching watch is active."""
+        where, params = self._scope(username, guild_id, channel_id)
+        cursor = self._get_connection().execute(f"""
+            SELECT 1 FROM monitoring_configs
+            WHERE {where}
+            LIMIT 1
+        """, params)
+        return cursor.fetchone() is not None
+
+class AsyncDatabase(AsyncSQLiteWorker):
+    """Asyncio facade over Database with the same method surface.
+
+    Every call runs on one dedicated worker thread, so the event loop never
+    waits on disk I/O or SQLite locks, and the underlying connection is only
+    ever touched by that thread. The Database itself is created lazily on
+    the worker by the first call.
+    """
+
+    def __init__(self, db_path: str = "data/monitoring.db"):
+        self.db_path = db_path
+        super().__init__(functools.partial(Database, db_path), thread_name_prefix="database")
+
+    async def add_monitoring_config(self, username: str, filter_keyword: str,
+                                    guild_id: Optional[int] = None,
+                                    channel_id: Optional[int] = None) -> int:
+        """Add a new watch. Existing watches stay active.
+
+        The username is stored lowercased, since handles ignore case.
+        """
+        return await self._run("add_monitoring_config", username, filter_keyword,
+                               guild_id=guild_id, channel_id=channel_id)
+
+    async def get_monitoring_config(self, config_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Get an active watch by ID, or the most recently added one."""
+        return await self._run("get_monitoring_config", config_id)
+
+    async def get_active_configs(self, username: Optional[str] = None,
+                                 guild_id: Optional[int] = None,
+                                 channel_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get every active watch, optionally limited to a user or channel."""
+        return await self._run("get_active_configs", username, guild_id, channel_id)
+
+    async def update_last_checked(self, post_id: str, timestamp: str,
+                                  config_id: Optional[int] = None):
+        """Update the last checked timestamp and post ID."""
+        await self._run("update_last_checked", post_id, timestamp, config_id)
+
+    async def update_post_cursor(self, post_cursor: str, config_id: Optional[int] = None):
+        """Store the newest post ID fetched, for the next incremental fetch."""
+        await self._run("update_post_cursor", post_cursor, config_id)
+
+    async def get_seen_posts(self, config_id: int, post_ids: Iterable[str]) -> Set[str]:
+        """Return which of ``post_ids`` have already been delivered for a watch."""
+        return await self._run("get_seen_posts", config_id, list(post_ids))
+
+    async def mark_posts_seen(self, config_id: int, post_ids: Iterable[str],
+                              limit: int = SEEN_POSTS_LIMIT):
+        """Record delivered post IDs, keeping only the newest ``limit`` per watch."""
+        await self._run("mark_posts_seen", config_id, list(post_ids), limit)
+
+    async def deactivate_monitoring(self, config_id: Optional[int] = None,
+                                    guild_id: Optional[int] = None,
+                                    channel_id: Optional[int] = None,
+                                    username: Optional[str] = None) -> int:
+        """Deactivate matching watches (all of them by default)."""
+        return await self._run("deactivate_monitoring", config_id, guild_id, channel_id, username)
+
+    async def is_monitoring_active(self, username: Optional[str] = None,
+                                   guild_id: Optional[int] = None,
+                                   channel_id: Optional[int] = None) -> bool:
+        """Check if any matching watch is active."""
+        return await self._run("is_monitoring_active", username, guild_id, channel_id)
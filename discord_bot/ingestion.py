@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from truth_social.governor import current_tenant
+
+logger = logging.getLogger(__name__)
+
+AccountSource = Callable[[], Awaitable[Iterable[str]]]
+
+# Well above the default 300s response cache TTL: each refresh bypasses the
+# cache, so a shorter interval would cost more runs than the cache saves.
+DEFAULT_INTERVAL = 900
+DEFAULT_TRACK_FOR = 24 * 3600
+
+@dataclass
+class IngestionStats:
+    """Counters for the background ingestion service."""
+    runs: int = 0
+    batches: int = 0
+    posts_ingested: int = 0
+    failures: int = 0
+    accounts: int = 0
+    last_run_seconds: float = 0.0
+
+class IngestionService:
+    """Keeps the local post store filled for tracked accounts in the background.
+
+    Every ``interval`` seconds it pulls the latest posts of every tracked
+    account, ``batch_size`` accounts per actor run, and the client writes
+    them to its index in one transaction per run. Accounts are tracked
+    for ``track_for`` seconds after a command last asked about them, and
+    always for accounts from registered sources, so commands can answer
+    from the store instead of waiting on Apify. Accounts returned by an
+    exclusion are skipped, for components such as the monitor that already
+    fetch them, and store them, on their own schedule.
+    """
+
+    def __init__(self, client, interval: float = DEFAULT_INTERVAL, batch_size: int = 10,
+                 limit: int = 20, track_for: float = DEFAULT_TRACK_FOR,
+                 clock: Callable[[], float] = time.monotonic):
+        self.client = client
+        self.interval = interval
+        self.batch_size = batch_size
+        self.limit = limit
+        self.track_for = track_for
+        self._clock = clock
+        self._requested: Dict[str, float] = {}
+        self._sources: List[AccountSource] = []
+        self._exclusions: List[AccountSource] = []
+        self._task: Optional[asyncio.Task] = None
+        self._stats = IngestionStats()
+
+    @classmethod
+    def from_env(cls, client) -> 'IngestionService':
+        """Create the service with INGESTION_INTERVAL and INGESTION_TRACK_FOR (seconds) from the environment."""
+        return cls(
+            client,
+            interval=float(os.getenv("INGESTION_INTERVAL", str(DEFAULT_INTERVAL))),
+            track_for=float(os.getenv("INGESTION_TRACK_FOR", str(DEFAULT_TRACK_FOR)))
+        )
+
+    def track(self, username: str) -> None:
+        """Keep ingesting an account for a while after it was asked about."""
+        self._requested[username.lower()] = self._clock()
+
+    def add_source(self, source: AccountSource) -> None:
+        """Register a callable returning accounts that should always be ingested."""
+        self._sources.append(source)
+
+    def remove_source(self, source: AccountSource) -> None:
+        """Unregister a source added with ``add_source``."""
+        if source in self._sources:
+            self._sources.remove(source)
+
+    def add_exclusion(self, source: AccountSource) -> None:
+        """Register a callable returning accounts that are fetched elsewhere and must be skipped."""
+        self._exclusions.append(source)
+
+    def remove_exclusion(self, source: AccountSource) -> None:
+        """Unregister a source added with ``add_exclusion``."""
+        if source in self._exclusions:
+            self._exclusions.remove(source)
+
+    @staticmethod
+    async def _load(sources: List[AccountSource]) -> Set[str]:
+        """Lowercased usernames from every source, skipping any that fail."""
+        accounts: Set[str] = set()
+        for source in sources:
+            try:
+                accounts.update(username.lower() for username in await source())
+            except Exception as e:
+                logger.error(f"Error loading accounts to ingest: {e}")
+        return accounts
+
+    async def accounts(self) -> List[str]:
+        """Every account currently tracked, in a stable order."""
+        cutoff = self._clock() - self.track_for
+        self._requested = {
+            username: requested_at for username, requested_at in self._requested.items()
+            if requested_at >= cutoff
+        }
+        accounts = set(self._requested) | await self._load(self._sources)
+        return sorted(accounts - await self._load(self._exclusions))
+
+    async def run_once(self) -> int:
+        """Ingest every tracked account once. Returns the number of posts stored."""
+        start = self._clock()
+        accounts = await self.accounts()
+        ingested = 0
+        for i in range(0, len(accounts), self.batch_size):
+            batch = accounts[i:i + self.batch_size]
+            try:
+                post_lists = await self.client.refresh_accounts(batch, self.limit)
+            except Exception as e:
+                logger.error(f"Error ingesting posts for {', '.join(batch)}: {e}")
+                self._stats.failures += 1
+                continue
+            self._stats.batches += 1
+            ingested += sum(len(post_list.posts) for post_list in post_lists.values())
+
+        self._stats.runs += 1
+        self._stats.accounts = len(accounts)
+        self._stats.posts_ingested += ingested
+        self._stats.last_run_seconds = self._clock() - start
+        return ingested
+
+    async def run_forever(self, delay: float = 0) -> None:
+        """Ingest on a fixed interval, forever, starting after ``delay`` seconds."""
+        # Background refreshes take their turn behind commands from each server
+        current_tenant.set("ingestion")
+        await asyncio.sleep(delay)
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Error in ingestion service: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self, delay: float = 0) -> None:
+        """Start the background task if it isn't running, first ingesting after ``delay`` seconds."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever(delay))
+
+    async def close(self) -> None:
+        """Stop the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> IngestionStats:
+        """Return a snapshot of the ingestion counters."""
+        return IngestionStats(**vars(self._stats))
@@ -0,0 +1,53 @@
+import logging
+import discord
+from typing import Optional
+from .outbound import OutboundQueue, get_outbound_queue
+
+logger = logging.getLogger(__name__)
+
+class Notifier:
+    """Delivers monitoring notifications to the channels that subscribed.
+
+    Each watch records the channel it was created in; notifications go only
+    there. Delivery goes through the bot's outbound queue, which batches
+    embeds per channel, keeps each channel under its rate-limit bucket and
+    bounds how many sends run at once.
+    """
+
+    def __init__(self, bot, outbound: Optional[OutboundQueue] = None):
+        self.bot = bot
+        self.outbound = outbound or get_outbound_queue(bot)
+        self.sent = 0
+        self.failed = 0
+
+    async def _resolve(self, channel_id: int) -> Optional[discord.abc.Messageable]:
+        """Look up a channel, falling back to the API if it isn't cached."""
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except discord.HTTPException as e:
+                logger.warning(f"Could not fetch channel {channel_id}: {e}")
+                return None
+        return channel
+
+    async def send(self, channel_id: Optional[int], *embeds: discord.Embed) -> bool:
+        """Send embeds to one channel. Returns whether they were delivered."""
+        if channel_id is None:
+            # Watches created before channels were recorded have nowhere to go
+            self.failed += len(embeds)
+            return False
+
+        channel = await self._resolve(channel_id)
+        if channel is None:
+            self.failed += len(embeds)
+            return False
+        try:
+            await self.outbound.send(channel, list(embeds))
+        except discord.HTTPException as e:
+            logger.warning(f"Could not send notification to channel {channel_id}: {e}")
+            self.failed += len(embeds)
+            return False
+
+        self.sent += len(embeds)
+        return True
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Discord accepts at most 10 embeds in a single message
+MAX_EMBEDS_PER_MESSAGE = 10
+# ...holding at most this many characters of text between them
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+@dataclass
+class OutboundStats:
+    """Snapshot of outbound queue metrics."""
+    depth: int = 0
+    messages_sent: int = 0
+    embeds_sent: int = 0
+    failures: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        """Average seconds from enqueue to delivery per embed."""
+        return self.total_latency / self.embeds_sent if self.embeds_sent else 0.0
+
+class _Bucket:
+    """Pending embeds and send history for one channel."""
+
+    def __init__(self, destination: Any, rate: int):
+        self.destination = destination
+        self.pending: Deque[Tuple[discord.Embed, asyncio.Future, float]] = deque()
+        self.sent_at: Deque[float] = deque(maxlen=rate)
+        self.worker: Optional[asyncio.Task] = None
+
+class OutboundQueue:
+    """Central queue for outgoing embeds, batched and paced per channel.
+
+    Embeds queued for the same channel are coalesced into messages of up to
+    10 embeds and 6000 characters of embed text. Each channel is drained by its own worker, which never sends
+    more than ``rate`` messages per ``per`` seconds (Discord's per-channel
+    bucket is 5 per 5s), and at most ``max_concurrency`` sends are in flight
+    across all channels.
+    """
+
+    def __init__(self, max_concurrency: int = 5, rate: int = 5, per: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.per = per
+        self._clock = clock
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        self._stats = OutboundStats()
+
+    @staticmethod
+    def _bucket_key(destination: Any) -> Hashable:
+        """Key destinations by channel, so a Context and its channel share a bucket."""
+        channel = getattr(destination, "channel", destination)
+        key = getattr(channel, "id", None)
+        return key if key is not None else id(destination)
+
+    async def send(self, destination: Any, embeds: List[discord.Embed]) -> None:
+        """Queue embeds for a channel and wait until they have been delivered.
+
+        Raises the send error if delivery of any of them failed.
+        """
+        if not embeds:
+            return
+
+        key = self._bucket_key(destination)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= 256:
+                self._prune()
+            bucket = self._buckets[key] = _Bucket(destination, self.rate)
+
+        loop = asyncio.get_running_loop()
+        now = self._clock()
+        futures = []
+        for embed in embeds:
+            future = loop.create_future()
+            bucket.pending.append((embed, future, now))
+            futures.append(future)
+        self._stats.depth += len(embeds)
+
+        if bucket.worker is None or bucket.worker.done():
+            bucket.worker = asyncio.create_task(self._drain(bucket))
+
+        await asyncio.gather(*futures)
+
+    async def _wait_for_bucket(self, bucket: _Bucket) -> None:
+        """Sleep until the channel may send another message."""
+        if len(bucket.sent_at) == self.rate:
+            wait = bucket.sent_at[0] + self.per - self._clock()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def _drain(self, bucket: _Bucket) -> None:
+        """Send everything queued for one channel, in order."""
+        while bucket.pending:
+            await self._wait_for_bucket(bucket)
+
+            batch = []
+            chars = 0
+            while bucket.pending and len(batch) < MAX_EMBEDS_PER_MESSAGE:
+                size = len(bucket.pending[0][0])
+                if batch and chars + size > MAX_EMBED_CHARS_PER_MESSAGE:
+                    break
+                batch.append(bucket.pending.popleft())
+                chars += size
+            self._stats.depth -= len(batch)
+            embeds = [embed for embed, _, _ in batch]
+
+            async with self._semaphore:
+                try:
+                    if len(embeds) == 1:
+                        await bucket.destination.send(embed=embeds[0])
+                    else:
+                        await bucket.destination.send(embeds=embeds)
+                except asyncio.CancelledError:
+                    for _, future, _ in batch:
+                        future.cancel()
+                    raise
+                except Exception as e:
+                    self._stats.failures += 1
+                    for _, future, _ in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                finally:
+                    bucket.sent_at.append(self._clock())
+
+            now = self._clock()
+            self._stats.messages_sent += 1
+            self._stats.embeds_sent += len(batch)
+            for _, future, queued_at in batch:
+                latency = now - queued_at
+                self._stats.total_latency += latency
+                self._stats.max_latency = max(self._stats.max_latency, latency)
+                if not future.done():
+                    future.set_result(None)
+
+    def _prune(self) -> None:
+        """Forget idle channels whose rate-limit window has passed."""
+        cutoff = self._clock() - self.per
+        idle = [
+            key for key, bucket in self._buckets.items()
+            if not bucket.pending
+            and (bucket.worker is None or bucket.worker.done())
+            and (not bucket.sent_at or bucket.sent_at[-1] < cutoff)
+        ]
+        for key in idle:
+            del self._buckets[key]
+
+    def stats(self) -> OutboundStats:
+        """Return a snapshot of queue depth, throughput and latency."""
+        return OutboundStats(**vars(self._stats))
+
+    async def close(self) -> None:
+        """Cancel every channel worker and anything still waiting to be sent."""
+        for bucket in self._buckets.values():
+            if bucket.worker is not None:
+                bucket.worker.cancel()
+            for _, future, _ in bucket.pending:
+                future.cancel()
+        self._buckets.clear()
+        self._stats.depth = 0
+
+def get_outbound_queue(bot) -> OutboundQueue:
+    """Return the bot's shared outbound queue, creating it on first use."""
+    queue = getattr(bot, "outbound", None)
+    if not isinstance(queue, OutboundQueue):
+        queue = OutboundQueue()
+        bot.outbound = queue
+    return queue
@@ -0,0 +1,173 @@
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+@dataclass(frozen=True)
+class Limit:
+    """At most ``rate`` uses per ``per`` seconds, in bursts of up to ``rate``."""
+    rate: int
+    per: float
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Limits applied to each user and each guild for one command."""
+    user: Tuple[Limit, ...] = ()
+    guild: Tuple[Limit, ...] = ()
+
+@dataclass(frozen=True)
+class RateLimited:
+    """Why a use was refused, and how long until it would be allowed."""
+    scope: str
+    retry_after: float
+
+@dataclass
+class RateLimiterStats:
+    """Counters for the rate limiter."""
+    allowed: int = 0
+    limited: Dict[str, int] = field(default_factory=dict)
+    tracked: int = 0
+    evicted: int = 0
+
+class _TokenBucket:
+    """Token bucket for one limit: ``rate`` tokens, refilled continuously over ``per`` seconds."""
+
+    __slots__ = ("limit", "tokens", "updated")
+
+    def __init__(self, limit: Limit, now: float):
+        self.limit = limit
+        self.tokens = float(limit.rate)
+        self.updated = now
+
+    def _refill(self, now: float):
+        refill = (now - self.updated) * self.limit.rate / self.limit.per
+        self.tokens = min(float(self.limit.rate), self.tokens + refill)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) * self.limit.per / self.limit.rate
+
+    def is_full(self, now: float) -> bool:
+        """Whether the bucket has refilled completely, i.e. is as good as new."""
+        self._refill(now)
+        return self.tokens >= self.limit.rate
+
+# Rate limits per command; commands not listed use DEFAULT_LIMITS
+COMMAND_LIMITS: Dict[str, RateLimits] = {
+    "filter-posts": RateLimits(
+        user=(Limit(1, 30), Limit(20, 3600)),
+        guild=(Limit(20, 60),)
+    ),
+    "monitor-posts": RateLimits(user=(Limit(5, 60),), guild=(Limit(20, 60),)),
+}
+DEFAULT_LIMITS = RateLimits(user=(Limit(3, 30),), guild=(Limit(30, 60),))
+# Shared by every command, to protect the Apify budget
+GLOBAL_LIMITS: Tuple[Limit, ...] = (Limit(60, 60),)
+
+class RateLimiter:
+    """Token-bucket rate limits per user, per guild and bot-wide.
+
+    Each (command, scope, id) key has one token bucket per limit, so
+    checking a use is O(1) however often someone has used a command.
+    A use is only counted when every bucket it touches has a token, so
+    refused attempts cost nothing. Buckets that have refilled completely
+    are no different from new ones and are swept out every
+    ``sweep_interval`` seconds, so idle users do not accumulate.
+    """
+
+    def __init__(self, commands: Optional[Dict[str, RateLimits]] = None,
+                 default: RateLimits = DEFAULT_LIMITS,
+                 global_limits: Tuple[Limit, ...] = GLOBAL_LIMITS,
+                 sweep_interval: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.commands = COMMAND_LIMITS if commands is None else commands
+        self.default = default
+        self.global_limits = global_limits
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._buckets: Dict[Hashable, List[_TokenBucket]] = {}
+        self._last_sweep = clock()
+        self._stats = RateLimiterStats()
+
+    def _get_buckets(self, key: Hashable, limits: Tuple[Limit, ...], now: float) -> List[_TokenBucket]:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            buckets = self._buckets[key] = [_TokenBucket(limit, now) for limit in limits]
+        return buckets
+
+    def acquire(self, command: str, user_id: Hashable,
+                guild_id: Optional[Hashable] = None) -> Optional[RateLimited]:
+        """Count a use of a command, or return why it has to wait.
+
+        Returns None when the use is allowed. Otherwise nothing is counted
+        and the result names the tightest scope and its wait in seconds.
+        """
+        now = self._clock()
+        if now - self._last_sweep >= self.sweep_interval:
+            self.sweep()
+
+        limits = self.commands.get(command, self.default)
+        scopes = [("user", (command, "user", user_id), limits.user)]
+        if guild_id is not None:
+            scopes.append(("guild", (command, "guild", guild_id), limits.guild))
+        scopes.append(("global", ("global",), self.global_limits))
+
+        touched = []
+        worst: Optional[RateLimited] = None
+        for scope, key, scope_limits in scopes:
+            if not scope_limits:
+                continue
+            for bucket in self._get_buckets(key, scope_limits, now):
+                wait = bucket.wait_time(now)
+                if wait > 0 and (worst is None or wait > worst.retry_after):
+                    worst = RateLimited(scope, wait)
+                touched.append(bucket)
+
+        if worst is not None:
+            self._stats.limited[worst.scope] = self._stats.limited.get(worst.scope, 0) + 1
+            return worst
+        for bucket in touched:
+            bucket.tokens -= 1
+        self._stats.allowed += 1
+        return None
+
+    def sweep(self) -> int:
+        """Forget buckets that have fully refilled. Returns how many keys were dropped."""
+        now = self._clock()
+        idle = [key for key, buckets in self._buckets.items()
+                if all(bucket.is_full(now) for bucket in buckets)]
+        for key in idle:
+            del self._buckets[key]
+        self._last_sweep = now
+        self._stats.evicted += len(idle)
+        return len(idle)
+
+    def stats(self) -> RateLimiterStats:
+        """Return a snapshot of the rate limiter counters."""
+        return RateLimiterStats(
+            allowed=self._stats.allowed,
+            limited=dict(self._stats.limited),
+            tracked=len(self._buckets),
+            evicted=self._stats.evicted
+        )
+
+def get_rate_limiter(bot) -> RateLimiter:
+    """Return the bot's shared rate limiter, creating it on first use."""
+    limiter = getattr(bot, "rate_limiter", None)
+    if not isinstance(limiter, RateLimiter):
+        limiter = RateLimiter()
+        bot.rate_limiter = limiter
+    return limiter
+
+def describe(limited: RateLimited) -> str:
+    """User-facing message for a refused command."""
+    seconds = max(1, math.ceil(limited.retry_after))
+    if limited.scope == "guild":
+        return f"This server is using this command too often. Please wait {seconds} seconds and try again."
+    if limited.scope == "global":
+        return f"The bot is handling too many requests right now. Please wait {seconds} seconds and try again."
+    return f"Please wait {seconds} seconds before using this command again."
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+Watch = Dict[str, Any]
+
+class WatchScheduler:
+    """Runs monitoring watches concurrently on a jittered schedule.
+
+    Watches that share a username form one group and are checked with a
+    single fetch. Up to ``max_concurrency`` groups run at once. A new group
+    is first due at a random point within one interval, so the watches
+    loaded after a restart are spread out rather than all fetched on the
+    first tick. After each run a group is rescheduled ``interval`` seconds
+    later, randomly stretched or shrunk by up to ``jitter`` (a fraction of
+    the interval) so groups keep drifting apart.
+
+    With ``fetch``, the usernames of every group due on a tick are passed
+    to it in one call, so they can share a single actor run, and each
+    group's entry in the returned mapping (keyed by lowercased username)
+    is handed to ``check_group`` as a third argument.
+    """
+
+    def __init__(self, load_watches: Callable[[], Awaitable[List[Watch]]],
+                 check_group: Callable[..., Awaitable[None]],
+                 interval: float = 300, jitter: float = 0.1, max_concurrency: int = 10,
+                 clock: Callable[[], float] = time.monotonic,
+                 fetch: Optional[Callable[[List[str]], Awaitable[Dict[str, Any]]]] = None):
+        self._load_watches = load_watches
+        self._check_group = check_group
+        self._fetch = fetch
+        self.interval = interval
+        self.jitter = jitter
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._clock = clock
+        self._next_run: Dict[str, float] = {}
+        self._groups: Dict[str, List[Watch]] = {}
+
+    @staticmethod
+    def _group_key(watch: Watch) -> str:
+        return watch['username'].lower()
+
+    def _reschedule(self, key: str) -> None:
+        """Schedule a group's next run one jittered interval from now."""
+        spread = random.uniform(1 - self.jitter, 1 + self.jitter)
+        self._next_run[key] = self._clock() + self.interval * spread
+
+    async def _run_group(self, key: str, watches: List[Watch],
+                         fetched: Optional[Dict[str, Any]] = None) -> None:
+        """Check one group under the concurrency limit."""
+        args = (watches[0]['username'], watches)
+        if fetched is not None:
+            args += (fetched.get(key),)
+        async with self._semaphore:
+            try:
+                await self._check_group(*args)
+            except Exception as e:
+                logger.error(f"Error checking watches for {key}: {e}")
+            finally:
+                self._reschedule(key)
+
+    async def run_due(self) -> int:
+        """Reload watches and run every group that is due.
+
+        Returns the number of groups run.
+        """
+        groups: Dict[str, List[Watch]] = {}
+        for watch in await self._load_watches():
+            groups.setdefault(self._group_key(watch), []).append(watch)
+        self._groups = groups
+
+        # Forget groups whose watches were all removed; stagger new ones
+        now = self._clock()
+        self._next_run = {
+            key: self._next_run[key] if key in self._next_run
+            else now + random.random() * self.interval
+            for key in groups
+        }
+
+        due = [key for key, next_run in self._next_run.items() if next_run <= now]
+        fetched = None
+        if self._fetch is not None and due:
+            try:
+                fetched = await self._fetch([groups[key][0]['username'] for key in due])
+            except Exception as e:
+                logger.error(f"Error fetching posts for {len(due)} watched accounts: {e}")
+                for key in due:
+                    self._reschedule(key)
+                return 0
+        await asyncio.gather(*(self._run_group(key, groups[key], fetched) for key in due))
+        return len(due)
+
+    def seconds_until_next(self) -> float:
+        """Seconds until the earliest group is due, or a full interval if idle."""
+        if not self._next_run:
+            return self.interval
+        return max(0.0, min(self._next_run.values()) - self._clock())
+
+    def next_run_times(self) -> Dict[int, datetime]:
+        """Next scheduled check for every known watch, keyed by watch ID."""
+        now = self._clock()
+        wall_now = datetime.now(timezone.utc)
+        times = {}
+        for key, watches in self._groups.items():
+            next_run = self._next_run.get(key)
+            if next_run is None:
+                continue
+            when = wall_now + timedelta(seconds=max(0.0, next_run - now))
+            for watch in watches:
+                times[watch['id']] = when
+        return times
+
+    def next_run_at(self, watch_id: int) -> Optional[datetime]:
+        """Next scheduled check for a single watch, if it is known."""
+        return self.next_run_times().get(watch_id)
+
+    async def run_forever(self) -> None:
+        """Run due groups, then sleep until the next one is due, forever."""
+        while True:
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error(f"Error in monitoring scheduler: {e}")
+            await asyncio.sleep(self.seconds_until_next())
@@ -5,6 +5,7 @@ from discord import Message, User, TextChannel, Guild, Member, Embed
 from unittest.mock import AsyncMock, MagicMock, patch
 import os
 from types import SimpleNamespace
+from tests.helpers import FakeClock
 
 class AsyncContextManager:
     """A context manager that can be used in async with statements."""
@@ -20,10 +21,16 @@ class AsyncContextManager:
         self.exited = True
         return None
 
+@pytest.fixture
+def clock():
+    """Create a fake clock for components that take one."""
+    return FakeClock()
+
 @pytest.fixture(autouse=True)
 def mock_env():
     """Mock environment variables."""
     with patch.dict(os.environ, {
+        'DISCORD_TOKEN': 'test_discord_token',
         'APIFY_API_TOKEN': 'test_token',
         'APIFY_ACTOR_ID': 'test_actor'
     }):
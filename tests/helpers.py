@@ -0,0 +1,26 @@
+"""Helpers shared by several test modules."""
+
+from datetime import datetime, timezone
+from truth_social.models import UserProfile
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def make_author(username="testuser"):
+    """Create a profile with fixed test values."""
+    return UserProfile(
+        username=username,
+        display_name="Test User",
+        bio="Test bio",
+        followers_count=100,
+        following_count=50,
+        posts_count=10,
+        created_at=datetime(2022, 1, 1, tzinfo=timezone.utc),
+        is_verified=True
+    )
@@ -1,10 +1,18 @@
 """Tests for the Discord bot."""
 
+import asyncio
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 import discord
 from discord.ext import commands
-from discord_bot.bot import TruthBot, BOT_PREFIX, DISCORD_TOKEN
+from discord_bot.bot import TruthBot
+from discord_bot import config as bot_config
+from discord_bot.config import get_config
+from discord_bot.commands.truth import create_client
+from discord_bot.commands.truth_posts import TruthPostsCommand
+from discord_bot.commands.filter_posts import FilterPostsCommand
+from discord_bot.ingestion import IngestionService
+from truth_social.client import TruthSocialClient
 
 @pytest.fixture
 def mock_discord_bot():
@@ -25,7 +33,7 @@ def mock_discord_bot():
         # Ensure the mock_init was called with correct arguments
         assert mock_init.called
         args, kwargs = mock_init.call_args
-        assert kwargs['command_prefix'] == BOT_PREFIX
+        assert kwargs['command_prefix'] == get_config().bot_prefix
         assert isinstance(kwargs['intents'], discord.Intents)
         assert kwargs['help_command'] is None
         return bot
@@ -53,6 +61,7 @@ async def test_setup_hook():
         assert bot.load_extension.call_count == len(expected_extensions)
         for ext in expected_extensions:
             bot.load_extension.assert_any_call(ext)
+        await bot.ingestion.close()
 
 @pytest.mark.asyncio
 async def test_on_ready(mock_discord_bot):
@@ -172,7 +181,9 @@ async def test_on_message_from_user(mock_discord_bot):
 
 def test_main():
     """Test the main function."""
-    with patch('discord_bot.bot.TruthBot') as mock_bot_class:
+    # Logging setup would configure the root logger and write bot.log
+    with patch('discord_bot.bot.TruthBot') as mock_bot_class, \
+         patch('discord_bot.config.BotConfig.setup_logging') as mock_setup_logging:
         from discord_bot.bot import main
         
         # Create a mock bot instance
@@ -185,4 +196,102 @@ def test_main():
         # Verify bot was created and run
         assert mock_bot_class.called
         assert mock_bot.run.called
-        mock_bot.run.assert_called_once_with(DISCORD_TOKEN) 
\ No newline at end of file
+        mock_bot.run.assert_called_once_with(get_config().discord_token)
+        mock_setup_logging.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_setup_hook_creates_shared_client():
+    """Test setup_hook attaches one Truth Social client used by every cog."""
+    with patch('discord.ext.commands.Bot.__init__'):
+        bot = TruthBot()
+        bot.load_extension = AsyncMock()
+        
+        await bot.setup_hook()
+        
+        assert isinstance(bot.truth_client, TruthSocialClient)
+        posts_cog = TruthPostsCommand(bot)
+        filter_cog = FilterPostsCommand(bot)
+        assert posts_cog.client is bot.truth_client
+        assert filter_cog.client is bot.truth_client
+        await bot.ingestion.close()
+
+def test_create_client_uses_apify_settings_from_env():
+    """Test the shared client takes every Apify setting from ApifyConfig.from_env, even without a token."""
+    with patch.dict('os.environ', {'APIFY_API_TOKEN': '', 'APIFY_CACHE_DURATION': '60'}):
+        client = create_client()
+
+    assert client.config.actor_id == "test_actor"
+    assert client.config.cache_ttl == 60
+    assert not client.config.api_token
+
+@pytest.mark.asyncio
+async def test_close_closes_shared_client():
+    """Test shutting down the bot closes the shared client."""
+    with patch('discord.ext.commands.Bot.__init__'), \
+         patch('discord.ext.commands.Bot.close', new_callable=AsyncMock) as mock_close:
+        bot = TruthBot()
+        bot.truth_client = MagicMock()
+        bot.truth_client.close = AsyncMock()
+        
+        await bot.close()
+        
+        bot.truth_client.close.assert_called_once()
+        mock_close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_cogs_share_outbound_queue():
+    """Test every cog sends through the bot's outbound queue."""
+    with patch('discord.ext.commands.Bot.__init__'):
+        bot = TruthBot()
+        bot.truth_client = MagicMock()
+
+        posts_cog = TruthPostsCommand(bot)
+        filter_cog = FilterPostsCommand(bot)
+
+        assert posts_cog.outbound is bot.outbound
+        assert filter_cog.outbound is bot.outbound
+
+@pytest.mark.asyncio
+async def test_commands_track_accounts_for_ingestion():
+    """Test accounts asked about are handed to the ingestion service."""
+    with patch('discord.ext.commands.Bot.__init__'):
+        bot = TruthBot()
+        bot.truth_client = MagicMock()
+        bot.ingestion = IngestionService(bot.truth_client)
+
+        posts_cog = TruthPostsCommand(bot)
+        posts_cog.track("realDonaldTrump")
+
+        assert await bot.ingestion.accounts() == ["realdonaldtrump"]
+
+@pytest.mark.asyncio
+async def test_setup_hook_defers_expensive_work():
+    """Test startup builds no Apify client and does not ingest straight away."""
+    with patch('discord.ext.commands.Bot.__init__'):
+        bot = TruthBot()
+        bot.load_extension = AsyncMock()
+
+        await bot.setup_hook()
+        bot.truth_client.refresh_accounts = AsyncMock()
+        bot.ingestion.track("alice")
+        await asyncio.sleep(0.01)
+
+        assert bot.truth_client._client is None
+        bot.truth_client.refresh_accounts.assert_not_called()
+        await bot.ingestion.close()
+
+def test_config_is_loaded_on_first_use():
+    """Test the configuration, and its DISCORD_TOKEN check, wait until asked for."""
+    with patch.object(bot_config, "_config", None), \
+         patch.dict('os.environ', {'DISCORD_TOKEN': ''}), \
+         patch.object(bot_config, "load_dotenv"):
+        with pytest.raises(bot_config.ConfigError):
+            bot_config.get_config()
+
+def test_prefix_can_be_passed_in():
+    """Test the prefix from the loaded configuration is used over the default."""
+    with patch('discord.ext.commands.Bot.__init__') as mock_init:
+        bot = TruthBot(prefix="?")
+
+        assert bot.bot_prefix == "?"
+        assert mock_init.call_args.kwargs['command_prefix'] == "?"
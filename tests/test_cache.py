@@ -0,0 +1,79 @@
+"""Tests for the response cache."""
+
+import pytest
+from truth_social.cache import ResponseCache
+
+def test_get_returns_stored_value(clock):
+    """Test a stored value is returned and counted as a hit."""
+    cache = ResponseCache(ttl=60, clock=clock)
+    cache.set(("user", True, 20), "posts")
+
+    assert cache.get(("user", True, 20)) == "posts"
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 0
+    assert stats.size == 1
+
+def test_missing_key_counts_miss(clock):
+    """Test a lookup for an unknown key is a miss."""
+    cache = ResponseCache(ttl=60, clock=clock)
+
+    assert cache.get("missing") is None
+    assert cache.stats().misses == 1
+
+def test_entries_expire_after_ttl(clock):
+    """Test entries are dropped once their TTL has elapsed."""
+    cache = ResponseCache(ttl=60, clock=clock)
+    cache.set("key", "value")
+
+    clock.now = 59
+    assert cache.get("key") == "value"
+
+    clock.now = 60
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+def test_stale_entries_kept_for_get_stale(clock):
+    """Test expired entries stay available to get_stale until stale_ttl passes."""
+    cache = ResponseCache(ttl=60, stale_ttl=100, clock=clock)
+    cache.set("key", "value")
+
+    clock.now = 60
+    assert cache.get("key") is None
+    assert cache.get_stale("key") == "value"
+
+    clock.now = 160
+    assert cache.get_stale("key") is None
+    assert len(cache) == 0
+
+def test_lru_eviction(clock):
+    """Test the least recently used entry is evicted when full."""
+    cache = ResponseCache(ttl=60, max_entries=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touch "a" so "b" becomes the least recently used entry
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+def test_zero_ttl_disables_cache(clock):
+    """Test a TTL of zero stores nothing."""
+    cache = ResponseCache(ttl=0, clock=clock)
+    cache.set("key", "value")
+
+    assert not cache.enabled
+    assert cache.get("key") is None
+
+def test_hit_rate(clock):
+    """Test the hit rate is computed from the counters."""
+    cache = ResponseCache(ttl=60, clock=clock)
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("other")
+
+    assert cache.stats().hit_rate == 0.5
@@ -0,0 +1,659 @@
+"""Tests for the Truth Social client."""
+
+import asyncio
+import time
+from contextlib import aclosing
+import pytest
+from unittest.mock import MagicMock
+from datetime import datetime, timedelta, timezone
+from truth_social.client import TruthSocialClient, ApifyError
+from truth_social.cache import ResponseCache
+from truth_social.errors import ApifyBusyError
+from truth_social.index import AsyncPostIndex
+from truth_social.store import AsyncResponseStore
+from truth_social.config import ApifyConfig
+from discord_bot.commands.truth_posts import TruthPostsCommand
+from discord_bot.commands.filter_posts import FilterPostsCommand
+
+ACTOR_DELAY = 0.2
+
+def make_item(post_id="1", content="Test post content", username="testuser", hours_ago=0):
+    """Build a raw dataset item shaped like the scraper's output."""
+    return {
+        'id': post_id,
+        'content': content,
+        'created_at': (datetime.now(timezone.utc) - timedelta(hours=hours_ago)).isoformat(),
+        'favourites_count': 10,
+        'replies_count': 5,
+        'reblogs_count': 2,
+        'reblog': None,
+        'account': {
+            'username': username,
+            'display_name': 'Test User',
+            'note': '<p>Test bio</p>',
+            'followers_count': 100,
+            'following_count': 50,
+            'statuses_count': 10,
+            'created_at': '2022-01-01T00:00:00+00:00',
+            'verified': True
+        }
+    }
+
+class FakeDataset:
+    """Async dataset client serving a fixed list of items."""
+
+    def __init__(self, apify):
+        self.apify = apify
+
+    async def iterate_items(self):
+        for item in self.apify.items:
+            self.apify.items_read += 1
+            yield item
+
+class FakeActor:
+    """Async actor client that takes a while to finish, like a real scraper run."""
+
+    def __init__(self, apify):
+        self.apify = apify
+
+    async def call(self, run_input=None):
+        self.apify.calls.append(run_input)
+        await asyncio.sleep(self.apify.delay)
+        if self.apify.error:
+            raise self.apify.error
+        return {"defaultDatasetId": "dataset"}
+
+class FakeApifyClient:
+    """Stand-in for ApifyClientAsync with a slow actor."""
+
+    def __init__(self, items=None, delay=ACTOR_DELAY, error=None):
+        self.items = items if items is not None else [make_item()]
+        self.delay = delay
+        self.error = error
+        self.calls = []
+        self.items_read = 0
+
+    def actor(self, actor_id):
+        return FakeActor(self)
+
+    def dataset(self, dataset_id):
+        return FakeDataset(self)
+
+class MockContext:
+    """Simple mock for Discord context."""
+
+    def __init__(self, user_id=12345):
+        self.send_calls = []
+        self.author = MagicMock()
+        self.author.id = user_id
+        self.author.name = "test_user"
+
+    async def send(self, content=None, embed=None, **kwargs):
+        self.send_calls.append((content, embed, kwargs))
+        return MagicMock()
+
+    def typing(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+@pytest.fixture
+def fake_apify():
+    """Create a fake Apify client with a slow actor."""
+    return FakeApifyClient()
+
+@pytest.fixture
+def client(fake_apify):
+    """Create a TruthSocialClient backed by the fake Apify client."""
+    client = TruthSocialClient(ApifyConfig(api_token="test_token", actor_id="test_actor"))
+    client._client = fake_apify
+    return client
+
+@pytest.mark.asyncio
+async def test_get_user_posts(client, fake_apify):
+    """Test posts are parsed from the dataset items."""
+    posts = await client.get_user_posts("testuser", limit=5)
+
+    assert len(posts.posts) == 1
+    assert posts.posts[0].id == "1"
+    assert posts.posts[0].user.username == "testuser"
+    assert fake_apify.calls[0]["identifiers"] == ["testuser"]
+    assert fake_apify.calls[0]["maxPosts"] == 5
+
+@pytest.mark.asyncio
+async def test_get_user_profile(client, fake_apify):
+    """Test the profile is parsed from the first dataset item."""
+    profile = await client.get_user_profile("testuser")
+
+    assert profile.username == "testuser"
+    assert profile.bio == "Test bio"
+    assert fake_apify.calls[0]["fetchPosts"] is False
+
+@pytest.mark.asyncio
+async def test_actor_failure_raises_apify_error(client, fake_apify):
+    """Test actor failures are wrapped in ApifyError."""
+    fake_apify.error = RuntimeError("boom")
+
+    with pytest.raises(ApifyError, match="boom"):
+        await client.get_user_posts("testuser")
+
+@pytest.mark.asyncio
+async def test_actor_run_does_not_block_event_loop(client):
+    """Test the event loop keeps ticking while an actor run is in progress."""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    try:
+        await client.get_user_posts("testuser")
+    finally:
+        task.cancel()
+
+    assert ticks >= 5
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_overlap(client):
+    """Test two commands share the event loop instead of serializing."""
+    posts_cmd = TruthPostsCommand(MagicMock())
+    posts_cmd.client = client
+    filter_cmd = FilterPostsCommand(MagicMock())
+    filter_cmd.client = client
+
+    posts_ctx = MockContext()
+    filter_ctx = MockContext()
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        posts_cmd.truth_posts.callback(posts_cmd, posts_ctx, "userone"),
+        filter_cmd.filter_posts.callback(filter_cmd, filter_ctx, "usertwo")
+    )
+    elapsed = time.perf_counter() - start
+
+    # Serialized runs would take at least two actor delays
+    assert elapsed < ACTOR_DELAY * 1.75
+    assert any(embed for _, embed, _ in posts_ctx.send_calls)
+    assert any(embed for _, embed, _ in filter_ctx.send_calls)
+
+@pytest.mark.asyncio
+async def test_repeated_posts_request_served_from_cache(client, fake_apify):
+    """Test a second identical request does not start another actor run."""
+    first = await client.get_user_posts("TestUser", limit=5)
+    second = await client.get_user_posts("testuser", limit=5)
+
+    assert second is first
+    assert len(fake_apify.calls) == 1
+    assert client.cache.stats().hits == 1
+
+@pytest.mark.asyncio
+async def test_cache_keyed_on_request_params(client, fake_apify):
+    """Test profile and posts requests are cached separately."""
+    await client.get_user_posts("testuser", limit=5)
+    await client.get_user_posts("testuser", limit=20)
+    await client.get_user_profile("testuser")
+    await client.get_user_profile("testuser")
+
+    assert len(fake_apify.calls) == 3
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_not_cached(client, fake_apify):
+    """Test errors are not stored in the cache."""
+    fake_apify.error = RuntimeError("boom")
+    with pytest.raises(ApifyError):
+        await client.get_user_posts("testuser")
+
+    fake_apify.error = None
+    posts = await client.get_user_posts("testuser")
+
+    assert len(posts.posts) == 1
+    assert len(fake_apify.calls) == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_actor_run(client, fake_apify):
+    """Test concurrent requests for the same user start a single actor run."""
+    results = await asyncio.gather(
+        client.get_user_posts("testuser"),
+        client.get_user_posts("testuser"),
+        client.get_user_posts("TESTUSER")
+    )
+
+    assert len(fake_apify.calls) == 1
+    assert results[0] is results[1] is results[2]
+    stats = client.stats()
+    assert stats["actor_runs"] == 1
+    assert stats["actor_runs_saved"] == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_errors(client, fake_apify):
+    """Test every coalesced caller sees the actor failure."""
+    fake_apify.error = RuntimeError("boom")
+
+    results = await asyncio.gather(
+        client.get_user_posts("testuser"),
+        client.get_user_posts("testuser"),
+        return_exceptions=True
+    )
+
+    assert len(fake_apify.calls) == 1
+    assert all(isinstance(r, ApifyError) for r in results)
+
+@pytest.mark.asyncio
+async def test_get_posts_for_users_uses_one_actor_run(client, fake_apify):
+    """Test several accounts are fetched in one run and split per account."""
+    fake_apify.items = [
+        make_item("1", username="alice"),
+        make_item("2", username="bob"),
+        make_item("3", username="alice")
+    ]
+
+    results = await client.get_posts_for_users(["alice", "Bob", "carol"], limit=5)
+
+    assert len(fake_apify.calls) == 1
+    assert fake_apify.calls[0]["identifiers"] == ["alice", "bob", "carol"]
+    assert [p.id for p in results["alice"].posts] == ["1", "3"]
+    assert [p.id for p in results["bob"].posts] == ["2"]
+    assert results["carol"].posts == []
+
+@pytest.mark.asyncio
+async def test_get_posts_for_users_fills_cache(client, fake_apify):
+    """Test batch results are cached per account and reused."""
+    fake_apify.items = [make_item("1", username="alice"), make_item("2", username="bob")]
+    await client.get_posts_for_users(["alice", "bob"], limit=5)
+
+    posts = await client.get_user_posts("alice", limit=5)
+    await client.get_posts_for_users(["alice", "bob"], limit=5)
+
+    assert [p.id for p in posts.posts] == ["1"]
+    assert len(fake_apify.calls) == 1
+
+@pytest.mark.asyncio
+async def test_get_posts_for_users_only_fetches_uncached(client, fake_apify):
+    """Test cached accounts are left out of the batch run."""
+    fake_apify.items = [make_item("1", username="alice")]
+    await client.get_user_posts("alice", limit=5)
+
+    fake_apify.items = [make_item("2", username="bob")]
+    results = await client.get_posts_for_users(["alice", "bob"], limit=5)
+
+    assert fake_apify.calls[-1]["identifiers"] == ["bob"]
+    assert [p.id for p in results["alice"].posts] == ["1"]
+    assert [p.id for p in results["bob"].posts] == ["2"]
+
+@pytest.mark.asyncio
+async def test_get_user_posts_sets_next_cursor(client, fake_apify):
+    """Test the newest post ID is returned as the next cursor."""
+    fake_apify.items = [make_item("100"), make_item("99"), make_item("1000")]
+
+    posts = await client.get_user_posts("testuser")
+
+    assert posts.next_cursor == "1000"
+    assert posts.previous_cursor is None
+
+@pytest.mark.asyncio
+async def test_incremental_fetch_returns_only_newer_posts(client, fake_apify):
+    """Test since_id is passed to the actor and older posts are dropped."""
+    fake_apify.items = [make_item("102"), make_item("101"), make_item("100"), make_item("99")]
+
+    posts = await client.get_user_posts("testuser", since_id="100")
+
+    assert fake_apify.calls[0]["useLastPostId"] is True
+    assert fake_apify.calls[0]["lastPostId"] == "100"
+    assert [p.id for p in posts.posts] == ["102", "101"]
+    assert posts.next_cursor == "102"
+    assert posts.previous_cursor == "100"
+
+@pytest.mark.asyncio
+async def test_incremental_fetch_with_nothing_new(client, fake_apify):
+    """Test an incremental fetch with no new posts keeps the cursor."""
+    fake_apify.items = [make_item("100")]
+
+    posts = await client.get_user_posts("testuser", since_id="100")
+
+    assert posts.posts == []
+    assert posts.next_cursor == "100"
+
+@pytest.mark.asyncio
+async def test_incremental_fetch_bypasses_cache(client, fake_apify):
+    """Test incremental fetches always reach the actor."""
+    await client.get_user_posts("testuser", since_id="0")
+    await client.get_user_posts("testuser", since_id="0")
+
+    assert len(fake_apify.calls) == 2
+
+@pytest.fixture
+def indexed_client(fake_apify, tmp_path):
+    """Create a client that writes fetched posts to a local index."""
+    fake_apify.delay = 0
+    index = AsyncPostIndex(str(tmp_path / "posts.db"))
+    client = TruthSocialClient(ApifyConfig(api_token="test_token", actor_id="test_actor"), index=index)
+    client._client = fake_apify
+    return client
+
+@pytest.mark.asyncio
+async def test_search_posts_without_index_filters_latest(client, fake_apify):
+    """Test searching without an index filters the latest posts."""
+    fake_apify.items = [make_item("2", "Election day", hours_ago=2), make_item("1", "Rally tonight", hours_ago=3)]
+
+    posts = await client.search_posts("testuser", since=datetime.now(timezone.utc) - timedelta(days=1),
+                                      query="election")
+
+    assert [p.id for p in posts.posts] == ["2"]
+
+@pytest.mark.asyncio
+async def test_fetched_posts_are_indexed(indexed_client, fake_apify):
+    """Test every fetched post is written to the index."""
+    fake_apify.items = [make_item("2", hours_ago=2), make_item("1", hours_ago=3)]
+
+    await indexed_client.get_user_posts("testuser")
+
+    indexed = await indexed_client.index.search("testuser")
+    assert [p.id for p in indexed] == ["2", "1"]
+
+@pytest.mark.asyncio
+async def test_search_posts_answers_from_index(indexed_client, fake_apify):
+    """Test a covered, fresh range is answered without running the actor."""
+    fake_apify.items = [make_item("2", "Election day", hours_ago=2), make_item("1", "Rally tonight", hours_ago=3)]
+    since = datetime.now(timezone.utc) - timedelta(days=30)
+
+    first = await indexed_client.search_posts("testuser", since=since, query="election")
+    indexed_client.cache.clear()
+    second = await indexed_client.search_posts("testuser", since=since, query="rally")
+
+    assert [p.id for p in first.posts] == ["2"]
+    assert [p.id for p in second.posts] == ["1"]
+    assert len(fake_apify.calls) == 1
+    assert fake_apify.calls[0]["maxPosts"] == indexed_client.index_fetch_limit
+
+@pytest.mark.asyncio
+async def test_search_posts_fetches_only_newer_posts_when_stale(indexed_client, fake_apify):
+    """Test a stale index is topped up with an incremental fetch."""
+    fake_apify.items = [make_item("2", hours_ago=2), make_item("1", hours_ago=3)]
+    since = datetime.now(timezone.utc) - timedelta(days=30)
+    await indexed_client.search_posts("testuser", since=since)
+
+    # Anything indexed is now considered stale
+    indexed_client.config.cache_ttl = 0
+    fake_apify.items = [make_item("3", hours_ago=1), make_item("2", hours_ago=2)]
+
+    posts = await indexed_client.search_posts("testuser", since=since)
+
+    assert fake_apify.calls[1]["lastPostId"] == "2"
+    assert [p.id for p in posts.posts] == ["3", "2", "1"]
+
+@pytest.mark.asyncio
+async def test_search_posts_fetches_older_range_when_uncovered(indexed_client, fake_apify):
+    """Test a range older than the index triggers a deep fetch."""
+    # Only the monitor's incremental fetch has populated the index so far
+    fake_apify.items = [make_item("2", hours_ago=2)]
+    await indexed_client.get_user_posts("testuser", since_id="1")
+
+    fake_apify.items = [make_item("2", hours_ago=2), make_item("1", hours_ago=3)]
+    posts = await indexed_client.search_posts("testuser", since=datetime.now(timezone.utc) - timedelta(days=7))
+
+    assert "lastPostId" not in fake_apify.calls[1]
+    assert [p.id for p in posts.posts] == ["2", "1"]
+
+@pytest.mark.asyncio
+async def test_refresh_accounts_records_coverage(indexed_client, fake_apify):
+    """Test refreshing accounts indexes them so later searches skip the actor."""
+    fake_apify.items = [make_item("2", username="alice", hours_ago=2), make_item("1", username="bob", hours_ago=3)]
+
+    await indexed_client.refresh_accounts(["alice", "bob"], limit=20)
+    posts = await indexed_client.search_posts("alice", limit=5)
+
+    assert len(fake_apify.calls) == 1
+    assert fake_apify.calls[0]["identifiers"] == ["alice", "bob"]
+    assert [p.id for p in posts.posts] == ["2"]
+
+@pytest.mark.asyncio
+async def test_refresh_accounts_skips_cache(indexed_client, fake_apify):
+    """Test a refresh always runs the actor, even for cached accounts."""
+    await indexed_client.get_user_posts("testuser", limit=20)
+
+    await indexed_client.refresh_accounts(["testuser"], limit=20)
+
+    assert len(fake_apify.calls) == 2
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_cached_posts(indexed_client, fake_apify):
+    """Test a refresh that fails leaves the cached posts in place to be served."""
+    cached = await indexed_client.get_user_posts("testuser", limit=20)
+    fake_apify.error = RuntimeError("boom")
+
+    with pytest.raises(ApifyError):
+        await indexed_client.refresh_accounts(["testuser"], limit=20)
+
+    assert await indexed_client.get_user_posts("testuser", limit=20) == cached
+    assert len(fake_apify.calls) == 2
+
+@pytest.mark.asyncio
+async def test_profile_served_from_index(indexed_client, fake_apify):
+    """Test a recently stored profile is returned without running the actor."""
+    await indexed_client.refresh_accounts(["testuser"], limit=20)
+    indexed_client.cache.clear()
+
+    profile = await indexed_client.get_user_profile("testuser")
+
+    assert profile.username == "testuser"
+    assert len(fake_apify.calls) == 1
+
+@pytest.mark.asyncio
+async def test_stream_user_posts_yields_parsed_posts(indexed_client, fake_apify):
+    """Test streamed posts are parsed, share one author and are indexed."""
+    fake_apify.items = [make_item(str(i), hours_ago=i) for i in range(3, 0, -1)]
+
+    posts = [post async for post in indexed_client.stream_user_posts("testuser")]
+
+    assert [p.id for p in posts] == ["3", "2", "1"]
+    assert posts[0].user is posts[-1].user
+    assert len(await indexed_client.index.search("testuser")) == 3
+
+@pytest.mark.asyncio
+async def test_stream_user_posts_stops_reading_when_caller_stops(indexed_client, fake_apify):
+    """Test items are only pulled from the dataset as the caller asks for them."""
+    fake_apify.items = [make_item(str(i)) for i in range(100, 0, -1)]
+    indexed_client.index_write_batch = 10
+
+    async with aclosing(indexed_client.stream_user_posts("testuser", limit=100)) as posts:
+        async for post in posts:
+            if post.id == "96":
+                break
+
+    assert fake_apify.items_read == 5
+    assert len(await indexed_client.index.search("testuser")) == 5
+
+@pytest.mark.asyncio
+async def test_stream_user_posts_since_id(client, fake_apify):
+    """Test an incremental stream skips posts at or before the cursor."""
+    fake_apify.items = [make_item("12"), make_item("11"), make_item("9")]
+
+    posts = [post async for post in client.stream_user_posts("testuser", since_id="11")]
+
+    assert [p.id for p in posts] == ["12"]
+    assert fake_apify.calls[0]["lastPostId"] == "11"
+
+@pytest.mark.asyncio
+async def test_stream_user_posts_empty_raises(client, fake_apify):
+    """Test an account with no posts raises like get_user_posts."""
+    fake_apify.items = []
+
+    with pytest.raises(ApifyError):
+        async for _ in client.stream_user_posts("testuser"):
+            pass
+
+@pytest.mark.asyncio
+async def test_stream_user_posts_uses_cache(client, fake_apify):
+    """Test a cached post list is replayed without running the actor."""
+    await client.get_user_posts("testuser", limit=5)
+
+    posts = [post async for post in client.stream_user_posts("testuser", limit=5)]
+
+    assert [p.id for p in posts] == ["1"]
+    assert len(fake_apify.calls) == 1
+
+@pytest.mark.asyncio
+async def test_repeated_fetches_share_author(client, fake_apify):
+    """Test posts from separate fetches point at one interned profile."""
+    first = await client.get_user_posts("testuser", limit=5)
+    second = await client.get_user_posts("testuser", since_id="0")
+
+    assert first.posts[0].user is second.posts[0].user
+
+@pytest.mark.asyncio
+async def test_malformed_items_are_skipped(client, fake_apify):
+    """Test one bad dataset item does not fail the whole fetch."""
+    broken = make_item("2")
+    del broken['content']
+    fake_apify.items = [make_item("3"), broken, make_item("1")]
+
+    posts = await client.get_user_posts("testuser")
+
+    assert [p.id for p in posts.posts] == ["3", "1"]
+    assert client.stats()["malformed_items"] == 1
+
+@pytest.mark.asyncio
+async def test_all_items_malformed_raises_apify_error(client, fake_apify):
+    """Test a dataset with nothing parseable raises an ApifyError."""
+    broken = make_item()
+    del broken['account']
+    fake_apify.items = [broken]
+
+    with pytest.raises(ApifyError, match="malformed"):
+        await client.get_user_posts("testuser")
+
+@pytest.mark.asyncio
+async def test_run_charges_governor(client, fake_apify):
+    """Test every actor run goes through the governor."""
+    await client.get_user_posts("testuser")
+
+    governor = client.stats()["governor"]
+    assert governor.runs == 1
+    assert governor.running == 0
+
+@pytest.mark.asyncio
+async def test_busy_governor_serves_stale_cache(fake_apify):
+    """Test an expired response is served when Apify is too busy to refresh it."""
+    now = [0.0]
+    client = TruthSocialClient(ApifyConfig(api_token="test_token", actor_id="test_actor"),
+                               cache=ResponseCache(ttl=60, stale_ttl=600, clock=lambda: now[0]))
+    client._client = fake_apify
+    first = await client.get_user_posts("testuser", limit=5)
+    now[0] = 120
+    client.governor.max_concurrent = client.governor.max_queued = 0
+
+    posts = await client.get_user_posts("testuser", limit=5)
+
+    assert posts is first
+    assert len(fake_apify.calls) == 1
+    assert client.stats()["stale_served"] == 1
+
+@pytest.mark.asyncio
+async def test_busy_governor_without_stale_cache_raises(client, fake_apify):
+    """Test a shed request with nothing cached raises ApifyBusyError."""
+    client.governor.max_concurrent = client.governor.max_queued = 0
+
+    with pytest.raises(ApifyBusyError):
+        await client.get_user_profile("testuser")
+    assert fake_apify.calls == []
+
+def stale_client(fake_apify, index=None):
+    """Build a client whose cache clock the test controls."""
+    now = [0.0]
+    client = TruthSocialClient(ApifyConfig(api_token="test_token", actor_id="test_actor"),
+                               cache=ResponseCache(ttl=60, stale_ttl=600, clock=lambda: now[0]),
+                               index=index)
+    client._client = fake_apify
+    return client, now
+
+@pytest.mark.asyncio
+async def test_serve_fresh_profile_is_not_stale(fake_apify):
+    """Test a profile within the TTL is served as is."""
+    client, now = stale_client(fake_apify)
+    await client.get_user_profile("testuser")
+
+    served = await client.serve_user_profile("testuser")
+
+    assert not served.stale
+    assert len(fake_apify.calls) == 1
+
+@pytest.mark.asyncio
+async def test_serve_stale_profile_revalidates_once(fake_apify):
+    """Test stale profiles are answered at once while one background run refreshes them."""
+    client, now = stale_client(fake_apify)
+    first = await client.get_user_profile("testuser")
+    now[0] = 120
+
+    start = time.perf_counter()
+    served = await asyncio.gather(*(client.serve_user_profile("testuser") for _ in range(5)))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < ACTOR_DELAY
+    assert all(s.value is first and s.stale for s in served)
+    assert datetime.now(timezone.utc) - served[0].as_of >= timedelta(seconds=119)
+    assert client.stats()["revalidating"] == 1
+
+    await asyncio.sleep(ACTOR_DELAY * 2)
+    assert len(fake_apify.calls) == 2
+    assert not (await client.serve_user_profile("testuser")).stale
+
+@pytest.mark.asyncio
+async def test_serve_posts_past_stale_window_waits_for_actor(fake_apify):
+    """Test posts older than the stale window are fetched before answering."""
+    client, now = stale_client(fake_apify)
+    await client.get_user_posts("testuser", limit=5)
+    now[0] = 1000
+
+    served = await client.serve_user_posts("testuser", limit=5)
+
+    assert not served.stale
+    assert len(fake_apify.calls) == 2
+
+@pytest.mark.asyncio
+async def test_serve_stale_posts_from_index(indexed_client, fake_apify):
+    """Test an index whose coverage is past the TTL answers at once and refreshes."""
+    fake_apify.items = [make_item(str(i), hours_ago=10 - i) for i in range(5, 0, -1)]
+    await indexed_client.search_posts("testuser", limit=5)
+    indexed_client.config.cache_ttl = 0
+
+    served = await indexed_client.serve_user_posts("testuser", limit=5)
+
+    assert served.stale
+    assert [p.id for p in served.value.posts] == ["5", "4", "3", "2", "1"]
+    await asyncio.sleep(ACTOR_DELAY * 2)
+    assert fake_apify.calls[-1]["lastPostId"] == "5"
+
+@pytest.mark.asyncio
+async def test_restarted_client_serves_persisted_cache(fake_apify, tmp_path):
+    """Test a new client over the same response store does not run the actor again."""
+    path = str(tmp_path / "cache.db")
+    config = ApifyConfig(api_token="test_token", actor_id="test_actor")
+    async with TruthSocialClient(config, cache_store=AsyncResponseStore(path)) as first:
+        first._client = fake_apify
+        await first.get_user_posts("testuser", limit=5)
+        await first.get_user_profile("testuser")
+
+    async with TruthSocialClient(config, cache_store=AsyncResponseStore(path)) as second:
+        second._client = fake_apify
+        posts = await second.get_user_posts("testuser", limit=5)
+        profile = await second.get_user_profile("testuser")
+
+    assert [p.id for p in posts.posts] == ["1"]
+    assert profile.username == "testuser"
+    assert len(fake_apify.calls) == 2
+
+@pytest.mark.asyncio
+async def test_apify_client_created_on_first_run():
+    """Test building and closing a client never builds the Apify connection pool."""
+    client = TruthSocialClient(ApifyConfig(api_token="test_token", actor_id="test_actor"))
+
+    await client.close()
+
+    assert client._client is None
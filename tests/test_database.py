@@ -1,7 +1,10 @@
 """Tests for the database component."""
 
 import pytest
-from discord_bot.database import Database
+import asyncio
+import threading
+import time
+from discord_bot.database import Database, AsyncDatabase, SCHEMA_VERSION
 from datetime import datetime
 import sqlite3
 import os
@@ -117,24 +120,340 @@ def test_is_monitoring_active(test_db):
     test_db.deactivate_monitoring()
     assert test_db.is_monitoring_active() is False
 
-def test_multiple_configs_only_latest_active(test_db):
-    """Test that only the latest configuration is active when multiple exist."""
+def test_multiple_configs_stay_active(test_db):
+    """Test several watches can be active at once."""
     # Add first configuration
     test_db.add_monitoring_config("user1", "keyword1")
     
     # Add second configuration
     test_db.add_monitoring_config("user2", "keyword2")
     
-    # Get current config
+    # The latest configuration is still returned by default
     config = test_db.get_monitoring_config()
-    
-    # Verify only the latest is returned
     assert config['username'] == "user2"
     assert config['filter_keyword'] == "keyword2"
     
-    # Verify only one active configuration exists using the existing connection
+    # Verify both configurations are active using the existing connection
     conn = test_db._get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT COUNT(*) FROM monitoring_configs WHERE is_active = 1")
     active_count = cursor.fetchone()[0]
-    assert active_count == 1 
\ No newline at end of file
+    assert active_count == 2
+
+def test_update_post_cursor(test_db):
+    """Test storing the incremental fetch cursor on the active configuration."""
+    test_db.add_monitoring_config("test_user", "test_keyword")
+    assert test_db.get_monitoring_config()['post_cursor'] is None
+    
+    test_db.update_post_cursor("114398068768949049")
+    
+    config = test_db.get_monitoring_config()
+    assert config['post_cursor'] == "114398068768949049"
+
+def test_init_db_adds_cursor_column_to_old_schema(tmp_path):
+    """Test databases created before the cursor column are upgraded."""
+    db_path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE monitoring_configs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            filter_keyword TEXT NOT NULL,
+            last_checked_timestamp TEXT,
+            last_post_id TEXT,
+            created_at TEXT NOT NULL,
+            is_active INTEGER DEFAULT 1
+        )
+    """)
+    conn.commit()
+    conn.close()
+    
+    db = Database(db_path=db_path)
+    db.add_monitoring_config("test_user", "test_keyword")
+    db.update_post_cursor("123")
+    
+    assert db.get_monitoring_config()['post_cursor'] == "123"
+
+def test_file_database_reuses_connection_in_wal_mode(tmp_path):
+    """Test file databases keep one connection open with WAL journaling."""
+    db = Database(db_path=str(tmp_path / "test.db"))
+    conn = db._get_connection()
+    
+    db.add_monitoring_config("test_user", "test_keyword")
+    db.is_monitoring_active()
+    
+    assert db._get_connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    db.close()
+
+def test_close_and_context_manager(tmp_path):
+    """Test the connection is released on close and reopened on demand."""
+    db_path = str(tmp_path / "test.db")
+    with Database(db_path=db_path) as db:
+        db.add_monitoring_config("test_user", "test_keyword")
+    
+    assert db.connection is None
+    
+    # Data survives and the connection reopens lazily
+    assert db.get_monitoring_config()['username'] == "test_user"
+    db.close()
+
+@pytest.fixture
+def async_db(tmp_path):
+    """Create an async database backed by a temporary file."""
+    return AsyncDatabase(db_path=str(tmp_path / "test.db"))
+
+@pytest.mark.asyncio
+async def test_async_database_method_surface(async_db):
+    """Test the async facade mirrors the Database methods."""
+    assert await async_db.is_monitoring_active() is False
+    
+    config_id = await async_db.add_monitoring_config("test_user", "test_keyword")
+    assert config_id > 0
+    assert await async_db.is_monitoring_active() is True
+    
+    await async_db.update_last_checked("123", "2025-01-01T00:00:00")
+    await async_db.update_post_cursor("456")
+    config = await async_db.get_monitoring_config()
+    assert config['last_post_id'] == "123"
+    assert config['post_cursor'] == "456"
+    
+    await async_db.mark_posts_seen(config_id, ["123"])
+    assert await async_db.get_seen_posts(config_id, ["123", "124"]) == {"123"}
+    
+    await async_db.deactivate_monitoring()
+    assert await async_db.get_monitoring_config() is None
+    await async_db.close()
+
+@pytest.mark.asyncio
+async def test_async_database_concurrent_reads_and_writes(async_db):
+    """Test concurrent reads and writes are serialized safely."""
+    await async_db.add_monitoring_config("test_user", "test_keyword")
+    
+    writes = [async_db.update_post_cursor(str(i)) for i in range(50)]
+    reads = [async_db.get_monitoring_config() for _ in range(50)]
+    results = await asyncio.gather(*writes, *reads)
+    
+    configs = results[50:]
+    assert all(config['username'] == "test_user" for config in configs)
+    # Calls run in submission order on the worker thread
+    assert (await async_db.get_monitoring_config())['post_cursor'] == "49"
+    await async_db.close()
+
+@pytest.mark.asyncio
+async def test_async_database_does_not_block_event_loop(async_db):
+    """Test a slow database call leaves the event loop free."""
+    ticks = 0
+    
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+    
+    def slow_call(method, *args, **kwargs):
+        time.sleep(0.2)
+        return True
+    
+    async_db._call = slow_call
+    task = asyncio.create_task(ticker())
+    try:
+        await async_db.is_monitoring_active()
+    finally:
+        task.cancel()
+    
+    assert ticks >= 5
+    await async_db.close()
+
+@pytest.mark.asyncio
+async def test_async_database_runs_on_worker_thread(async_db):
+    """Test database calls never run on the event loop thread."""
+    threads = set()
+    original_call = async_db._call
+    
+    def recording_call(method, *args, **kwargs):
+        threads.add(threading.get_ident())
+        return original_call(method, *args, **kwargs)
+    
+    async_db._call = recording_call
+    await asyncio.gather(*(async_db.is_monitoring_active() for _ in range(10)))
+    
+    assert len(threads) == 1
+    assert threading.get_ident() not in threads
+    await async_db.close()
+
+def test_schema_version_and_indexes(test_db):
+    """Test migrations record the schema version and create the indexes."""
+    conn = test_db._get_connection()
+    
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(monitoring_configs)")}
+    assert "idx_monitoring_configs_active_username" in indexes
+    assert "idx_monitoring_configs_guild_channel" in indexes
+
+def test_lookups_use_indexes(test_db):
+    """Test the hot lookups are answered from an index, not a table scan."""
+    conn = test_db._get_connection()
+    
+    plan = " ".join(row[3] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM monitoring_configs "
+        "WHERE is_active = 1 AND username = ?", ("user",)
+    ))
+    assert "idx_monitoring_configs_active_username" in plan
+    
+    plan = " ".join(row[3] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM monitoring_configs "
+        "WHERE is_active = 1 AND guild_id = ? AND channel_id = ?", (1, 2)
+    ))
+    assert "USING INDEX" in plan
+
+def test_watches_scoped_to_channel(test_db):
+    """Test watches are listed and stopped per guild/channel."""
+    first = test_db.add_monitoring_config("user1", "keyword1", guild_id=1, channel_id=10)
+    test_db.add_monitoring_config("user2", "keyword2", guild_id=1, channel_id=10)
+    test_db.add_monitoring_config("user1", "keyword3", guild_id=2, channel_id=20)
+    
+    channel_configs = test_db.get_active_configs(guild_id=1, channel_id=10)
+    assert [c['username'] for c in channel_configs] == ["user1", "user2"]
+    assert [c['id'] for c in test_db.get_active_configs(username="user1")][0] == first
+    assert test_db.is_monitoring_active("user2", guild_id=1, channel_id=10) is True
+    assert test_db.is_monitoring_active("user2", guild_id=2, channel_id=20) is False
+    
+    assert test_db.deactivate_monitoring(guild_id=1, channel_id=10) == 2
+    assert test_db.get_active_configs(guild_id=1, channel_id=10) == []
+    assert len(test_db.get_active_configs()) == 1
+
+def test_usernames_ignore_case(test_db):
+    """Test a watch is found and stopped whatever case its handle is typed in."""
+    test_db.add_monitoring_config("RealDonaldTrump", "keyword1", guild_id=1, channel_id=10)
+    
+    assert test_db.is_monitoring_active("realdonaldtrump", guild_id=1, channel_id=10) is True
+    assert test_db.get_active_configs(username="REALDONALDTRUMP")[0]['username'] == "realdonaldtrump"
+    assert test_db.deactivate_monitoring(guild_id=1, channel_id=10, username="realDonaldTrump") == 1
+
+def test_migration_lowercases_usernames(tmp_path):
+    """Test watches stored before usernames were normalised are found case-insensitively."""
+    db_path = str(tmp_path / "old.db")
+    with Database(db_path=db_path) as db:
+        db.add_monitoring_config("user1", "keyword1", guild_id=1, channel_id=10)
+        conn = db._get_connection()
+        conn.execute("UPDATE monitoring_configs SET username = 'User1'")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+        conn.commit()
+    
+    with Database(db_path=db_path) as db:
+        assert db.is_monitoring_active("user1", guild_id=1, channel_id=10) is True
+
+def test_updates_target_single_watch(test_db):
+    """Test cursor and last-checked updates can target one watch."""
+    first = test_db.add_monitoring_config("user1", "keyword1")
+    second = test_db.add_monitoring_config("user2", "keyword2")
+    
+    test_db.update_post_cursor("100", first)
+    test_db.update_last_checked("99", "2025-01-01T00:00:00", first)
+    
+    assert test_db.get_monitoring_config(first)['post_cursor'] == "100"
+    assert test_db.get_monitoring_config(first)['last_post_id'] == "99"
+    assert test_db.get_monitoring_config(second)['post_cursor'] is None
+
+def test_migrates_unversioned_database(tmp_path):
+    """Test a database from before versioning is upgraded in place."""
+    db_path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE monitoring_configs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            filter_keyword TEXT NOT NULL,
+            last_checked_timestamp TEXT,
+            last_post_id TEXT,
+            created_at TEXT NOT NULL,
+            is_active INTEGER DEFAULT 1,
+            post_cursor TEXT
+        )
+    """)
+    conn.execute("""
+        INSERT INTO monitoring_configs (username, filter_keyword, created_at, is_active)
+        VALUES ('user1', 'keyword1', '2025-01-01T00:00:00', 1)
+    """)
+    conn.commit()
+    conn.close()
+    
+    db = Database(db_path=db_path)
+    row = db._get_connection().execute("SELECT * FROM monitoring_configs").fetchone()
+    
+    assert row['username'] == "user1"
+    assert row['guild_id'] is None
+    assert db._get_connection().execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    db.close()
+
+def test_migration_stops_watches_without_a_channel(tmp_path):
+    """Test watches from the baseline schema are stopped rather than left unreachable."""
+    db_path = str(tmp_path / "baseline.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE monitoring_configs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            filter_keyword TEXT NOT NULL,
+            last_checked_timestamp TEXT,
+            last_post_id TEXT,
+            created_at TEXT NOT NULL,
+            is_active INTEGER DEFAULT 1
+        )
+    """)
+    conn.execute("""
+        INSERT INTO monitoring_configs (username, filter_keyword, created_at, is_active)
+        VALUES ('user1', 'keyword1', '2025-01-01T00:00:00', 1)
+    """)
+    conn.commit()
+    conn.close()
+    
+    db = Database(db_path=db_path)
+    
+    assert db.get_active_configs() == []
+    assert db.is_monitoring_active() is False
+    assert db.get_active_configs(guild_id=1, channel_id=2) == []
+    
+    db.add_monitoring_config("user1", "keyword1", guild_id=1, channel_id=2)
+    assert db.is_monitoring_active(guild_id=1, channel_id=2) is True
+    assert db.deactivate_monitoring(guild_id=1, channel_id=2) == 1
+    assert db.is_monitoring_active() is False
+    db.close()
+
+def test_seen_posts_are_remembered_per_watch(test_db):
+    """Test delivered post IDs are recorded for each watch separately."""
+    first = test_db.add_monitoring_config("user1", "keyword1")
+    second = test_db.add_monitoring_config("user1", "keyword2")
+    
+    test_db.mark_posts_seen(first, ["101", "102"])
+    test_db.mark_posts_seen(first, ["102"])
+    
+    assert test_db.get_seen_posts(first, ["101", "102", "103"]) == {"101", "102"}
+    assert test_db.get_seen_posts(second, ["101", "102"]) == set()
+    assert test_db.get_seen_posts(first, []) == set()
+
+def test_seen_posts_are_bounded(test_db):
+    """Test only the newest IDs are kept once a watch hits the limit."""
+    config_id = test_db.add_monitoring_config("user1", "keyword1")
+    
+    test_db.mark_posts_seen(config_id, [str(i) for i in range(10)], limit=3)
+    
+    conn = test_db._get_connection()
+    count = conn.execute("SELECT COUNT(*) FROM seen_posts").fetchone()[0]
+    assert count == 3
+    assert test_db.get_seen_posts(config_id, [str(i) for i in range(10)]) == {"7", "8", "9"}
+
+def test_deactivate_clears_seen_posts(test_db):
+    """Test stopping a watch drops its delivery history."""
+    stopped = test_db.add_monitoring_config("user1", "keyword1", channel_id=10)
+    kept = test_db.add_monitoring_config("user1", "keyword1", channel_id=20)
+    test_db.mark_posts_seen(stopped, ["101"])
+    test_db.mark_posts_seen(kept, ["101"])
+    
+    test_db.deactivate_monitoring(channel_id=10)
+    
+    assert test_db.get_seen_posts(stopped, ["101"]) == set()
+    assert test_db.get_seen_posts(kept, ["101"]) == {"101"}
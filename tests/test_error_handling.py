@@ -3,10 +3,12 @@
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 import discord
+from truth_social.models import Served
 import aiohttp
 from datetime import datetime, timezone
 from discord_bot.commands.truth_posts import TruthPostsCommand
 from discord_bot.commands.filter_posts import FilterPostsCommand
+from discord_bot.ratelimit import RateLimited
 
 class MockContext:
     """Simple mock for Discord context."""
@@ -56,7 +58,7 @@ async def test_network_timeout():
     
     # Configure client to simulate timeout
     cmd.client = MagicMock()
-    cmd.client.get_user_posts = AsyncMock(side_effect=aiohttp.ClientConnectionError("Connection timeout"))
+    cmd.client.serve_user_posts = AsyncMock(side_effect=aiohttp.ClientConnectionError("Connection timeout"))
     
     # Patching the typing CM to ensure exception is propagated to our try/except
     ctx._typing_cm.__aenter__.return_value = None
@@ -77,7 +79,7 @@ async def test_api_rate_limit():
     ctx = MockContext()
     
     # Ensure cooldown is disabled
-    with patch.object(cmd, '_is_on_cooldown', return_value=False):
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=None):
         # Add our custom exception
         rate_limit_error = Exception("Rate limit exceeded")
         
@@ -85,9 +87,9 @@ async def test_api_rate_limit():
         ctx._typing_cm.__aenter__.return_value = None
         ctx._typing_cm.__aexit__.return_value = False
         
-        # Setup client to raise exception during get_user_posts
+        # Setup client to raise exception during search_posts
         cmd.client = MagicMock()
-        cmd.client.get_user_posts = AsyncMock(side_effect=rate_limit_error)
+        cmd.client.search_posts = AsyncMock(side_effect=rate_limit_error)
         
         # Test the command
         await cmd.filter_posts.callback(cmd, ctx, "username")
@@ -105,14 +107,14 @@ async def test_empty_username():
     
     # Configure client first, before calling the command
     cmd.client = MagicMock()
-    cmd.client.get_user_posts = AsyncMock(return_value=MagicMock(posts=[]))
+    cmd.client.serve_user_posts = AsyncMock(return_value=Served(MagicMock(posts=[])))
     
     # Test the command with empty username
     await cmd.truth_posts.callback(cmd, ctx, "")
     
     # Verify client was called with empty string
-    cmd.client.get_user_posts.assert_called_once()
-    called_args = cmd.client.get_user_posts.call_args
+    cmd.client.serve_user_posts.assert_called_once()
+    called_args = cmd.client.serve_user_posts.call_args
     assert called_args[0][0] == "", "Empty username not passed correctly"
 
 @pytest.mark.asyncio
@@ -123,7 +125,7 @@ async def test_malformed_api_response():
     ctx = MockContext()
     
     # Ensure cooldown is disabled
-    with patch.object(cmd, '_is_on_cooldown', return_value=False):
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=None):
         # Configure typing and context manager for proper exception handling
         ctx._typing_cm.__aenter__.return_value = None
         ctx._typing_cm.__aexit__.return_value = False
@@ -132,7 +134,7 @@ async def test_malformed_api_response():
         cmd.client = MagicMock()
         # This will cause AttributeError when code tries to access posts.posts
         mock_bad_response = object()  # Object with no 'posts' attribute
-        cmd.client.get_user_posts = AsyncMock(return_value=mock_bad_response)
+        cmd.client.search_posts = AsyncMock(return_value=mock_bad_response)
         
         # Test the command
         await cmd.filter_posts.callback(cmd, ctx, "username")
@@ -154,10 +156,7 @@ async def test_excessive_cooldown_spam():
     ctx = MockContext()
     
     # Force cooldown to be active
-    with patch.object(cmd, '_is_on_cooldown', return_value=True):
-        cmd._cooldown_time = 30
-        cmd._cooldowns[ctx.author.id] = [datetime.now()]
-        
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=RateLimited("user", 20)):
         # Call command multiple times in quick succession
         await cmd.filter_posts.callback(cmd, ctx, "username")
         await cmd.filter_posts.callback(cmd, ctx, "username")
@@ -176,7 +175,7 @@ async def test_very_long_username():
     
     # Configure client
     cmd.client = MagicMock()
-    cmd.client.get_user_posts = AsyncMock(return_value=MagicMock(posts=[]))
+    cmd.client.serve_user_posts = AsyncMock(return_value=Served(MagicMock(posts=[])))
     
     # Create an excessively long username
     long_username = "a" * 1000
@@ -185,8 +184,8 @@ async def test_very_long_username():
     await cmd.truth_posts.callback(cmd, ctx, long_username)
     
     # Verify the command processed the long username without crashing
-    cmd.client.get_user_posts.assert_called_once()
-    called_args = cmd.client.get_user_posts.call_args[0]
+    cmd.client.serve_user_posts.assert_called_once()
+    called_args = cmd.client.serve_user_posts.call_args[0]
     assert called_args[0] == long_username, "Long username was not passed correctly"
 
 @pytest.mark.asyncio
@@ -198,7 +197,7 @@ async def test_unicode_characters_in_username():
     
     # Configure client
     cmd.client = MagicMock()
-    cmd.client.get_user_posts = AsyncMock(return_value=MagicMock(posts=[]))
+    cmd.client.serve_user_posts = AsyncMock(return_value=Served(MagicMock(posts=[])))
     
     # Create a username with various Unicode characters
     unicode_username = "🔥😊é科技ñüåß"
@@ -207,6 +206,6 @@ async def test_unicode_characters_in_username():
     await cmd.truth_posts.callback(cmd, ctx, unicode_username)
     
     # Verify the command processed the unicode username without crashing
-    cmd.client.get_user_posts.assert_called_once()
-    called_args = cmd.client.get_user_posts.call_args[0]
+    cmd.client.serve_user_posts.assert_called_once()
+    called_args = cmd.client.serve_user_posts.call_args[0]
     assert called_args[0] == unicode_username, "Unicode username not passed correctly" 
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Tests for the real client running against the local fake Apify server."""
+
+import pytest
+from benchmarks.fake_apify import FakeApifyServer
+from truth_social.client import TruthSocialClient, ApifyError
+from truth_social.config import ApifyConfig
+
+@pytest.fixture
+def server():
+    """Create a fake Apify server with quick actor runs."""
+    return FakeApifyServer(latency=0.05, posts_per_account=30, seed=1)
+
+def make_client(server):
+    return TruthSocialClient(ApifyConfig(api_token="test_token", actor_id="fake/scraper",
+                                         base_url=server.url))
+
+def test_api_url_strips_version():
+    """Test the base URL is turned into the server root ApifyClientAsync expects."""
+    assert ApifyConfig(api_token="t").api_url == "https://api.apify.com"
+    assert ApifyConfig(api_token="t", base_url="http://127.0.0.1:8765/v2").api_url == "http://127.0.0.1:8765"
+    assert ApifyConfig(api_token="t", base_url="http://proxy.local/").api_url == "http://proxy.local"
+
+@pytest.mark.asyncio
+async def test_posts_and_profile_over_http(server):
+    """Test posts and profiles round-trip through the real Apify client."""
+    async with server:
+        async with make_client(server) as client:
+            posts = await client.get_user_posts("alice", limit=10)
+            profile = await client.get_user_profile("bob")
+
+    assert len(posts.posts) == 10
+    assert posts.posts[0].user.username == "alice"
+    assert posts.next_cursor == posts.posts[0].id
+    assert profile.bio == "Synthetic account bob"
+    assert server.stats().runs == 2
+
+@pytest.mark.asyncio
+async def test_incremental_and_batch_fetches_over_http(server):
+    """Test lastPostId and multi-account runs behave like the real actor."""
+    async with server:
+        async with make_client(server) as client:
+            latest = await client.get_user_posts("alice", limit=10)
+            newer = await client.get_user_posts("alice", limit=10, since_id=latest.posts[3].id)
+            batch = await client.get_posts_for_users(["carol", "dave"], limit=5)
+
+    assert [p.id for p in newer.posts] == [p.id for p in latest.posts[:3]]
+    assert {username: len(post_list.posts) for username, post_list in batch.items()} == {
+        "carol": 5, "dave": 5
+    }
+
+@pytest.mark.asyncio
+async def test_failed_run_raises_apify_error(server):
+    """Test a run that finishes as FAILED surfaces as an ApifyError."""
+    server.error_rate = 1.0
+    async with server:
+        async with make_client(server) as client:
+            with pytest.raises(ApifyError, match="FAILED"):
+                await client.get_user_posts("alice", limit=5)
+
+    assert server.stats().failed_runs == 1
+
+@pytest.mark.asyncio
+async def test_streaming_pages_over_http(server):
+    """Test streamed posts arrive from the paged dataset endpoint."""
+    server.posts_per_account = 1500
+    async with server:
+        async with make_client(server) as client:
+            posts = [post async for post in client.stream_user_posts("alice", limit=1200)]
+
+    assert len(posts) == 1200
+    assert len({post.id for post in posts}) == 1200
+    assert server.stats().items_served == 1200
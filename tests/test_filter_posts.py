@@ -5,6 +5,7 @@ from unittest.mock import patch, AsyncMock, MagicMock, call
 import discord
 from datetime import datetime, timezone, timedelta
 from discord_bot.commands.filter_posts import FilterPostsCommand
+from discord_bot.ratelimit import RateLimited
 
 class MockContext:
     """Simple mock for Discord context."""
@@ -32,12 +33,8 @@ async def test_filter_posts_cooldown():
     cmd = FilterPostsCommand(MagicMock())
     ctx = MockContext()
     
-    # Mock _is_on_cooldown to return True
-    with patch.object(cmd, '_is_on_cooldown', return_value=True):
-        # Force the cooldown time for testing
-        cmd._cooldown_time = 20
-        cmd._cooldowns[ctx.author.id] = [datetime.now() - timedelta(seconds=10)]
-        
+    # Mock the rate limiter to refuse the request
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=RateLimited("user", 20)):
         # Call the method directly using the callback function
         await cmd.filter_posts.callback(cmd, ctx, "testuser")
         
@@ -54,11 +51,11 @@ async def test_filter_posts_max_days():
     ctx = MockContext()
     
     # Mock dependencies
-    with patch.object(cmd, '_is_on_cooldown', return_value=False):
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=None):
         with patch.object(cmd, 'client') as mock_client:
             # Configure mock client
-            mock_client.get_user_posts = AsyncMock()
-            mock_client.get_user_posts.return_value = MagicMock(posts=[])
+            mock_client.search_posts = AsyncMock()
+            mock_client.search_posts.return_value = MagicMock(posts=[])
             
             # Test the command with days > max_days
             cmd._max_days = 30
@@ -97,11 +94,11 @@ async def test_filter_posts_success():
     mock_post.reposts_count = 25
     
     # Configure test environment
-    with patch.object(cmd, '_is_on_cooldown', return_value=False):
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=None):
         with patch.object(cmd, 'client') as mock_client:
             # Setup mock client
-            mock_client.get_user_posts = AsyncMock()
-            mock_client.get_user_posts.return_value = MagicMock(posts=[mock_post])
+            mock_client.search_posts = AsyncMock()
+            mock_client.search_posts.return_value = MagicMock(posts=[mock_post])
             
             # Setup datetime patching
             with patch('discord_bot.commands.filter_posts.datetime') as mock_dt:
@@ -112,7 +109,9 @@ async def test_filter_posts_success():
                 await cmd.filter_posts.callback(cmd, ctx, "testuser", "keyword", 7)
                 
                 # Verify client call
-                mock_client.get_user_posts.assert_awaited_once_with("testuser")
+                mock_client.search_posts.assert_awaited_once_with(
+                    "testuser", since=fixed_dt - timedelta(days=7), query="keyword"
+                )
                 
                 # Verify embed was sent
                 embed_found = False
@@ -141,17 +140,12 @@ async def test_filter_posts_no_matches():
     # Create a fixed datetime
     fixed_dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
     
-    # Create mock post that won't match the filter
-    mock_post = MagicMock()
-    mock_post.content = "No matching content here"
-    mock_post.created_at = fixed_dt - timedelta(days=1)
-    
     # Configure test environment
-    with patch.object(cmd, '_is_on_cooldown', return_value=False):
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=None):
         with patch.object(cmd, 'client') as mock_client:
-            # Setup mock client
-            mock_client.get_user_posts = AsyncMock()
-            mock_client.get_user_posts.return_value = MagicMock(posts=[mock_post])
+            # Setup mock client; keyword filtering happens in the search
+            mock_client.search_posts = AsyncMock()
+            mock_client.search_posts.return_value = MagicMock(posts=[])
             
             # Setup datetime patching
             with patch('discord_bot.commands.filter_posts.datetime') as mock_dt:
@@ -179,17 +173,17 @@ async def test_filter_posts_with_at_symbol():
     ctx = MockContext()
     
     # Configure test environment
-    with patch.object(cmd, '_is_on_cooldown', return_value=False):
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=None):
         with patch.object(cmd, 'client') as mock_client:
             # Setup mock client
-            mock_client.get_user_posts = AsyncMock()
-            mock_client.get_user_posts.return_value = MagicMock(posts=[])
+            mock_client.search_posts = AsyncMock()
+            mock_client.search_posts.return_value = MagicMock(posts=[])
             
             # Call the method directly using the callback
             await cmd.filter_posts.callback(cmd, ctx, "@testuser")
             
             # Verify client call without @ symbol
-            mock_client.get_user_posts.assert_awaited_once_with("testuser")
+            assert mock_client.search_posts.await_args.args == ("testuser",)
 
 @pytest.mark.asyncio
 async def test_filter_posts_max_results():
@@ -215,11 +209,11 @@ async def test_filter_posts_max_results():
         mock_posts.append(post)
     
     # Configure test environment
-    with patch.object(cmd, '_is_on_cooldown', return_value=False):
+    with patch.object(cmd.rate_limiter, 'acquire', return_value=None):
         with patch.object(cmd, 'client') as mock_client:
             # Setup mock client
-            mock_client.get_user_posts = AsyncMock()
-            mock_client.get_user_posts.return_value = MagicMock(posts=mock_posts)
+            mock_client.search_posts = AsyncMock()
+            mock_client.search_posts.return_value = MagicMock(posts=mock_posts)
             
             # Force the max results limit
             cmd._max_results = 5
@@ -236,11 +230,13 @@ async def test_filter_posts_max_results():
                 found_message = False
                 embed_count = 0
                 for call in ctx.send_calls:
-                    content, embed, _ = call
+                    content, embed, kwargs = call
                     if content and "Found 10 posts. Showing the 5 most recent matching posts" in content:
                         found_message = True
                     if embed and isinstance(embed, discord.Embed):
                         embed_count += 1
+                    # Embeds are batched into as few messages as possible
+                    embed_count += len(kwargs.get('embeds', []))
                 
                 assert found_message, "Max results message not found"
                 assert embed_count == 5, f"Expected 5 embeds, got {embed_count}"
@@ -252,8 +248,8 @@ async def test_filter_posts_error():
     cmd = FilterPostsCommand(MagicMock())
     ctx = MockContext()
     
-    # To make the test simpler, force an error at the beginning by making _is_on_cooldown raise an exception
-    with patch.object(cmd, '_is_on_cooldown', side_effect=Exception("Simulated error")):
+    # To make the test simpler, force an error at the beginning by making the rate limiter raise an exception
+    with patch.object(cmd.rate_limiter, 'acquire', side_effect=Exception("Simulated error")):
         # Call the callback directly
         await cmd.filter_posts.callback(cmd, ctx, "testuser")
         
@@ -0,0 +1,136 @@
+"""Tests for the Apify run governor."""
+
+import asyncio
+import pytest
+from truth_social.errors import ApifyBusyError
+from truth_social.governor import ApifyGovernor, RunSlot, current_tenant
+
+async def settle():
+    """Let every ready task run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+async def test_caps_concurrent_runs():
+    """Test no more than ``max_concurrent`` slots are held at once."""
+    governor = ApifyGovernor(max_concurrent=2)
+    peak = running = 0
+
+    async def run():
+        nonlocal peak, running
+        async with governor.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(run() for _ in range(6)))
+
+    assert peak == 2
+    stats = governor.stats()
+    assert stats.runs == 6
+    assert stats.running == 0
+    assert stats.queued == 0
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_round_robin_per_tenant():
+    """Test a tenant with a long queue does not starve the others."""
+    governor = ApifyGovernor(max_concurrent=1)
+    order = []
+    await governor.acquire("busy")
+
+    async def wait(tenant, n):
+        await governor.acquire(tenant)
+        order.append((tenant, n))
+        governor.release()
+
+    tasks = [asyncio.create_task(wait("busy", n)) for n in range(3)]
+    await settle()
+    tasks.append(asyncio.create_task(wait("quiet", 0)))
+    await settle()
+    governor.release()
+    await asyncio.gather(*tasks)
+
+    assert order == [("busy", 0), ("quiet", 0), ("busy", 1), ("busy", 2)]
+
+@pytest.mark.asyncio
+async def test_tenant_defaults_to_context_variable():
+    """Test waiters without an explicit tenant queue under the current one."""
+    governor = ApifyGovernor(max_concurrent=1)
+    await governor.acquire()
+
+    async def wait():
+        current_tenant.set(42)
+        await governor.acquire()
+
+    task = asyncio.create_task(wait())
+    await settle()
+
+    assert list(governor._queues) == [42]
+    governor.release()
+    await task
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_load():
+    """Test requests beyond the queue limit fail fast instead of waiting."""
+    governor = ApifyGovernor(max_concurrent=1, max_queued=1)
+    await governor.acquire()
+    waiter = asyncio.create_task(governor.acquire())
+    await settle()
+
+    with pytest.raises(ApifyBusyError, match="queued"):
+        await governor.acquire()
+
+    assert governor.stats().shed == 1
+    governor.release()
+    await waiter
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    """Test a cancelled waiter gives up its place and its slot is not lost."""
+    governor = ApifyGovernor(max_concurrent=1)
+    await governor.acquire()
+    waiter = asyncio.create_task(governor.acquire())
+    await settle()
+
+    waiter.cancel()
+    await settle()
+    governor.release()
+
+    stats = governor.stats()
+    assert stats.queued == 0
+    assert stats.running == 0
+
+@pytest.mark.asyncio
+async def test_hourly_budget_sheds_until_spend_ages_out(clock):
+    """Test runs are refused once the hour's compute units are spent."""
+    governor = ApifyGovernor(hourly_budget=1.0, clock=clock)
+
+    async with governor.slot() as slot:
+        slot.charge({"stats": {"computeUnits": 1.0}})
+    with pytest.raises(ApifyBusyError, match="budget"):
+        await governor.acquire()
+
+    clock.now = 3600
+    await governor.acquire()
+    assert governor.stats().compute_units_last_hour == 0
+
+def test_slot_charges_reported_compute_units():
+    """Test compute units come from the run's stats when it reports them."""
+    slot = RunSlot()
+    slot.charge({"id": "run", "stats": {"computeUnits": 0.25}})
+    assert slot.compute_units == 0.25
+
+    slot = RunSlot()
+    slot.charge({"id": "run"})
+    assert slot.compute_units is None
+
+@pytest.mark.asyncio
+async def test_runs_without_stats_use_default_cost():
+    """Test a run that reports nothing is charged the default cost."""
+    governor = ApifyGovernor(default_run_cost=0.5)
+
+    async with governor.slot():
+        pass
+
+    assert governor.stats().compute_units_last_hour == 0.5
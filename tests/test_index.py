@@ -0,0 +1,213 @@
+"""Tests for the local post index."""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from truth_social.index import PostIndex, AsyncPostIndex, BEGINNING_OF_TIME, SCHEMA_VERSION
+from truth_social.matcher import KeywordMatcher
+from truth_social.models import Post
+from tests.helpers import make_author
+
+NOW = datetime(2025, 1, 31, tzinfo=timezone.utc)
+
+def make_post(post_id, content="Test post", days_ago=0, likes=10, author=None):
+    return Post(
+        id=post_id,
+        content=content,
+        created_at=NOW - timedelta(days=days_ago),
+        likes_count=likes,
+        replies_count=5,
+        reposts_count=2,
+        user=author or make_author()
+    )
+
+@pytest.fixture
+def index():
+    """Create an in-memory post index."""
+    index = PostIndex(db_path=":memory:")
+    yield index
+    index.close()
+
+def test_schema_and_fts(index):
+    """Test migrations run and the full-text table exists."""
+    conn = index._get_connection()
+
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    assert index.fts is True
+
+def test_add_and_search_round_trip(index):
+    """Test stored posts come back newest first with their author."""
+    index.add_posts("testuser", [make_post("1", days_ago=2), make_post("2", days_ago=1)])
+
+    posts = index.search("TestUser")
+
+    assert [post.id for post in posts] == ["2", "1"]
+    assert posts[0].created_at == NOW - timedelta(days=1)
+    assert posts[0].user == make_author()
+
+def test_add_posts_refreshes_existing(index):
+    """Test storing a post again updates it instead of duplicating it."""
+    index.add_posts("testuser", [make_post("1", likes=10)])
+    index.add_posts("testuser", [make_post("1", content="Edited post", likes=99)])
+
+    posts = index.search("testuser", matcher=KeywordMatcher(["edited"]))
+
+    assert len(posts) == 1
+    assert posts[0].likes_count == 99
+    assert index.search("testuser", matcher=KeywordMatcher(["test post"])) == []
+
+def test_search_by_date_and_keywords(index):
+    """Test searches honour the date cutoff and keyword query."""
+    index.add_posts("testuser", [
+        make_post("1", "Election news", days_ago=20),
+        make_post("2", "Election poll", days_ago=3),
+        make_post("3", "Rally tonight", days_ago=2),
+        make_post("4", "The ELECTION  is near", days_ago=1),
+    ])
+    index.add_posts("other", [make_post("5", "Election", days_ago=1, author=make_author("other"))])
+
+    matcher = KeywordMatcher(["election"], exclude=["poll"])
+    posts = index.search("testuser", since=NOW - timedelta(days=7), matcher=matcher)
+
+    assert [post.id for post in posts] == ["4"]
+
+def test_search_uses_full_text_index(index):
+    """Test keyword searches are answered from the FTS table."""
+    conn = index._get_connection()
+    plan = " ".join(row[3] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT p.* FROM posts_fts f JOIN posts p ON p.rowid = f.rowid "
+        "WHERE p.username = ? AND posts_fts MATCH ?", ("testuser", '"election"')
+    ))
+    assert "VIRTUAL TABLE INDEX" in plan
+
+def test_fts_query_matches_substrings_and_phrases(index):
+    """Test the index finds words inside longer words and phrases across newlines."""
+    index.add_posts("testuser", [
+        make_post("1", "Re-election campaign"),
+        make_post("2", "Make America\ngreat again"),
+    ])
+
+    assert [p.id for p in index.search("testuser", matcher=KeywordMatcher(["election"]))] == ["1"]
+    assert [p.id for p in index.search("testuser", matcher=KeywordMatcher(["america great"]))] == ["2"]
+
+def test_short_terms_fall_back_to_scan(index):
+    """Test terms too short for the trigram index still match."""
+    index.add_posts("testuser", [make_post("1", "AI is here"), make_post("2", "Nothing")])
+
+    assert index._fts_query(KeywordMatcher(["ai"])) is None
+    assert [p.id for p in index.search("testuser", matcher=KeywordMatcher(["ai"]))] == ["1"]
+
+def test_search_limit(index):
+    """Test the limit applies after filtering."""
+    index.add_posts("testuser", [make_post(str(i), days_ago=i) for i in range(10)])
+
+    assert [p.id for p in index.search("testuser", limit=3)] == ["0", "1", "2"]
+
+def test_coverage_merges_overlapping_ranges(index):
+    """Test adjacent fetches extend the covered range."""
+    index.add_posts("testuser", [make_post("1", days_ago=5), make_post("2", days_ago=1)])
+    index.record_coverage("testuser", NOW - timedelta(days=5), NOW - timedelta(days=1))
+    index.record_coverage("testuser", NOW - timedelta(days=1), NOW)
+
+    coverage = index.get_coverage("testuser")
+
+    assert coverage.covered_from == NOW - timedelta(days=5)
+    assert coverage.covered_until == NOW
+    assert coverage.newest_id == "2"
+    assert coverage.covers(NOW - timedelta(days=5))
+    assert not coverage.covers(NOW - timedelta(days=6))
+    assert not coverage.covers(None)
+
+def test_coverage_replaced_when_there_is_a_gap(index):
+    """Test a disjoint fetch replaces the range, since the gap is unknown."""
+    index.record_coverage("testuser", NOW - timedelta(days=10), NOW - timedelta(days=8))
+    index.record_coverage("testuser", NOW - timedelta(days=2), NOW)
+
+    coverage = index.get_coverage("testuser")
+
+    assert coverage.covered_from == NOW - timedelta(days=2)
+
+def test_full_history_covers_everything(index):
+    """Test an account fetched back to its first post covers any range."""
+    index.record_coverage("testuser", BEGINNING_OF_TIME, NOW)
+
+    coverage = index.get_coverage("testuser")
+
+    assert coverage.covers(None)
+    assert coverage.covers(NOW - timedelta(days=3650))
+    assert index.get_coverage("unknown") is None
+
+def test_add_post_lists_writes_every_account(index):
+    """Test a batch of accounts is stored in one call, each under its own name."""
+    alice, bob = make_author("alice"), make_author("bob")
+
+    written = index.add_post_lists({
+        "alice": [make_post("1", author=alice), make_post("2", author=alice)],
+        "bob": [make_post("3", author=bob)],
+    })
+
+    assert written == 3
+    assert [post.id for post in index.search("bob")] == ["3"]
+    assert index.get_author("alice").username == "alice"
+
+def test_get_author_max_age(index):
+    """Test an old profile is treated as missing when a max age is given."""
+    index.add_author("testuser", make_author())
+
+    assert index.get_author("testuser", max_age=60) == make_author()
+    index._get_connection().execute(
+        "UPDATE authors SET updated_at = '2000-01-01T00:00:00.000000+00:00'"
+    )
+    assert index.get_author("testuser", max_age=60) is None
+    assert index.get_author("testuser") == make_author()
+
+def test_get_author_survives_model_changes(index):
+    """Test stored profiles with unknown or missing fields don't break lookups."""
+    index.add_author("testuser", make_author())
+    conn = index._get_connection()
+    conn.execute("""UPDATE authors SET profile = json_set(profile, '$.pronouns', 'they/them')""")
+
+    assert index.get_author("testuser") == make_author()
+    index.add_posts("testuser", [make_post("1")])
+    assert index.search("testuser")[0].user == make_author()
+
+    conn.execute("""UPDATE authors SET profile = json_remove(profile, '$.bio')""")
+    assert index.get_author("testuser") is None
+    assert [post.user for post in index.search("testuser")] == [None]
+
+def test_coverage_satisfies_limit_with_enough_posts(index):
+    """Test the newest posts count as covered once enough are stored."""
+    index.add_posts("testuser", [make_post(str(i), days_ago=i) for i in range(5)])
+    index.record_coverage("testuser", NOW - timedelta(days=4), NOW)
+
+    coverage = index.get_coverage("testuser")
+
+    assert coverage.post_count == 5
+    assert coverage.covers(None, limit=5)
+    assert not coverage.covers(None, limit=6)
+    assert not coverage.covers(None)
+
+def test_file_index_persists(tmp_path):
+    """Test posts survive reopening the index."""
+    path = str(tmp_path / "posts.db")
+    with PostIndex(path) as index:
+        index.add_posts("testuser", [make_post("1")])
+
+    with PostIndex(path) as index:
+        assert [post.id for post in index.search("testuser")] == ["1"]
+
+@pytest.mark.asyncio
+async def test_async_index(tmp_path):
+    """Test the async facade mirrors the index."""
+    async with AsyncPostIndex(str(tmp_path / "posts.db")) as index:
+        await asyncio.gather(*(
+            index.add_posts("testuser", [make_post(str(i), days_ago=i)]) for i in range(5)
+        ))
+        await index.record_coverage("testuser", NOW - timedelta(days=4), NOW)
+
+        posts = await index.search("testuser", since=NOW - timedelta(days=2))
+        coverage = await index.get_coverage("testuser")
+
+        assert [post.id for post in posts] == ["0", "1", "2"]
+        assert coverage.newest_id == "0"
+        assert (await index.get_author("testuser")).username == "testuser"
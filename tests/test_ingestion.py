@@ -0,0 +1,134 @@
+"""Tests for the background ingestion service."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from discord_bot.ingestion import DEFAULT_INTERVAL, IngestionService
+
+def make_client(posts_per_account=2):
+    """Create a client whose refreshes return a few posts per account."""
+    client = MagicMock()
+
+    async def refresh_accounts(usernames, limit):
+        return {username: MagicMock(posts=[MagicMock()] * posts_per_account) for username in usernames}
+
+    client.refresh_accounts = AsyncMock(side_effect=refresh_accounts)
+    return client
+
+@pytest.mark.asyncio
+async def test_tracked_accounts_expire(clock):
+    """Test an account asked about is only ingested for a while."""
+    service = IngestionService(make_client(), track_for=60, clock=clock)
+    service.track("Alice")
+
+    assert await service.accounts() == ["alice"]
+    clock.now += 61
+    assert await service.accounts() == []
+
+@pytest.mark.asyncio
+async def test_sources_are_merged_with_tracked_accounts():
+    """Test accounts from sources and requests are combined without duplicates."""
+    service = IngestionService(make_client())
+    source = AsyncMock(return_value=["Bob", "alice"])
+    service.add_source(source)
+    service.track("alice")
+
+    assert await service.accounts() == ["alice", "bob"]
+
+    service.remove_source(source)
+    assert await service.accounts() == ["alice"]
+
+@pytest.mark.asyncio
+async def test_excluded_accounts_are_skipped():
+    """Test accounts another component already fetches are not ingested again."""
+    client = make_client()
+    service = IngestionService(client)
+    exclusion = AsyncMock(return_value=["Alice"])
+    service.add_exclusion(exclusion)
+    service.track("alice")
+    service.track("bob")
+
+    await service.run_once()
+
+    client.refresh_accounts.assert_awaited_once_with(["bob"], 20)
+    service.remove_exclusion(exclusion)
+    assert await service.accounts() == ["alice", "bob"]
+
+def test_settings_from_env():
+    """Test the interval and tracking window come from the environment, defaulting above the cache TTL."""
+    assert IngestionService.from_env(make_client()).interval == DEFAULT_INTERVAL >= 300
+
+    with patch.dict('os.environ', {'INGESTION_INTERVAL': '1800', 'INGESTION_TRACK_FOR': '3600'}):
+        service = IngestionService.from_env(make_client())
+
+    assert service.interval == 1800
+    assert service.track_for == 3600
+
+@pytest.mark.asyncio
+async def test_failing_source_is_skipped():
+    """Test a source that raises does not stop ingestion of the others."""
+    service = IngestionService(make_client())
+    service.add_source(AsyncMock(side_effect=Exception("Database error")))
+    service.track("alice")
+
+    assert await service.accounts() == ["alice"]
+
+@pytest.mark.asyncio
+async def test_run_once_batches_accounts():
+    """Test accounts are refreshed a batch per actor run."""
+    client = make_client()
+    service = IngestionService(client, batch_size=2, limit=15)
+    for username in ["a", "b", "c"]:
+        service.track(username)
+
+    ingested = await service.run_once()
+
+    assert ingested == 6
+    assert [call.args for call in client.refresh_accounts.call_args_list] == [
+        (["a", "b"], 15), (["c"], 15)
+    ]
+
+@pytest.mark.asyncio
+async def test_run_once_counts_failed_batches():
+    """Test a failed batch is counted and the remaining batches still run."""
+    client = make_client()
+    client.refresh_accounts.side_effect = [Exception("Actor failed"), {"c": MagicMock(posts=[MagicMock()])}]
+    service = IngestionService(client, batch_size=2)
+    for username in ["a", "b", "c"]:
+        service.track(username)
+
+    await service.run_once()
+
+    stats = service.stats()
+    assert stats.runs == 1
+    assert stats.batches == 1
+    assert stats.failures == 1
+    assert stats.accounts == 3
+    assert stats.posts_ingested == 1
+
+@pytest.mark.asyncio
+async def test_start_with_delay_waits_before_first_run():
+    """Test a delayed start does not ingest until the delay has passed."""
+    client = make_client()
+    service = IngestionService(client, interval=3600)
+    service.track("alice")
+
+    service.start(delay=3600)
+    await asyncio.sleep(0.01)
+    await service.close()
+
+    client.refresh_accounts.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_start_and_close():
+    """Test the background task runs and stops cleanly."""
+    client = make_client()
+    service = IngestionService(client, interval=3600)
+    service.track("alice")
+
+    service.start()
+    await asyncio.sleep(0.01)
+    await service.close()
+
+    client.refresh_accounts.assert_called_once()
+    assert service._task is None
@@ -0,0 +1,112 @@
+"""Tests for the keyword matcher."""
+
+import time
+from types import SimpleNamespace
+import pytest
+from truth_social.matcher import MAX_QUERY_LENGTH, KeywordMatcher, compile_query
+
+def test_matches_any_keyword_case_insensitively():
+    """Test text matches when it contains any included keyword."""
+    matcher = KeywordMatcher(["Election", "fraud"])
+
+    assert matcher.matches("The ELECTION is coming")
+    assert matcher.matches("claims of fraud")
+    assert not matcher.matches("Nothing to see here")
+
+def test_phrases_match_across_whitespace():
+    """Test phrases match as a unit, whatever whitespace separates the words."""
+    matcher = KeywordMatcher(["make america great"])
+
+    assert matcher.matches("We will MAKE  America\ngreat again")
+    assert not matcher.matches("make great america")
+
+def test_whole_word_mode():
+    """Test whole-word mode ignores keywords embedded in other words."""
+    substring = KeywordMatcher(["war"])
+    whole_word = KeywordMatcher(["war"], whole_word=True)
+
+    assert substring.matches("new software release")
+    assert not whole_word.matches("new software release")
+    assert whole_word.matches("the trade war, again")
+
+def test_whole_word_prefers_longest_term():
+    """Test a shorter keyword does not hide a longer one it prefixes."""
+    matcher = KeywordMatcher(["war", "warfare"], whole_word=True)
+
+    assert matcher.matches("modern warfare")
+    assert matcher.matches("at war")
+    assert not matcher.matches("warfarer")
+
+def test_negation_excludes_posts():
+    """Test excluded keywords veto a match."""
+    matcher = KeywordMatcher(["election"], exclude=["poll"])
+
+    assert matcher.matches("election day")
+    assert not matcher.matches("election poll numbers")
+
+def test_exclude_only_matches_everything_else():
+    """Test a query with only exclusions matches text without them."""
+    matcher = KeywordMatcher(exclude=["poll"])
+
+    assert matcher.matches("anything at all")
+    assert not matcher.matches("new poll")
+
+def test_parse_query_syntax():
+    """Test comma-separated terms, quoted phrases and - negation are parsed."""
+    matcher = KeywordMatcher.parse('Election, "voter id" , -Poll, ,')
+
+    assert matcher.include == ("election", "voter id")
+    assert matcher.exclude == ("poll",)
+
+def test_empty_matcher_matches_everything():
+    """Test a matcher with no terms is falsy and lets everything through."""
+    matcher = KeywordMatcher.parse(" , ")
+
+    assert not matcher
+    assert matcher.matches("anything")
+
+def test_special_characters_are_literal():
+    """Test regex metacharacters in keywords are matched literally."""
+    matcher = KeywordMatcher(["c++", "$5.00"])
+
+    assert matcher.matches("I code in C++")
+    assert matcher.matches("only $5.00")
+    assert not matcher.matches("only $5x00")
+
+def test_filter_keeps_order():
+    """Test filtering posts keeps their original order."""
+    posts = [SimpleNamespace(content=text) for text in ["a tax", "b", "c TAX"]]
+
+    assert KeywordMatcher(["tax"]).filter(posts) == [posts[0], posts[2]]
+
+def test_compile_query_is_cached():
+    """Test repeated queries reuse the compiled matcher."""
+    assert compile_query("election, -poll") is compile_query("election, -poll")
+
+def test_cost_does_not_scale_with_keyword_count():
+    """Test 100x more keywords does not make matching 100x slower."""
+    text = "lorem keynote ipsum keyword dolor sit amet " * 50
+    few = KeywordMatcher([f"keyword{i}x" for i in range(20)])
+    many = KeywordMatcher([f"keyword{i}x" for i in range(2000)])
+
+    def timed(matcher):
+        start = time.perf_counter()
+        for _ in range(200):
+            matcher.matches(text)
+        return time.perf_counter() - start
+
+    assert not many.matches(text)
+    assert timed(many) < timed(few) * 10 + 0.01
+
+def test_long_terms_compile_without_recursion():
+    """Test a term far longer than the recursion limit still compiles and matches."""
+    term = "x" * 5000
+
+    assert KeywordMatcher([term]).matches(f"a {term} b")
+    assert not KeywordMatcher([term]).matches("x" * 4999)
+
+def test_compile_query_caps_length():
+    """Test overly long queries are refused."""
+    assert compile_query("x" * MAX_QUERY_LENGTH)
+    with pytest.raises(ValueError):
+        compile_query("x" * (MAX_QUERY_LENGTH + 1))
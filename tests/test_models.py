@@ -0,0 +1,63 @@
+"""Tests for the Truth Social data models."""
+
+import dataclasses
+import pytest
+from datetime import datetime, timezone
+from truth_social.models import Post, PostList, ProfileInterner, UserProfile
+
+def make_profile(**overrides):
+    values = dict(
+        username="testuser",
+        display_name="Test User",
+        bio="Test bio",
+        followers_count=100,
+        following_count=50,
+        posts_count=10,
+        created_at=datetime(2022, 1, 1, tzinfo=timezone.utc),
+        is_verified=True
+    )
+    values.update(overrides)
+    return UserProfile(**values)
+
+def make_post(author=None):
+    return Post(
+        id="1",
+        content="Test post",
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        likes_count=10,
+        replies_count=5,
+        reposts_count=2,
+        user=author
+    )
+
+def test_models_are_slotted():
+    """Test models carry no per-instance __dict__."""
+    for model in (make_profile(), make_post(), PostList(posts=[])):
+        assert not hasattr(model, "__dict__")
+
+def test_profiles_are_frozen():
+    """Test a shared profile cannot be changed through one of its posts."""
+    post = make_post(make_profile())
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        post.user.bio = "Edited"
+    assert dataclasses.replace(post.user, bio="Edited").bio == "Edited"
+
+def test_interner_shares_equal_profiles():
+    """Test equal profiles collapse to the first instance seen."""
+    interner = ProfileInterner()
+    first = interner.intern(make_profile())
+
+    assert interner.intern(make_profile()) is first
+    assert interner.intern(make_profile(username="TestUser")) is not first
+    assert len(interner) == 1
+
+def test_interner_replaces_changed_profile():
+    """Test a changed profile replaces the stored one for that account."""
+    interner = ProfileInterner()
+    interner.intern(make_profile())
+
+    updated = interner.intern(make_profile(followers_count=101))
+
+    assert interner.intern(make_profile(followers_count=101)) is updated
+    assert len(interner) == 1
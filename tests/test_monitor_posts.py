@@ -1,11 +1,13 @@
 """Tests for the monitor_posts command."""
 
+import asyncio
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime, timezone
 import discord
 from discord.ext import commands
 from discord_bot.commands.monitor_posts import MonitorPostsCommand
+from discord_bot.database import AsyncDatabase
 
 @pytest.fixture
 def mock_bot():
@@ -18,8 +20,9 @@ def mock_bot():
 @pytest.fixture
 def mock_db():
     """Create a mock database instance."""
-    with patch('discord_bot.commands.monitor_posts.Database') as mock_db_class:
-        db = MagicMock()
+    with patch('discord_bot.commands.monitor_posts.AsyncDatabase') as mock_db_class:
+        db = AsyncMock()
+        db.get_seen_posts.return_value = set()
         mock_db_class.return_value = db
         yield db
 
@@ -42,14 +45,16 @@ async def test_monitor_posts_start(command, mock_db):
     
     # Configure mock database
     mock_db.is_monitoring_active.return_value = False
-    mock_db.add_monitoring_config = MagicMock()
+    mock_db.add_monitoring_config = AsyncMock()
     
     # Test the command
     await command.monitor_posts(command, ctx, "test_user", "test_keyword")
     
     # Verify database calls
     mock_db.is_monitoring_active.assert_called_once()
-    mock_db.add_monitoring_config.assert_called_once_with("test_user", "test_keyword")
+    mock_db.add_monitoring_config.assert_called_once_with(
+        "test_user", "test_keyword", ctx.guild.id, ctx.channel.id
+    )
     
     # Verify monitoring task was created
     command.bot.loop.create_task.assert_called_once()
@@ -60,6 +65,26 @@ async def test_monitor_posts_start(command, mock_db):
     assert "Started monitoring posts from @test_user" in success_msg
     assert "test_keyword" in success_msg
 
+@pytest.mark.asyncio
+async def test_saved_watches_resume_when_cog_loads(command, mock_db):
+    """Test watches saved before a restart are checked without anyone adding a new one."""
+    command.bot.loop = asyncio.get_running_loop()
+    mock_db.get_active_configs.return_value = [{
+        'id': 1, 'channel_id': 10, 'username': 'test_user', 'filter_keyword': 'alpha',
+        'last_post_id': None, 'post_cursor': '100'
+    }]
+    command.client = MagicMock()
+    command.client.refresh_accounts = AsyncMock(
+        return_value={'test_user': MagicMock(posts=[], next_cursor=None)}
+    )
+    
+    with patch('discord_bot.scheduler.random.random', return_value=0.0):
+        await command.cog_load()
+        await asyncio.sleep(0.05)
+    
+    command.client.refresh_accounts.assert_awaited_once_with(['test_user'])
+    await command.cog_unload()
+
 @pytest.mark.asyncio
 async def test_monitor_posts_already_active(command, mock_db):
     """Test starting monitoring when it's already active."""
@@ -84,6 +109,17 @@ async def test_monitor_posts_already_active(command, mock_db):
     error_msg = ctx.send.call_args[0][0]
     assert "Monitoring is already active" in error_msg
 
+@pytest.mark.asyncio
+async def test_monitor_posts_rejects_long_keyword(command, mock_db):
+    """Test keywords too long to compile are refused up front."""
+    ctx = AsyncMock()
+    ctx.send = AsyncMock()
+    
+    await command.monitor_posts(command, ctx, "test_user", "x" * 500)
+    
+    mock_db.add_monitoring_config.assert_not_called()
+    assert "at most" in ctx.send.call_args[0][0]
+
 @pytest.mark.asyncio
 async def test_stop_monitoring(command, mock_db):
     """Test stopping post monitoring."""
@@ -93,7 +129,7 @@ async def test_stop_monitoring(command, mock_db):
     
     # Configure mock database
     mock_db.is_monitoring_active.return_value = True
-    mock_db.deactivate_monitoring = MagicMock()
+    mock_db.deactivate_monitoring = AsyncMock()
     
     # Test the command
     await command.stop_monitoring(command, ctx)
@@ -146,13 +182,15 @@ async def test_monitoring_status_active(command, mock_db):
     }
     
     # Configure mock database
-    mock_db.get_monitoring_config.return_value = mock_config
+    mock_db.get_active_configs.return_value = [mock_config]
     
     # Test the command
     await command.monitoring_status(command, ctx)
     
     # Verify database call
-    mock_db.get_monitoring_config.assert_called_once()
+    mock_db.get_active_configs.assert_called_once_with(
+        guild_id=ctx.guild.id, channel_id=ctx.channel.id
+    )
     
     # Verify embed was sent
     ctx.send.assert_called_once()
@@ -176,13 +214,13 @@ async def test_monitoring_status_no_config(command, mock_db):
     ctx.send = AsyncMock()
     
     # Configure mock database to return no config
-    mock_db.get_monitoring_config.return_value = None
+    mock_db.get_active_configs.return_value = []
     
     # Test the command
     await command.monitoring_status(command, ctx)
     
     # Verify database call
-    mock_db.get_monitoring_config.assert_called_once()
+    mock_db.get_active_configs.assert_called_once()
     
     # Verify error message
     ctx.send.assert_called_once()
@@ -193,18 +231,22 @@ async def test_monitoring_status_no_config(command, mock_db):
 async def test_check_for_new_posts(command, mock_db):
     """Test the background task for checking new posts."""
     # Mock the sleep function to avoid infinite loop
-    with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+    # New watches are first due at a random offset; make it zero so they run on the first tick
+    with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+         patch('discord_bot.scheduler.random.random', return_value=0.0):
         # Configure mock sleep to raise exception after first iteration
         mock_sleep.side_effect = [None, Exception("Stop loop")]
         
         # Configure mock database
-        mock_db.is_monitoring_active.return_value = True
         mock_config = {
+            'id': 1,
+            'channel_id': 42,
             'username': 'test_user',
             'filter_keyword': 'test_keyword',
-            'last_post_id': None
+            'last_post_id': None,
+            'post_cursor': '100'
         }
-        mock_db.get_monitoring_config.return_value = mock_config
+        mock_db.get_active_configs.return_value = [mock_config]
         
         # Mock the Truth Social client
         mock_post = MagicMock()
@@ -218,12 +260,13 @@ async def test_check_for_new_posts(command, mock_db):
         mock_post.reposts_count = 3
         
         command.client = MagicMock()
-        command.client.get_user_posts = AsyncMock()
-        command.client.get_user_posts.return_value.posts = [mock_post]
+        command.client.refresh_accounts = AsyncMock(
+            return_value={'test_user': MagicMock(posts=[mock_post], next_cursor='123')}
+        )
         
-        # Mock bot channels
+        # Mock the subscribed channel
         mock_channel = AsyncMock(spec=discord.TextChannel)  # Specify it's a TextChannel
-        command.bot.get_all_channels.return_value = [mock_channel]
+        command.bot.get_channel.return_value = mock_channel
         
         try:
             # Run the background task
@@ -232,13 +275,263 @@ async def test_check_for_new_posts(command, mock_db):
             assert str(e) == "Stop loop"
         
         # Verify database calls
-        mock_db.is_monitoring_active.assert_called()
-        mock_db.get_monitoring_config.assert_called()
+        mock_db.get_active_configs.assert_called()
         
-        # Verify post was sent to channel
+        # Verify post was sent to the subscribed channel
+        command.bot.get_channel.assert_called_with(42)
         mock_channel.send.assert_called()
         call_kwargs = mock_channel.send.call_args.kwargs
         embed = call_kwargs['embed']
         assert isinstance(embed, discord.Embed)
         assert embed.title == "New post by Test Author"
-        assert "test_keyword" in embed.description 
\ No newline at end of file
+        assert "test_keyword" in embed.description 
+
+@pytest.mark.asyncio
+async def test_check_for_new_posts_uses_cursor(command, mock_db):
+    """Test the monitor fetches incrementally and stores the new cursor."""
+    # New watches are first due at a random offset; make it zero so they run on the first tick
+    with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+         patch('discord_bot.scheduler.random.random', return_value=0.0):
+        mock_sleep.side_effect = [Exception("Stop loop")]
+        
+        mock_db.get_active_configs.return_value = [{
+            'id': 1,
+            'username': 'test_user',
+            'filter_keyword': 'test_keyword',
+            'last_post_id': None,
+            'post_cursor': '100'
+        }]
+        
+        command.client = MagicMock()
+        command.client.refresh_accounts = AsyncMock(
+            return_value={'test_user': MagicMock(posts=[], next_cursor='105')}
+        )
+        
+        try:
+            await command._check_for_new_posts()
+        except Exception as e:
+            assert str(e) == "Stop loop"
+        
+        command.client.refresh_accounts.assert_called_once_with(['test_user'])
+        mock_db.update_post_cursor.assert_called_once_with('105', 1)
+
+@pytest.mark.asyncio
+async def test_cog_unload_closes_database(command, mock_db):
+    """Test unloading the cog stops monitoring and closes the database."""
+    task = MagicMock()
+    command._monitoring_task = task
+    
+    await command.cog_unload()
+    
+    task.cancel.assert_called_once()
+    mock_db.close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_monitor_posts_second_account_in_channel(command, mock_db):
+    """Test a channel can watch another account while one is active."""
+    ctx = AsyncMock()
+    ctx.send = AsyncMock()
+    mock_db.is_monitoring_active.return_value = False
+    
+    await command.monitor_posts(command, ctx, "@other_user", "other_keyword")
+    
+    mock_db.is_monitoring_active.assert_called_once_with(
+        "other_user", ctx.guild.id, ctx.channel.id
+    )
+    mock_db.add_monitoring_config.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_stop_monitoring_single_account(command, mock_db):
+    """Test stopping one account's watch in the current channel."""
+    ctx = AsyncMock()
+    ctx.send = AsyncMock()
+    mock_db.is_monitoring_active.return_value = True
+    
+    await command.stop_monitoring(command, ctx, "@test_user")
+    
+    mock_db.deactivate_monitoring.assert_called_once_with(
+        guild_id=ctx.guild.id, channel_id=ctx.channel.id, username="test_user"
+    )
+
+@pytest.mark.asyncio
+async def test_monitoring_status_multiple_watches(command, mock_db):
+    """Test the status lists every watch in the channel."""
+    ctx = AsyncMock()
+    ctx.send = AsyncMock()
+    mock_db.get_active_configs.return_value = [
+        {'username': 'user1', 'filter_keyword': 'keyword1', 'last_checked_timestamp': None},
+        {'username': 'user2', 'filter_keyword': 'keyword2', 'last_checked_timestamp': None}
+    ]
+    
+    await command.monitoring_status(command, ctx)
+    
+    embed = ctx.send.call_args.kwargs['embed']
+    field_names = [field.name for field in embed.fields]
+    assert field_names == ["@user1", "@user2"]
+
+@pytest.mark.asyncio
+async def test_check_for_new_posts_checks_every_watch(command, mock_db):
+    """Test each active watch is fetched on a tick."""
+    # New watches are first due at a random offset; make it zero so they run on the first tick
+    with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+         patch('discord_bot.scheduler.random.random', return_value=0.0):
+        mock_sleep.side_effect = [Exception("Stop loop")]
+        mock_db.get_active_configs.return_value = [
+            {'id': 1, 'username': 'user1', 'filter_keyword': 'a', 'last_post_id': None},
+            {'id': 2, 'username': 'user2', 'filter_keyword': 'b', 'last_post_id': None}
+        ]
+        
+        command.client = MagicMock()
+        command.client.refresh_accounts = AsyncMock(return_value={
+            'user1': MagicMock(posts=[], next_cursor=None),
+            'user2': MagicMock(posts=[], next_cursor=None)
+        })
+        
+        try:
+            await command._check_for_new_posts()
+        except Exception as e:
+            assert str(e) == "Stop loop"
+        
+        # Every due account is fetched in a single batched run
+        command.client.refresh_accounts.assert_called_once_with(['user1', 'user2'])
+
+@pytest.mark.asyncio
+async def test_check_group_fetches_once_for_shared_username(command, mock_db):
+    """Test watches on one account share a fetch from the oldest cursor."""
+    post_old = MagicMock(id="101", content="alpha beta", created_at=datetime.now(timezone.utc))
+    post_new = MagicMock(id="105", content="alpha beta", created_at=datetime.now(timezone.utc))
+    
+    command.client = MagicMock()
+    command.client.get_user_posts = AsyncMock()
+    command.client.get_user_posts.return_value.posts = [post_new, post_old]
+    command.client.get_user_posts.return_value.next_cursor = "105"
+    
+    channel = AsyncMock(spec=discord.TextChannel)
+    command.bot.get_channel.return_value = channel
+    
+    configs = [
+        {'id': 1, 'channel_id': 10, 'username': 'test_user', 'filter_keyword': 'alpha',
+         'last_post_id': None, 'post_cursor': '100'},
+        {'id': 2, 'channel_id': 10, 'username': 'test_user', 'filter_keyword': 'beta',
+         'last_post_id': None, 'post_cursor': '103'}
+    ]
+    
+    await command._check_group('test_user', configs)
+    
+    command.client.get_user_posts.assert_called_once_with('test_user', since_id='100')
+    # Watch 1 gets both posts, watch 2 only the one past its cursor
+    delivered = []
+    for call in channel.send.call_args_list:
+        delivered.extend(call.kwargs.get('embeds') or [call.kwargs['embed']])
+    assert len(delivered) == 3
+    mock_db.update_post_cursor.assert_any_call('105', 1)
+    mock_db.update_post_cursor.assert_any_call('105', 2)
+
+@pytest.mark.asyncio
+async def test_notifications_only_go_to_subscribed_channels(command, mock_db):
+    """Test each watch notifies its own channel and nothing else."""
+    post = MagicMock(id="101", content="alpha", created_at=datetime.now(timezone.utc))
+    command.client = MagicMock()
+    command.client.get_user_posts = AsyncMock()
+    command.client.get_user_posts.return_value.posts = [post]
+    command.client.get_user_posts.return_value.next_cursor = "101"
+    
+    channels = {10: AsyncMock(spec=discord.TextChannel), 20: AsyncMock(spec=discord.TextChannel)}
+    other_channel = AsyncMock(spec=discord.TextChannel)
+    command.bot.get_channel.side_effect = channels.get
+    command.bot.get_all_channels.return_value = [*channels.values(), other_channel]
+    
+    configs = [
+        {'id': 1, 'channel_id': 10, 'username': 'test_user', 'filter_keyword': 'alpha',
+         'last_post_id': None, 'post_cursor': '100'},
+        {'id': 2, 'channel_id': 20, 'username': 'test_user', 'filter_keyword': 'alpha',
+         'last_post_id': None, 'post_cursor': '100'}
+    ]
+    
+    await command._check_group('test_user', configs)
+    
+    channels[10].send.assert_called_once()
+    channels[20].send.assert_called_once()
+    other_channel.send.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_already_delivered_posts_are_not_resent(command, mock_db):
+    """Test posts in a watch's seen set are never notified twice."""
+    old = MagicMock(id="101", content="alpha", created_at=datetime.now(timezone.utc))
+    new = MagicMock(id="102", content="alpha", created_at=datetime.now(timezone.utc))
+    command.client = MagicMock()
+    command.client.get_user_posts = AsyncMock()
+    command.client.get_user_posts.return_value.posts = [new, old, new]
+    command.client.get_user_posts.return_value.next_cursor = "102"
+    mock_db.get_seen_posts.return_value = {"101"}
+    
+    channel = AsyncMock(spec=discord.TextChannel)
+    command.bot.get_channel.return_value = channel
+    config = {'id': 1, 'channel_id': 10, 'username': 'test_user',
+              'filter_keyword': 'alpha', 'last_post_id': None, 'post_cursor': '100'}
+    
+    await command._check_watch(config, command.client.get_user_posts.return_value)
+    
+    channel.send.assert_called_once()
+    assert channel.send.call_args.kwargs['embed'].description == "alpha"
+    mock_db.get_seen_posts.assert_called_once_with(1, ["102", "101"])
+    mock_db.mark_posts_seen.assert_called_once_with(1, ["102"])
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_retried_next_cycle(command, tmp_path):
+    """Test posts that could not be delivered are neither marked seen nor skipped by the cursor."""
+    post = MagicMock(id="102", content="alpha", created_at=datetime.now(timezone.utc))
+    command.client = MagicMock()
+    command.client.get_user_posts = AsyncMock(return_value=MagicMock(posts=[post], next_cursor="102"))
+    command.notifier.send = AsyncMock(side_effect=[False, True])
+    command.db = AsyncDatabase(str(tmp_path / "monitoring.db"))
+    config_id = await command.db.add_monitoring_config("test_user", "alpha", 1, 10)
+    await command.db.update_post_cursor("101", config_id)
+    
+    await command._check_group("test_user", await command.db.get_active_configs())
+    
+    config = (await command.db.get_active_configs())[0]
+    assert config['post_cursor'] == "101"
+    assert await command.db.get_seen_posts(config_id, ["102"]) == set()
+    
+    await command._check_group("test_user", [config])
+    
+    assert command.notifier.send.await_count == 2
+    assert command.client.get_user_posts.await_args.kwargs['since_id'] == "101"
+    assert (await command.db.get_active_configs())[0]['post_cursor'] == "102"
+    assert await command.db.get_seen_posts(config_id, ["102"]) == {"102"}
+    await command.db.close()
+
+@pytest.mark.asyncio
+async def test_first_check_sets_baseline_without_delivering(command, mock_db):
+    """Test a new watch doesn't announce posts made before it was created."""
+    post = MagicMock(id="101", content="alpha", created_at=datetime.now(timezone.utc))
+    channel = AsyncMock(spec=discord.TextChannel)
+    command.bot.get_channel.return_value = channel
+    config = {'id': 1, 'channel_id': 10, 'username': 'test_user',
+              'filter_keyword': 'alpha', 'last_post_id': None, 'post_cursor': None}
+    
+    await command._check_watch(config, MagicMock(posts=[post], next_cursor="101"))
+    await command._check_watch(config, MagicMock(posts=[], next_cursor=None))
+    
+    channel.send.assert_not_called()
+    mock_db.mark_posts_seen.assert_not_called()
+    assert mock_db.update_post_cursor.call_args_list[0].args == ("101", 1)
+    # An account with no posts yet still gets a baseline every later post passes
+    assert mock_db.update_post_cursor.call_args_list[1].args == ("0", 1)
+
+@pytest.mark.asyncio
+async def test_high_water_mark_only_moves_forward(command, mock_db):
+    """Test a shared fetch from an older cursor never rewinds a watch."""
+    post = MagicMock(id="103", content="alpha", created_at=datetime.now(timezone.utc))
+    posts = MagicMock(posts=[post], next_cursor="103")
+    channel = AsyncMock(spec=discord.TextChannel)
+    command.bot.get_channel.return_value = channel
+    config = {'id': 1, 'channel_id': 10, 'username': 'test_user',
+              'filter_keyword': 'alpha', 'last_post_id': None, 'post_cursor': '1000'}
+    
+    await command._check_watch(config, posts)
+    
+    channel.send.assert_not_called()
+    mock_db.get_seen_posts.assert_not_called()
+    mock_db.update_post_cursor.assert_not_called()
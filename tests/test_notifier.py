@@ -0,0 +1,122 @@
+"""Tests for targeted notification delivery."""
+
+import asyncio
+import pytest
+import discord
+from unittest.mock import AsyncMock, MagicMock
+from discord_bot.notifier import Notifier
+from discord_bot.outbound import OutboundQueue
+
+class SlowChannel:
+    """Channel whose sends take a while and track overlap."""
+
+    def __init__(self, tracker, delay=0.05):
+        self.tracker = tracker
+        self.delay = delay
+        self.sent = []
+
+    async def send(self, embed=None, embeds=None):
+        self.tracker['running'] += 1
+        self.tracker['peak'] = max(self.tracker['peak'], self.tracker['running'])
+        self.tracker['channel_running'][id(self)] = self.tracker['channel_running'].get(id(self), 0) + 1
+        self.tracker['channel_peak'] = max(self.tracker['channel_peak'], self.tracker['channel_running'][id(self)])
+        await asyncio.sleep(self.delay)
+        self.tracker['channel_running'][id(self)] -= 1
+        self.tracker['running'] -= 1
+        self.sent.extend(embeds or [embed])
+
+def make_tracker():
+    return {'running': 0, 'peak': 0, 'channel_running': {}, 'channel_peak': 0}
+
+@pytest.mark.asyncio
+async def test_send_to_cached_channel():
+    """Test an embed is sent to the resolved channel."""
+    bot = MagicMock()
+    channel = AsyncMock()
+    bot.get_channel.return_value = channel
+    notifier = Notifier(bot)
+    embed = discord.Embed(title="New post")
+
+    assert await notifier.send(42, embed) is True
+
+    bot.get_channel.assert_called_once_with(42)
+    channel.send.assert_called_once_with(embed=embed)
+    assert notifier.sent == 1
+
+@pytest.mark.asyncio
+async def test_send_fetches_uncached_channel():
+    """Test channels missing from the cache are fetched from the API."""
+    bot = MagicMock()
+    bot.get_channel.return_value = None
+    channel = AsyncMock()
+    bot.fetch_channel = AsyncMock(return_value=channel)
+    notifier = Notifier(bot)
+
+    assert await notifier.send(42, discord.Embed()) is True
+    channel.send.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_send_without_channel_is_skipped():
+    """Test watches without a recorded channel are not delivered anywhere."""
+    bot = MagicMock()
+    notifier = Notifier(bot)
+
+    assert await notifier.send(None, discord.Embed()) is False
+    bot.get_channel.assert_not_called()
+    assert notifier.failed == 1
+
+@pytest.mark.asyncio
+async def test_send_failure_is_contained():
+    """Test HTTP errors are counted instead of raised."""
+    bot = MagicMock()
+    channel = AsyncMock()
+    response = MagicMock(status=403, reason="Forbidden")
+    channel.send.side_effect = discord.Forbidden(response, "Missing Access")
+    bot.get_channel.return_value = channel
+    notifier = Notifier(bot)
+
+    assert await notifier.send(42, discord.Embed()) is False
+    assert notifier.failed == 1
+
+@pytest.mark.asyncio
+async def test_sends_run_concurrently_across_channels_but_bounded():
+    """Test different channels are sent to in parallel up to the limit."""
+    tracker = make_tracker()
+    channels = {i: SlowChannel(tracker) for i in range(10)}
+    bot = MagicMock()
+    bot.get_channel.side_effect = channels.get
+    notifier = Notifier(bot, OutboundQueue(max_concurrency=4))
+
+    await asyncio.gather(*(notifier.send(i, discord.Embed()) for i in range(10)))
+
+    assert tracker['peak'] == 4
+    assert all(len(channel.sent) == 1 for channel in channels.values())
+
+@pytest.mark.asyncio
+async def test_sends_to_one_channel_are_serialized_in_order():
+    """Test a single channel never has two sends in flight."""
+    tracker = make_tracker()
+    channel = SlowChannel(tracker, delay=0.01)
+    bot = MagicMock()
+    bot.get_channel.return_value = channel
+    notifier = Notifier(bot, OutboundQueue(max_concurrency=4))
+    embeds = [discord.Embed(title=str(i)) for i in range(5)]
+
+    await asyncio.gather(*(notifier.send(42, embed) for embed in embeds))
+
+    assert tracker['channel_peak'] == 1
+    assert channel.sent == embeds
+
+@pytest.mark.asyncio
+async def test_send_batches_embeds_into_one_message():
+    """Test several notifications for one channel go out as one message."""
+    bot = MagicMock()
+    channel = AsyncMock()
+    bot.get_channel.return_value = channel
+    notifier = Notifier(bot, OutboundQueue())
+    embeds = [discord.Embed(title=str(i)) for i in range(3)]
+
+    assert await notifier.send(42, *embeds) is True
+
+    channel.send.assert_called_once_with(embeds=embeds)
+    assert notifier.sent == 3
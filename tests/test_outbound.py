@@ -0,0 +1,203 @@
+"""Tests for the outbound message queue."""
+
+import asyncio
+import pytest
+import discord
+from unittest.mock import AsyncMock, MagicMock, patch
+from discord_bot.outbound import (
+    OutboundQueue, get_outbound_queue, MAX_EMBED_CHARS_PER_MESSAGE, MAX_EMBEDS_PER_MESSAGE
+)
+
+class RecordingChannel:
+    """Channel that records each message's embeds."""
+
+    def __init__(self, channel_id, delay=0):
+        self.id = channel_id
+        self.delay = delay
+        self.messages = []
+
+    async def send(self, embed=None, embeds=None):
+        await asyncio.sleep(self.delay)
+        self.messages.append(embeds or [embed])
+
+def make_embeds(count):
+    return [discord.Embed(title=str(i)) for i in range(count)]
+
+@pytest.mark.asyncio
+async def test_single_embed_sent_as_embed():
+    """Test a lone embed is sent with the embed keyword."""
+    queue = OutboundQueue()
+    channel = AsyncMock()
+    embed = discord.Embed(title="Post")
+
+    await queue.send(channel, [embed])
+
+    channel.send.assert_called_once_with(embed=embed)
+
+@pytest.mark.asyncio
+async def test_empty_send_is_noop():
+    """Test nothing is sent when there are no embeds."""
+    queue = OutboundQueue()
+    channel = AsyncMock()
+
+    await queue.send(channel, [])
+
+    channel.send.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_embeds_coalesced_into_messages_of_ten():
+    """Test embeds are batched up to Discord's per-message limit."""
+    queue = OutboundQueue()
+    channel = RecordingChannel(1)
+    embeds = make_embeds(25)
+
+    await queue.send(channel, embeds)
+
+    assert [len(message) for message in channel.messages] == [10, 10, 5]
+    assert [embed for message in channel.messages for embed in message] == embeds
+    assert all(len(message) <= MAX_EMBEDS_PER_MESSAGE for message in channel.messages)
+
+@pytest.mark.asyncio
+async def test_messages_stay_under_embed_text_limit():
+    """Test long embeds are split so no message holds more than 6000 characters of text."""
+    queue = OutboundQueue()
+    channel = RecordingChannel(1)
+    embeds = []
+    for i in range(10):
+        embed = discord.Embed(title=f"New post by author {i}", description="x" * 1000)
+        embed.add_field(name="Likes", value=10)
+        embed.set_footer(text="Matching keyword: x")
+        embeds.append(embed)
+
+    await queue.send(channel, embeds)
+
+    assert len(channel.messages) > 1
+    assert all(sum(len(embed) for embed in message) <= MAX_EMBED_CHARS_PER_MESSAGE
+               for message in channel.messages)
+    assert [embed for message in channel.messages for embed in message] == embeds
+
+@pytest.mark.asyncio
+async def test_concurrent_senders_share_a_message():
+    """Test embeds queued for one channel by several callers are merged."""
+    queue = OutboundQueue()
+    channel = RecordingChannel(1, delay=0.01)
+    first, second, third = make_embeds(3)
+
+    await asyncio.gather(
+        queue.send(channel, [first]),
+        queue.send(channel, [second]),
+        queue.send(channel, [third]),
+    )
+
+    assert channel.messages == [[first, second, third]]
+    assert queue.stats().messages_sent == 1
+
+@pytest.mark.asyncio
+async def test_context_and_channel_share_bucket():
+    """Test a command context is paced with the channel it belongs to."""
+    queue = OutboundQueue()
+    channel = RecordingChannel(7)
+    ctx = MagicMock(channel=channel)
+
+    assert queue._bucket_key(ctx) == queue._bucket_key(channel) == 7
+
+@pytest.mark.asyncio
+async def test_channel_is_paced_to_its_rate_limit(clock):
+    """Test a channel waits for its window once the bucket is used up."""
+    queue = OutboundQueue(rate=2, per=5.0, clock=clock)
+    channel = AsyncMock()
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    with patch('asyncio.sleep', fake_sleep):
+        for _ in range(3):
+            await queue.send(channel, make_embeds(1))
+
+    assert channel.send.call_count == 3
+    assert sleeps == [5.0]
+
+@pytest.mark.asyncio
+async def test_channels_are_paced_independently(clock):
+    """Test one channel's bucket does not delay another channel."""
+    queue = OutboundQueue(rate=1, per=5.0, clock=clock)
+    busy, quiet = RecordingChannel(1), RecordingChannel(2)
+
+    await queue.send(busy, make_embeds(1))
+    await asyncio.wait_for(queue.send(quiet, make_embeds(1)), timeout=1)
+
+    assert len(quiet.messages) == 1
+
+@pytest.mark.asyncio
+async def test_send_errors_reach_every_waiter():
+    """Test a failed message raises for each caller whose embeds were in it."""
+    queue = OutboundQueue()
+    channel = AsyncMock()
+    response = MagicMock(status=403, reason="Forbidden")
+    channel.send.side_effect = discord.Forbidden(response, "Missing Access")
+
+    with pytest.raises(discord.Forbidden):
+        await queue.send(channel, make_embeds(3))
+
+    assert queue.stats().failures == 1
+    assert queue.stats().depth == 0
+
+@pytest.mark.asyncio
+async def test_stats_track_depth_and_latency(clock):
+    """Test queue depth and delivery latency are reported."""
+    queue = OutboundQueue(clock=clock)
+    channel = RecordingChannel(1)
+
+    async def slow_send(embed=None, embeds=None):
+        assert queue.stats().depth == 0
+        clock.now += 2.0
+        channel.messages.append(embeds or [embed])
+
+    channel.send = slow_send
+    await queue.send(channel, make_embeds(4))
+
+    stats = queue.stats()
+    assert stats.depth == 0
+    assert stats.messages_sent == 1
+    assert stats.embeds_sent == 4
+    assert stats.avg_latency == pytest.approx(2.0)
+    assert stats.max_latency == pytest.approx(2.0)
+
+@pytest.mark.asyncio
+async def test_close_cancels_workers():
+    """Test closing the queue stops pending channel workers."""
+    queue = OutboundQueue()
+    channel = RecordingChannel(1, delay=10)
+
+    send = asyncio.create_task(queue.send(channel, make_embeds(1)))
+    await asyncio.sleep(0)
+    await queue.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await send
+    assert queue._buckets == {}
+    assert channel.messages == []
+
+@pytest.mark.asyncio
+async def test_close_cancels_message_in_flight():
+    """Test callers waiting on a message that was mid-send are released."""
+    queue = OutboundQueue()
+    channel = RecordingChannel(1, delay=10)
+
+    send = asyncio.create_task(queue.send(channel, make_embeds(1)))
+    await asyncio.sleep(0.01)
+    await queue.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(send, timeout=1)
+
+def test_get_outbound_queue_reuses_bot_queue():
+    """Test the bot-wide queue is created once and then shared."""
+    bot = MagicMock()
+
+    queue = get_outbound_queue(bot)
+
+    assert isinstance(queue, OutboundQueue)
+    assert get_outbound_queue(bot) is queue
@@ -0,0 +1,109 @@
+"""Tests for the dataset item parser."""
+
+import pytest
+from datetime import datetime, timezone
+from truth_social.models import ProfileInterner
+from truth_social.parser import (
+    ItemParser, MalformedItemError, html_to_text, parse_post, parse_profile, parse_timestamp
+)
+
+def make_item(post_id="1", content="Test post content", username="testuser"):
+    """Build a raw dataset item shaped like the scraper's output."""
+    return {
+        'id': post_id,
+        'content': content,
+        'created_at': '2025-01-01T12:00:00+00:00',
+        'favourites_count': 10,
+        'replies_count': 5,
+        'reblogs_count': 2,
+        'reblog': None,
+        'account': {
+            'username': username,
+            'display_name': 'Test User',
+            'note': '<p>Test bio</p>',
+            'followers_count': 100,
+            'following_count': 50,
+            'statuses_count': 10,
+            'created_at': '2022-01-01T00:00:00+00:00',
+            'verified': True
+        }
+    }
+
+def test_parse_timestamp_reuses_results():
+    """Test a timestamp seen before returns the same datetime object."""
+    value = "2025-01-01T12:00:00+00:00"
+
+    first = parse_timestamp(value)
+
+    assert first == datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    assert parse_timestamp(value) is first
+
+@pytest.mark.parametrize("html, text", [
+    ("<p>Test bio</p>", "Test bio"),
+    ("<p>First</p><p>Second</p>", "First\n\nSecond"),
+    ("Line one<br>Line two<br />Line three", "Line one\nLine two\nLine three"),
+    ('<p>Rock &amp; roll <a href="https://example.com">link</a></p>', "Rock & roll link"),
+    ("No markup", "No markup"),
+])
+def test_html_to_text(html, text):
+    """Test bio HTML is converted to readable plain text."""
+    assert html_to_text(html) == text
+
+def test_parse_profile_and_post():
+    """Test a dataset item converts into a post with its author."""
+    item = make_item("7", "Hello")
+
+    author = parse_profile(item['account'])
+    post = parse_post(item, author)
+
+    assert author.bio == "Test bio"
+    assert author.is_verified is True
+    assert post.id == "7"
+    assert post.content == "Hello"
+    assert post.user is author
+    assert post.is_repost is False
+
+def test_missing_field_raises_malformed_item_error():
+    """Test a missing key is reported by name instead of as a bare KeyError."""
+    item = make_item()
+    del item['favourites_count']
+
+    with pytest.raises(MalformedItemError, match="favourites_count"):
+        parse_post(item, None)
+
+def test_invalid_timestamp_raises_malformed_item_error():
+    """Test an unparseable timestamp is reported as malformed."""
+    item = make_item()
+    item['account']['created_at'] = "yesterday"
+
+    with pytest.raises(MalformedItemError, match="invalid field"):
+        parse_profile(item['account'])
+
+def test_parse_items_reports_malformed_items_and_keeps_the_rest():
+    """Test bad items are collected without dropping the batch."""
+    missing_account = make_item("2")
+    del missing_account['account']
+    bad_date = make_item("3")
+    bad_date['created_at'] = None
+    items = [make_item("1"), missing_account, bad_date, "not an item", make_item("5")]
+
+    result = ItemParser().parse_items(items)
+
+    assert [post.id for post in result.posts] == ["1", "5"]
+    assert [(error.index, error.item_id) for error in result.errors] == [
+        (1, "2"), (2, "3"), (3, None)
+    ]
+    assert "account" in result.errors[0].reason
+    assert str(result.errors[2]).startswith("item #3")
+
+def test_parse_items_shares_one_profile_per_account():
+    """Test every post by an account points at one interned profile."""
+    interner = ProfileInterner()
+    items = [make_item("1", username="alice"), make_item("2", username="bob"),
+             make_item("3", username="alice")]
+
+    posts = ItemParser(interner).parse_items(items).posts
+
+    assert posts[0].user is posts[2].user
+    assert posts[1].user.username == "bob"
+    assert len(interner) == 2
@@ -0,0 +1,138 @@
+"""Tests for the shared command rate limiter."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from discord_bot.commands.filter_posts import FilterPostsCommand
+from discord_bot.commands.truth_posts import TruthPostsCommand
+from discord_bot.ratelimit import (
+    Limit, RateLimited, RateLimiter, RateLimits, describe, get_rate_limiter
+)
+from truth_social.models import Served
+
+def make_limiter(clock, user=(Limit(2, 10),), guild=(), global_limits=()):
+    return RateLimiter(commands={"cmd": RateLimits(user=user, guild=guild)},
+                       global_limits=global_limits, clock=clock)
+
+def test_burst_then_refill(clock):
+    """Test a user gets a burst of ``rate`` uses, then one per refill interval."""
+    limiter = make_limiter(clock)
+
+    assert limiter.acquire("cmd", 1) is None
+    assert limiter.acquire("cmd", 1) is None
+    assert limiter.acquire("cmd", 1) == RateLimited("user", 5.0)
+
+    clock.now += 5
+    assert limiter.acquire("cmd", 1) is None
+
+def test_users_and_commands_are_limited_separately(clock):
+    """Test one user's usage does not limit another user or another command."""
+    limiter = make_limiter(clock, user=(Limit(1, 30),))
+
+    assert limiter.acquire("cmd", 1) is None
+    assert limiter.acquire("cmd", 2) is None
+    assert limiter.acquire("other", 1) is None
+    assert limiter.acquire("cmd", 1) is not None
+
+def test_guild_limit_spans_users(clock):
+    """Test a guild-wide limit applies across the users in it."""
+    limiter = make_limiter(clock, user=(Limit(5, 60),), guild=(Limit(2, 60),))
+
+    assert limiter.acquire("cmd", 1, guild_id=10) is None
+    assert limiter.acquire("cmd", 2, guild_id=10) is None
+    limited = limiter.acquire("cmd", 3, guild_id=10)
+
+    assert limited.scope == "guild"
+    assert limiter.acquire("cmd", 3, guild_id=20) is None
+
+def test_global_limit_spans_commands(clock):
+    """Test the bot-wide limit is shared by every command and user."""
+    limiter = make_limiter(clock, user=(), global_limits=(Limit(2, 60),))
+
+    assert limiter.acquire("cmd", 1) is None
+    assert limiter.acquire("other", 2) is None
+    assert limiter.acquire("cmd", 3).scope == "global"
+
+def test_refused_use_consumes_nothing(clock):
+    """Test a use refused by one scope does not spend tokens in the others."""
+    limiter = make_limiter(clock, user=(Limit(1, 60),), global_limits=(Limit(2, 60),))
+    limiter.acquire("cmd", 1)
+
+    for _ in range(5):
+        assert limiter.acquire("cmd", 1).scope == "user"
+
+    assert limiter.acquire("cmd", 2) is None
+
+def test_longest_wait_is_reported(clock):
+    """Test the scope that will take longest to allow the use is the one reported."""
+    limiter = RateLimiter(
+        commands={"cmd": RateLimits(user=(Limit(1, 30), Limit(2, 3600)))},
+        global_limits=(), clock=clock
+    )
+    limiter.acquire("cmd", 1)
+    clock.now += 30
+    limiter.acquire("cmd", 1)
+
+    limited = limiter.acquire("cmd", 1)
+
+    assert limited.scope == "user"
+    assert limited.retry_after == pytest.approx(1800 - 30)
+
+def test_idle_buckets_are_swept(clock):
+    """Test users whose buckets have refilled are forgotten."""
+    limiter = make_limiter(clock)
+    for user_id in range(100):
+        limiter.acquire("cmd", user_id)
+
+    assert limiter.stats().tracked == 100
+    clock.now += 10
+    limiter.acquire("cmd", "active")
+    assert limiter.sweep() == 100
+
+    stats = limiter.stats()
+    assert stats.tracked == 1
+    assert stats.evicted == 100
+    assert stats.allowed == 101
+
+def test_sweep_runs_on_its_own(clock):
+    """Test acquiring after the sweep interval drops idle buckets."""
+    limiter = RateLimiter(commands={}, default=RateLimits(user=(Limit(1, 10),)),
+                          global_limits=(), sweep_interval=60, clock=clock)
+    limiter.acquire("cmd", 1)
+
+    clock.now += 61
+    limiter.acquire("cmd", 2)
+
+    assert limiter.stats().tracked == 1
+
+def test_describe_names_the_scope():
+    """Test the message tells the user what limit they hit and how long to wait."""
+    assert describe(RateLimited("user", 0.2)) == "Please wait 1 seconds before using this command again."
+    assert "server" in describe(RateLimited("guild", 10))
+    assert "too many requests" in describe(RateLimited("global", 10))
+
+def test_cogs_share_the_bot_limiter():
+    """Test every cog uses the bot's rate limiter."""
+    bot = MagicMock()
+
+    limiter = get_rate_limiter(bot)
+
+    assert TruthPostsCommand(bot).rate_limiter is limiter
+    assert FilterPostsCommand(bot).rate_limiter is limiter
+
+@pytest.mark.asyncio
+async def test_truth_posts_is_rate_limited():
+    """Test spamming a command is refused once the user's burst is used."""
+    cmd = TruthPostsCommand(MagicMock())
+    cmd.client = MagicMock()
+    cmd.client.serve_user_posts = AsyncMock(return_value=Served(MagicMock(posts=[])))
+    ctx = MagicMock()
+    ctx.author.id = 1
+    ctx.send = AsyncMock()
+    ctx.typing.return_value.__aenter__ = AsyncMock()
+    ctx.typing.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    for _ in range(4):
+        await cmd.truth_posts.callback(cmd, ctx, "testauthor")
+
+    assert cmd.client.serve_user_posts.call_count == 3
+    assert "wait" in ctx.send.call_args[0][0].lower()
@@ -0,0 +1,224 @@
+"""Tests for the monitoring watch scheduler."""
+
+import asyncio
+import time
+import pytest
+from discord_bot.scheduler import WatchScheduler
+
+def make_watches(count, usernames):
+    """Build fake watches spread over a number of usernames."""
+    return [
+        {'id': i, 'username': f"user{i % usernames}", 'filter_keyword': 'keyword'}
+        for i in range(count)
+    ]
+
+async def first_cycle(scheduler, clock):
+    """Schedule newly loaded groups, then run them all once their first offsets have passed."""
+    await scheduler.run_due()
+    clock.now += scheduler.interval
+    return await scheduler.run_due()
+
+class GroupRecorder:
+    """Records group checks and tracks peak concurrency."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, username, watches):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            self.calls.append((username, [w['id'] for w in watches]))
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+
+@pytest.mark.asyncio
+async def test_watches_sharing_username_use_one_check(clock):
+    """Test watches on the same account are grouped into a single check."""
+    watches = make_watches(6, usernames=2)
+    recorder = GroupRecorder()
+
+    async def load():
+        return watches
+
+    scheduler = WatchScheduler(load, recorder, clock=clock)
+    ran = await first_cycle(scheduler, clock)
+
+    assert ran == 2
+    assert sorted(recorder.calls) == [("user0", [0, 2, 4]), ("user1", [1, 3, 5])]
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded(clock):
+    """Test no more than max_concurrency groups run at once."""
+    watches = make_watches(50, usernames=50)
+    recorder = GroupRecorder(delay=0.01)
+
+    async def load():
+        return watches
+
+    scheduler = WatchScheduler(load, recorder, max_concurrency=5, clock=clock)
+    await first_cycle(scheduler, clock)
+
+    assert len(recorder.calls) == 50
+    assert recorder.peak == 5
+
+@pytest.mark.asyncio
+async def test_groups_are_rescheduled_with_jitter(clock):
+    """Test groups are not run again until due and their ticks are spread out."""
+    watches = make_watches(100, usernames=100)
+    recorder = GroupRecorder()
+
+    async def load():
+        return watches
+
+    scheduler = WatchScheduler(load, recorder, interval=300, jitter=0.1, clock=clock)
+    await first_cycle(scheduler, clock)
+
+    # Nothing is due straight away
+    assert await scheduler.run_due() == 0
+
+    next_runs = list(scheduler._next_run.values())
+    assert all(clock.now + 270 <= t <= clock.now + 330 for t in next_runs)
+    assert len(set(next_runs)) > 1
+    assert 270 <= scheduler.seconds_until_next() <= 330
+
+    clock.now += 331
+    assert await scheduler.run_due() == 100
+
+@pytest.mark.asyncio
+async def test_new_groups_are_spread_across_the_interval(clock):
+    """Test groups loaded together, e.g. after a restart, do not all fire on the first tick."""
+    watches = make_watches(200, usernames=200)
+    recorder = GroupRecorder()
+
+    async def load():
+        return watches
+
+    scheduler = WatchScheduler(load, recorder, interval=300, clock=clock)
+    assert await scheduler.run_due() == 0
+
+    offsets = sorted(t - clock.now for t in scheduler._next_run.values())
+    assert all(0 <= offset < 300 for offset in offsets)
+    # Every tenth of the interval gets some of the groups
+    assert {int(offset // 30) for offset in offsets} == set(range(10))
+
+    clock.now += 150
+    assert 0 < await scheduler.run_due() < 200
+
+@pytest.mark.asyncio
+async def test_next_run_times_per_watch():
+    """Test every watch exposes its next scheduled check."""
+    watches = make_watches(4, usernames=2)
+
+    async def load():
+        return watches
+
+    scheduler = WatchScheduler(load, GroupRecorder(), interval=300, jitter=0)
+    await scheduler.run_due()
+
+    times = scheduler.next_run_times()
+    assert set(times) == {0, 1, 2, 3}
+    assert times[0] == times[2]
+    assert abs((scheduler.next_run_at(1) - times[1]).total_seconds()) < 1
+    assert scheduler.next_run_at(99) is None
+
+@pytest.mark.asyncio
+async def test_removed_watches_are_forgotten():
+    """Test groups disappear when their watches are deactivated."""
+    watches = make_watches(2, usernames=2)
+
+    async def load():
+        return watches
+
+    scheduler = WatchScheduler(load, GroupRecorder())
+    await scheduler.run_due()
+    watches.pop()
+    await scheduler.run_due()
+
+    assert set(scheduler.next_run_times()) == {0}
+
+@pytest.mark.asyncio
+async def test_failing_group_does_not_stop_others(clock):
+    """Test one failing check doesn't prevent other groups from running."""
+    watches = make_watches(3, usernames=3)
+    checked = []
+
+    async def load():
+        return watches
+
+    async def check(username, group):
+        if username == "user1":
+            raise RuntimeError("boom")
+        checked.append(username)
+
+    scheduler = WatchScheduler(load, check, clock=clock)
+    await first_cycle(scheduler, clock)
+
+    assert sorted(checked) == ["user0", "user2"]
+    assert len(scheduler._next_run) == 3
+
+@pytest.mark.asyncio
+async def test_due_groups_share_one_fetch(clock):
+    """Test every due group is fetched in one call and handed its own result."""
+    watches = make_watches(6, usernames=3)
+    fetches = []
+    checked = {}
+
+    async def load():
+        return watches
+
+    async def fetch(usernames):
+        fetches.append(sorted(usernames))
+        return {name: f"posts for {name}" for name in usernames}
+
+    async def check(username, group, posts):
+        checked[username] = posts
+
+    scheduler = WatchScheduler(load, check, clock=clock, fetch=fetch)
+    await first_cycle(scheduler, clock)
+
+    assert fetches == [["user0", "user1", "user2"]]
+    assert checked == {name: f"posts for {name}" for name in ("user0", "user1", "user2")}
+
+@pytest.mark.asyncio
+async def test_failing_fetch_reschedules_due_groups(clock):
+    """Test a failed batched fetch skips the checks but keeps groups on schedule."""
+    watches = make_watches(3, usernames=3)
+    recorder = GroupRecorder()
+
+    async def load():
+        return watches
+
+    async def fetch(usernames):
+        raise RuntimeError("boom")
+
+    scheduler = WatchScheduler(load, recorder, clock=clock, fetch=fetch)
+    ran = await first_cycle(scheduler, clock)
+
+    assert ran == 0
+    assert recorder.calls == []
+    assert all(next_run > clock.now for next_run in scheduler._next_run.values())
+
+@pytest.mark.asyncio
+async def test_thousand_watches_cycle_within_target(clock):
+    """Test a cycle over 1,000 watches finishes within the target wall time."""
+    watches = make_watches(1000, usernames=250)
+    recorder = GroupRecorder(delay=0.02)
+
+    async def load():
+        return watches
+
+    scheduler = WatchScheduler(load, recorder, max_concurrency=50, clock=clock)
+    await scheduler.run_due()
+    clock.now += scheduler.interval
+    start = time.perf_counter()
+    await scheduler.run_due()
+    elapsed = time.perf_counter() - start
+
+    # 250 fetches of 20ms each, 50 at a time, is ~0.1s; serially it would be 5s
+    assert len(recorder.calls) == 250
+    assert elapsed < 1.0
@@ -0,0 +1,86 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import pytest
+from truth_social.singleflight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """Test concurrent callers for the same key run the work once."""
+    flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert flight.executions == 1
+    assert flight.coalesced == 4
+    assert flight.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_different_keys_run_separately():
+    """Test calls for different keys are not coalesced."""
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return "result"
+
+    await asyncio.gather(flight.do("a", work), flight.do("b", work))
+
+    assert flight.executions == 2
+    assert flight.coalesced == 0
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_with_every_caller():
+    """Test every waiting caller receives the same exception."""
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", work),
+        flight.do("key", work),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.executions == 1
+
+@pytest.mark.asyncio
+async def test_sequential_calls_run_again():
+    """Test a finished call is not reused by later callers."""
+    flight = SingleFlight()
+
+    async def work():
+        return "result"
+
+    await flight.do("key", work)
+    await flight.do("key", work)
+
+    assert flight.executions == 2
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    """Test cancelling one waiter leaves the shared work running."""
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    first = asyncio.create_task(flight.do("key", work))
+    second = asyncio.create_task(flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "result"
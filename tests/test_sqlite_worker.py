@@ -0,0 +1,59 @@
+"""Tests for the shared SQLite store helpers."""
+
+import pytest
+from truth_social.sqlite_worker import AsyncSQLiteWorker, SQLiteDatabase, connect, migrate
+
+def _create_items(cursor):
+    cursor.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+
+def _add_items_note(cursor):
+    cursor.execute("ALTER TABLE items ADD COLUMN note TEXT")
+
+class ItemStore(SQLiteDatabase):
+    migrations = [_create_items, _add_items_note]
+
+    def add(self, name):
+        conn = self._get_connection()
+        with conn:
+            return conn.execute("INSERT INTO items (name) VALUES (?)", (name,)).lastrowid
+
+    def names(self):
+        return [row['name'] for row in self._get_connection().execute("SELECT name FROM items")]
+
+def test_connect_uses_wal_for_files(tmp_path):
+    """Test file databases are opened in WAL mode with name-addressable rows."""
+    conn = connect(str(tmp_path / "items.db"))
+    assert conn.execute("PRAGMA journal_mode").fetchone()['journal_mode'] == "wal"
+    conn.close()
+
+def test_migrate_runs_only_pending_steps(tmp_path):
+    """Test migrations pick up from the stored user_version."""
+    conn = connect(str(tmp_path / "items.db"))
+    migrate(conn, ItemStore.migrations[:1])
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+
+    # Re-running the first step would fail, as the table already exists
+    migrate(conn, ItemStore.migrations)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+    columns = [col[1] for col in conn.execute("PRAGMA table_info(items)")]
+    assert "note" in columns
+    conn.close()
+
+def test_store_reopens_after_close(tmp_path):
+    """Test a closed store opens a fresh connection on its next use."""
+    with ItemStore(str(tmp_path / "data" / "items.db")) as store:
+        store.add("first")
+        store.close()
+        assert store.connection is None
+        assert store.names() == ["first"]
+    assert store.connection is None
+
+@pytest.mark.asyncio
+async def test_worker_opens_store_lazily(tmp_path):
+    """Test the async facade builds the store on first use and closes it on exit."""
+    path = str(tmp_path / "items.db")
+    async with AsyncSQLiteWorker(lambda: ItemStore(path), thread_name_prefix="items") as worker:
+        assert worker._store is None
+        await worker._run("add", "first")
+        assert await worker._run("names") == ["first"]
+    assert worker._store is None
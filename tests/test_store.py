@@ -0,0 +1,170 @@
+"""Tests for the on-disk response store."""
+
+import sqlite3
+import time
+import pytest
+from datetime import datetime, timezone
+from truth_social.cache import ResponseCache
+from truth_social.models import Post, PostList
+from tests.helpers import make_author
+from truth_social.store import (
+    FORMAT_VERSION, MIGRATIONS, AsyncResponseStore, ResponseStore, decode_value, encode_value, encode_key
+)
+
+NOW = datetime(2025, 1, 31, tzinfo=timezone.utc)
+
+def make_post_list(author=None):
+    author = author or make_author()
+    original = Post(id="1", content="Original", created_at=NOW, likes_count=1,
+                    replies_count=0, reposts_count=0, user=make_author("other"))
+    return PostList(
+        posts=[
+            Post(id="3", content="Newest", created_at=NOW, likes_count=10,
+                 replies_count=5, reposts_count=2, user=author),
+            Post(id="2", content="", created_at=NOW, likes_count=0, replies_count=0,
+                 reposts_count=0, is_repost=True, user=author, original_post=original),
+        ],
+        next_cursor="3"
+    )
+
+@pytest.fixture
+def store():
+    """Create an in-memory response store."""
+    store = ResponseStore(db_path=":memory:")
+    yield store
+    store.close()
+
+def test_post_list_round_trip():
+    """Test a post list, reposts included, survives encoding with one shared author."""
+    post_list = make_post_list()
+
+    decoded = decode_value(encode_value(post_list))
+
+    assert decoded == post_list
+    assert decoded.posts[0].user is decoded.posts[1].user
+
+def test_profile_round_trip():
+    """Test a profile survives encoding."""
+    assert decode_value(encode_value(make_author())) == make_author()
+
+def test_unknown_values_are_refused():
+    """Test only profiles and post lists can be stored."""
+    with pytest.raises(TypeError):
+        encode_value({"not": "a response"})
+
+def test_put_and_get(store):
+    """Test a stored response comes back with the time it was stored."""
+    stored_at = time.time()
+    store.put(("testuser", False, 0), make_author(), stored_at, stored_at + 60)
+
+    assert store.get(("testuser", False, 0)) == (stored_at, make_author())
+    assert store.get(("other", False, 0)) is None
+
+def test_expired_rows_are_ignored_and_purged(store):
+    """Test responses past their discard time are neither returned nor kept."""
+    now = time.time()
+    store.put("old", make_author(), now - 120, now - 60)
+    store.put("new", make_author(), now, now + 60)
+
+    assert store.get("old") is None
+    assert store.purge() == 1
+    assert len(store) == 1
+
+def test_unreadable_rows_are_dropped(store):
+    """Test rows that no longer decode are treated as missing and deleted."""
+    now = time.time()
+    store.put("changed", make_author(), now, now + 60)
+    store.put("corrupt", make_author(), now, now + 60)
+    conn = store._get_connection()
+    conn.execute("UPDATE responses SET value = json_set(value, '$.profile.pronouns', 'they/them') "
+                 "WHERE key = ?", (encode_key("changed"),))
+    conn.execute("UPDATE responses SET value = '{not json' WHERE key = ?", (encode_key("corrupt"),))
+
+    assert store.get("changed") is None
+    assert store.get("corrupt") is None
+    assert len(store) == 0
+
+def test_rows_from_other_formats_are_dropped(tmp_path):
+    """Test rows written in another format are neither returned nor kept."""
+    path = str(tmp_path / "cache.db")
+    now = time.time()
+    store = ResponseStore(path)
+    store.put("old", make_author(), now, now + 60)
+    store.put("new", make_author(), now, now + 60)
+    conn = store._get_connection()
+    conn.execute("UPDATE responses SET format = ? WHERE key = ?", (FORMAT_VERSION - 1, encode_key("old")))
+    conn.commit()
+
+    assert store.get("old") is None
+    store.close()
+
+    reopened = ResponseStore(path)
+    assert len(reopened) == 1
+    assert reopened.get("new") == (now, make_author())
+    reopened.close()
+
+def test_unversioned_store_is_upgraded(tmp_path):
+    """Test a table from before the format column gains it and drops its old rows."""
+    path = str(tmp_path / "cache.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                 "stored_at REAL NOT NULL, discard_at REAL NOT NULL)")
+    conn.execute("INSERT INTO responses VALUES (?, '{}', ?, ?)",
+                 (encode_key("old"), time.time(), time.time() + 60))
+    conn.commit()
+    conn.close()
+
+    store = ResponseStore(path)
+    assert store._get_connection().execute("PRAGMA user_version").fetchone()[0] == len(MIGRATIONS)
+    assert len(store) == 0
+    store.close()
+
+@pytest.mark.asyncio
+async def test_cache_load_failure_is_a_miss(tmp_path):
+    """Test a row that cannot be loaded falls through to a normal miss."""
+    path = str(tmp_path / "cache.db")
+    async with AsyncResponseStore(path) as store:
+        ResponseCache(ttl=60, store=store).set("key", make_author())
+    conn = ResponseStore(path)._get_connection()
+    conn.execute("UPDATE responses SET value = json_set(value, '$.profile.pronouns', 'they/them')")
+    conn.commit()
+    conn.close()
+
+    async with AsyncResponseStore(path) as store:
+        cache = ResponseCache(ttl=60, store=store)
+        await cache.load("key")
+
+        assert cache.get("key") is None
+        assert cache.stats().loaded == 0
+        assert await store.get("key") is None
+
+@pytest.mark.asyncio
+async def test_cache_warms_from_store_after_restart(tmp_path, clock):
+    """Test a new cache over the same file loads entries lazily, keeping their age."""
+    path = str(tmp_path / "cache.db")
+    async with AsyncResponseStore(path) as store:
+        ResponseCache(ttl=60, stale_ttl=600, store=store).set("key", make_post_list())
+
+    async with AsyncResponseStore(path) as store:
+        cache = ResponseCache(ttl=60, stale_ttl=600, clock=clock, store=store)
+        assert len(cache) == 0
+
+        await cache.load("key")
+        await cache.load("missing")
+
+        assert cache.get("key") == make_post_list()
+        assert cache.stats().loaded == 1
+        clock.now = 60
+        assert cache.get("key") is None
+
+@pytest.mark.asyncio
+async def test_invalidate_removes_from_store(tmp_path):
+    """Test invalidated entries do not come back from disk."""
+    async with AsyncResponseStore(str(tmp_path / "cache.db")) as store:
+        cache = ResponseCache(ttl=60, store=store)
+        cache.set("key", make_author())
+        cache.invalidate("key")
+
+        await cache.load("key")
+
+        assert cache.get("key") is None
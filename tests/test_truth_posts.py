@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 import discord
+from truth_social.models import Served
 from datetime import datetime, timezone
 from discord_bot.commands.truth_posts import TruthPostsCommand
 
@@ -55,13 +56,13 @@ async def test_truth_posts_success(command):
     mock_posts.posts = [mock_post]
     
     # Configure the client mock
-    command.client.get_user_posts = AsyncMock(return_value=mock_posts)
+    command.client.serve_user_posts = AsyncMock(return_value=Served(mock_posts))
     
     # Test the command
     await command.truth_posts(command, ctx, "testauthor")
     
     # Verify client call
-    command.client.get_user_posts.assert_called_once_with("testauthor", limit=5)
+    command.client.serve_user_posts.assert_called_once_with("testauthor", limit=5)
     
     # Verify typing context was used
     ctx.typing.assert_called_once()
@@ -96,13 +97,13 @@ async def test_truth_posts_with_at_symbol(command):
     ctx.typing = MagicMock(return_value=AsyncContextManagerMock())
     
     # Configure the client mock
-    command.client.get_user_posts = AsyncMock(return_value=MagicMock(posts=[]))
+    command.client.serve_user_posts = AsyncMock(return_value=Served(MagicMock(posts=[])))
     
     # Test the command with @ symbol
     await command.truth_posts(command, ctx, "@testauthor")
     
     # Verify client call without @ symbol
-    command.client.get_user_posts.assert_called_once_with("testauthor", limit=5)
+    command.client.serve_user_posts.assert_called_once_with("testauthor", limit=5)
 
 @pytest.mark.asyncio
 async def test_truth_posts_no_posts(command):
@@ -113,13 +114,13 @@ async def test_truth_posts_no_posts(command):
     ctx.typing = MagicMock(return_value=AsyncContextManagerMock())
     
     # Configure the client mock
-    command.client.get_user_posts = AsyncMock(return_value=MagicMock(posts=[]))
+    command.client.serve_user_posts = AsyncMock(return_value=Served(MagicMock(posts=[])))
     
     # Test the command
     await command.truth_posts(command, ctx, "testauthor")
     
     # Verify client call
-    command.client.get_user_posts.assert_called_once_with("testauthor", limit=5)
+    command.client.serve_user_posts.assert_called_once_with("testauthor", limit=5)
     
     # Verify no embeds were sent (since there were no posts)
     assert not ctx.send.called
@@ -133,7 +134,7 @@ async def test_truth_posts_error(command):
     ctx.typing = MagicMock(return_value=AsyncContextManagerMock())
     
     # Configure the client mock to raise an exception
-    command.client.get_user_posts = AsyncMock(side_effect=Exception("Test error"))
+    command.client.serve_user_posts = AsyncMock(side_effect=Exception("Test error"))
     
     # Test the command
     await command.truth_posts(command, ctx, "testauthor")
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 import discord
+from truth_social.models import Served
 from datetime import datetime, timezone
 from discord_bot.commands.truth_profile import TruthProfileCommand
 
@@ -51,13 +52,13 @@ async def test_truth_profile_success(command):
     mock_profile.bio = "Test user bio"
     
     # Configure the client mock
-    command.client.get_user_profile = AsyncMock(return_value=mock_profile)
+    command.client.serve_user_profile = AsyncMock(return_value=Served(mock_profile))
     
     # Test the command
     await command.truth_profile(command, ctx, "testuser")
     
     # Verify client call
-    command.client.get_user_profile.assert_called_once_with("testuser")
+    command.client.serve_user_profile.assert_called_once_with("testuser")
     
     # Verify typing context was used
     ctx.typing.assert_called_once()
@@ -94,13 +95,13 @@ async def test_truth_profile_with_at_symbol(command):
     ctx.typing = MagicMock(return_value=AsyncContextManagerMock())
     
     # Configure the client mock
-    command.client.get_user_profile = AsyncMock(return_value=MagicMock())
+    command.client.serve_user_profile = AsyncMock(return_value=Served(MagicMock()))
     
     # Test the command with @ symbol
     await command.truth_profile(command, ctx, "@testuser")
     
     # Verify client call without @ symbol
-    command.client.get_user_profile.assert_called_once_with("testuser")
+    command.client.serve_user_profile.assert_called_once_with("testuser")
 
 @pytest.mark.asyncio
 async def test_truth_profile_no_bio(command):
@@ -123,7 +124,7 @@ async def test_truth_profile_no_bio(command):
     mock_profile.bio = None
     
     # Configure the client mock
-    command.client.get_user_profile = AsyncMock(return_value=mock_profile)
+    command.client.serve_user_profile = AsyncMock(return_value=Served(mock_profile))
     
     # Test the command
     await command.truth_profile(command, ctx, "testuser")
@@ -140,6 +141,29 @@ async def test_truth_profile_no_bio(command):
     # Verify verification status shows as ❌
     assert field_dict["Verified"] == "❌"
 
+@pytest.mark.asyncio
+async def test_truth_profile_stale_has_as_of_footer(command):
+    """Test a stale profile is shown with the time its data is from."""
+    ctx = AsyncMock()
+    ctx.send = AsyncMock()
+    ctx.typing = MagicMock(return_value=AsyncContextManagerMock())
+    ctx.author.name = "test_user"
+    
+    mock_profile = MagicMock()
+    mock_profile.followers_count = 1000
+    mock_profile.following_count = 500
+    mock_profile.posts_count = 100
+    mock_profile.bio = None
+    mock_profile.created_at = datetime.now(timezone.utc)
+    as_of = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+    command.client.serve_user_profile = AsyncMock(return_value=Served(mock_profile, as_of=as_of))
+    
+    await command.truth_profile(command, ctx, "testuser")
+    
+    embed = ctx.send.call_args.kwargs['embed']
+    assert embed.footer.text == "Requested by test_user • As of Mar 01, 12:30 UTC, refreshing"
+    assert embed.timestamp == as_of
+
 @pytest.mark.asyncio
 async def test_truth_profile_error(command):
     """Test error handling when fetching profile fails."""
@@ -149,7 +173,7 @@ async def test_truth_profile_error(command):
     ctx.typing = MagicMock(return_value=AsyncContextManagerMock())
     
     # Configure the client mock to raise an exception
-    command.client.get_user_profile = AsyncMock(side_effect=Exception("Test error"))
+    command.client.serve_user_profile = AsyncMock(side_effect=Exception("Test error"))
     
     # Test the command
     await command.truth_profile(command, ctx, "testuser")
@@ -1,11 +1,32 @@
+from .cache import ResponseCache, CacheStats
 from .config import ApifyConfig
 from .client import TruthSocialClient
-from .models import UserProfile, Post, PostList
+from .errors import ApifyError, ApifyBusyError
+from .governor import ApifyGovernor, GovernorStats
+from .index import PostIndex, AsyncPostIndex
+from .matcher import KeywordMatcher
+from .models import UserProfile, Post, PostList, ProfileInterner, Served
+from .singleflight import SingleFlight
+from .store import ResponseStore, AsyncResponseStore
 
 __all__ = [
     'ApifyConfig',
     'TruthSocialClient',
+    'ApifyError',
+    'ApifyBusyError',
+    'ApifyGovernor',
+    'GovernorStats',
     'UserProfile',
     'Post',
-    'PostList'
+    'PostList',
+    'ProfileInterner',
+    'Served',
+    'ResponseCache',
+    'CacheStats',
+    'SingleFlight',
+    'KeywordMatcher',
+    'PostIndex',
+    'AsyncPostIndex',
+    'ResponseStore',
+    'AsyncResponseStore'
 ] 
\ No newline at end of file
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+import logging
+import time
+from .store import AsyncResponseStore
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached value, how many seconds ago it was stored, and whether it is within the TTL."""
+    value: Any
+    age: float
+    fresh: bool
+
+@dataclass
+class CacheStats:
+    """Snapshot of cache counters."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    loaded: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class ResponseCache:
+    """In-memory TTL cache with bounded LRU eviction.
+
+    Entries expire ``ttl`` seconds after they are stored. Once ``max_entries``
+    is reached the least recently used entry is evicted. A ``ttl`` of 0
+    disables caching entirely. With ``stale_ttl`` expired entries are kept
+    that much longer for ``get_stale``, to answer with when fetching fresh
+    data is not possible.
+
+    With a ``store`` every entry is also written to disk, and ``load``
+    brings one back into memory after a restart or an eviction, so the
+    cache warms up lazily instead of every key going back to Apify.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256, stale_ttl: float = 0,
+                 clock: Callable[[], float] = time.monotonic,
+                 store: Optional[AsyncResponseStore] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self.store = store
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._stats = CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        now = self._clock()
+        if now >= expires_at:
+            if now >= expires_at + self.stale_ttl:
+                del self._entries[key]
+            self._stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+
+        self._insert(key, self._clock() + self.ttl, value)
+        if self.store is not None:
+            stored_at = time.time()
+            self.store.save(key, value, stored_at, stored_at + self.ttl + self.stale_ttl)
+
+    def _insert(self, key: Hashable, expires_at: float, value: Any) -> None:
+        """Put an entry in memory, evicting the least recently used if full."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    async def load(self, key: Hashable) -> None:
+        """Bring a key's entry in from the store if memory has none.
+
+        The entry keeps the age it had on disk, so a response fetched
+        before a restart still expires on time.
+        """
+        if self.store is None or not self.enabled or key in self._entries:
+            return
+        try:
+            record = await self.store.get(key)
+        except Exception as e:
+            # A broken store only costs us the warm start
+            logger.warning(f"Could not load cached response for {key!r}: {e}")
+            return
+        if record is None or key in self._entries:
+            return
+        stored_at, value = record
+        age = time.time() - stored_at
+        if age >= self.ttl + self.stale_ttl:
+            return
+        self._insert(key, self._clock() - age + self.ttl, value)
+        self._stats.loaded += 1
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """Look at an entry, fresh or within ``stale_ttl``, without counting a hit or miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        now = self._clock()
+        if now >= expires_at + self.stale_ttl:
+            return None
+        return CacheEntry(value=value, age=now - (expires_at - self.ttl), fresh=now < expires_at)
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Return a value even if it has expired, as long as it is within ``stale_ttl``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at + self.stale_ttl:
+            del self._entries[key]
+            return None
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+        if self.store is not None:
+            self.store.delete(key)
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss/eviction counters."""
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            size=len(self._entries),
+            loaded=self._stats.loaded
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,22 +1,92 @@
-from apify_client import ApifyClient
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List, AsyncIterator, Awaitable, Callable, Hashable
+from datetime import datetime, timedelta, timezone
+from .cache import ResponseCache
 from .config import ApifyConfig
-from .models import UserProfile, Post, PostList
+from .errors import ApifyError, ApifyBusyError
+from .governor import ApifyGovernor
+from .index import AsyncPostIndex, BEGINNING_OF_TIME
+from .matcher import compile_query
+from .models import UserProfile, Post, PostList, ProfileInterner, Served
+from .parser import ItemParser, MalformedItemError
+from .singleflight import SingleFlight
+from .store import AsyncResponseStore
 
-class ApifyError(Exception):
-    """Base exception for Apify API errors."""
-    pass
+logger = logging.getLogger(__name__)
+
+# Terminal run statuses that mean the actor produced no usable dataset
+FAILED_RUN_STATUSES = frozenset({"FAILED", "ABORTED", "TIMED-OUT"})
+
+def post_id_key(post_id: str) -> tuple:
+    """Sort key that orders Truth Social post IDs by age.
+    
+    IDs are numeric snowflakes stored as strings, so comparing by length
+    first and then lexically matches numeric order without int parsing.
+    """
+    return (len(post_id), post_id)
 
 class TruthSocialClient:
     """Client for interacting with Truth Social via Apify."""
     
-    def __init__(self, config: ApifyConfig):
+    # Posts requested per run when filling the local index for a search
+    index_fetch_limit = 100
+    # Streamed posts are written to the index this many at a time
+    index_write_batch = 100
+    
+    def __init__(self, config: ApifyConfig, cache: Optional[ResponseCache] = None,
+                 index: Optional[AsyncPostIndex] = None,
+                 cache_store: Optional[AsyncResponseStore] = None):
         self.config = config
-        self._client = ApifyClient(config.api_token)
+        # Every fetched post is written here when set
+        self.index = index
+        # Responses also go to cache_store when set, so restarts start warm
+        self.cache = cache if cache is not None else ResponseCache(
+            ttl=config.cache_ttl,
+            max_entries=config.cache_max_entries,
+            stale_ttl=config.cache_stale_ttl,
+            store=cache_store
+        )
+        # Bounds concurrent actor runs and their hourly compute spend
+        self.governor = ApifyGovernor(
+            max_concurrent=config.max_concurrent_runs,
+            max_queued=config.max_queued_runs,
+            hourly_budget=config.hourly_compute_budget
+        )
+        # Responses served past their TTL, while Apify was busy or a refresh ran
+        self.stale_served = 0
+        # Background refreshes of stale responses, one per key
+        self._revalidating: Dict[Hashable, asyncio.Task] = {}
+        # Concurrent identical requests share one actor run
+        self.inflight = SingleFlight()
+        # Posts from every fetch of an account share one author profile
+        self.authors = ProfileInterner()
+        self.parser = ItemParser(self.authors)
+        # Dataset items skipped because they could not be parsed
+        self.malformed_items = 0
+        # Created by the first actor run; see _apify
+        self._client = None
+        
+    def _apify(self):
+        """The Apify client, created on first use.
+        
+        The async client keeps actor runs off the event loop thread, so a
+        slow scraper run never stalls Discord heartbeats or other commands.
+        Importing it and building its connection pool (which loads the CA
+        bundle twice) takes a few hundred milliseconds, so bot startup
+        leaves that to the first command that needs Apify.
+        """
+        if self._client is None:
+            from apify_client import ApifyClientAsync
+            self._client = ApifyClientAsync(self.config.api_token, api_url=self.config.api_url)
+        return self._client
         
-    async def _run_actor(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _run_actor(self, input_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Run the Apify actor and wait for results."""
+        return [item async for item in self._iterate_actor(input_data)]
+            
+    async def _iterate_actor(self, input_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Run the Apify actor and yield dataset items as their pages arrive."""
         # Map input to Truth Social Scraper schema
         default_input = {
             "identifiers": [],
@@ -28,9 +98,15 @@ class TruthSocialClient:
             "maxPosts": 20  # Default to 20 posts
         }
         
+        if input_data.get("lastPostId"):
+            # Let the actor stop at the last post we have already seen
+            default_input["useLastPostId"] = True
+        
         # Map our input to the actor's expected format
         if "username" in input_data:
             default_input["identifiers"] = [input_data.pop("username")]
+        if "usernames" in input_data:
+            default_input["identifiers"] = list(input_data.pop("usernames"))
         if "maxPosts" in input_data:
             # Ensure maxPosts is at least 5
             default_input["maxPosts"] = max(5, input_data.pop("maxPosts"))
@@ -38,19 +114,103 @@ class TruthSocialClient:
         # Merge with any remaining input data
         input_data = {**default_input, **input_data}
         
+        # Wait for a run slot; ApifyBusyError here means the run was never started
+        async with self.governor.slot() as slot:
+            try:
+                # Run the actor
+                run = await self._apify().actor(self.config.actor_id).call(run_input=input_data)
+            except Exception as e:
+                raise ApifyError(f"Failed to run actor: {str(e)}")
+            slot.charge(run)
+        
         try:
-            # Run the actor
-            run = self._client.actor(self.config.actor_id).call(run_input=input_data)
+            if run is None:
+                raise ApifyError("actor run disappeared before it finished")
+            if run.get("status") in FAILED_RUN_STATUSES:
+                raise ApifyError(f"actor run {run.get('id')} finished with status {run['status']}")
             
-            # Get the dataset items
-            dataset = self._client.dataset(run["defaultDatasetId"])
-            return list(dataset.iterate_items())
+            # Page through the dataset items
+            dataset = self._apify().dataset(run["defaultDatasetId"])
+            async for item in dataset.iterate_items():
+                yield item
             
         except Exception as e:
             raise ApifyError(f"Failed to run actor: {str(e)}")
             
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        for task in list(self._revalidating.values()):
+            task.cancel()
+        await asyncio.gather(*self._revalidating.values(), return_exceptions=True)
+        http_client = getattr(self._client, "http_client", None)
+        httpx_client = getattr(http_client, "httpx_async_client", None)
+        if httpx_client is not None:
+            await httpx_client.aclose()
+        if self.index is not None:
+            await self.index.close()
+        if self.cache.store is not None:
+            await self.cache.store.close()
+            
+    async def __aenter__(self) -> 'TruthSocialClient':
+        return self
+            
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+            
+    def stats(self) -> Dict[str, Any]:
+        """Return cache and request coalescing counters."""
+        return {
+            "cache": self.cache.stats(),
+            "actor_runs": self.inflight.executions,
+            "actor_runs_saved": self.inflight.coalesced,
+            "in_flight": self.inflight.in_flight,
+            "malformed_items": self.malformed_items,
+            "governor": self.governor.stats(),
+            "stale_served": self.stale_served,
+            "revalidating": len(self._revalidating)
+        }
+            
+    @staticmethod
+    def _cache_key(username: str, fetch_posts: bool, max_posts: int,
+                   since_id: Optional[str] = None) -> tuple:
+        """Build the cache key for an actor request."""
+        if since_id:
+            return (username.lower(), fetch_posts, max_posts, since_id)
+        return (username.lower(), fetch_posts, max_posts)
+            
     async def get_user_profile(self, username: str) -> UserProfile:
         """Get user profile information."""
+        key = self._cache_key(username, False, 0)
+        await self.cache.load(key)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if self.index is not None:
+            # Kept fresh by background ingestion for tracked accounts
+            stored = await self.index.get_author(username, max_age=self.config.cache_ttl)
+            if stored is not None:
+                self.cache.set(key, stored)
+                return stored
+        
+        return await self._or_stale(
+            key, self.inflight.do(key, lambda: self._fetch_user_profile(username, key))
+        )
+            
+    async def _or_stale(self, key: tuple, fetch):
+        """Await a fetch, answering from the expired cache entry if Apify is busy."""
+        try:
+            return await fetch
+        except ApifyBusyError:
+            stale = self.cache.get_stale(key)
+            if stale is None:
+                raise
+            self.stale_served += 1
+            logger.info(f"Apify busy, serving stale response for {key}")
+            return stale
+            
+    async def _fetch_user_profile(self, username: str, key: tuple) -> UserProfile:
+        """Run the actor for a profile and cache the parsed result."""
         results = await self._run_actor({
             "username": username,
             "maxPosts": 0,  # We only want profile data
@@ -60,61 +220,366 @@ class TruthSocialClient:
         if not results:
             raise ApifyError(f"No profile found for username: {username}")
             
-        profile_data = results[0]['account']
-        return UserProfile(
-            username=profile_data['username'],
-            display_name=profile_data['display_name'],
-            bio=profile_data.get('note', '').replace('<p>', '').replace('</p>', ''),
-            followers_count=profile_data['followers_count'],
-            following_count=profile_data['following_count'],
-            posts_count=profile_data['statuses_count'],
-            created_at=datetime.fromisoformat(profile_data['created_at']),
-            is_verified=profile_data['verified']
-        )
+        try:
+            profile = self.parser.profile(results[0])
+        except MalformedItemError as e:
+            raise ApifyError(f"Malformed profile for username {username}: {e}")
+        self.cache.set(key, profile)
+        if self.index is not None:
+            await self.index.add_author(username, profile)
+        return profile
             
-    async def get_user_posts(self, username: str, limit: int = 20) -> PostList:
-        """Get user's recent posts."""
-        results = await self._run_actor({
+    async def get_user_posts(self, username: str, limit: int = 20,
+                             since_id: Optional[str] = None) -> PostList:
+        """Get user's recent posts.
+        
+        When ``since_id`` is given only posts newer than it are returned, and
+        ``next_cursor`` holds the ID to pass as ``since_id`` on the next call.
+        Incremental fetches always go to the actor, since their whole point
+        is to see what changed.
+        """
+        # The actor never returns fewer than 5 posts, so share entries below that
+        key = self._cache_key(username, True, max(5, limit), since_id)
+        if not since_id:
+            await self.cache.load(key)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        return await self._or_stale(key, self.inflight.do(
+            key, lambda: self._fetch_user_posts(username, limit, key, since_id)
+        ))
+            
+    async def _fetch_user_posts(self, username: str, limit: int, key: tuple,
+                                since_id: Optional[str] = None) -> PostList:
+        """Run the actor for a user's posts and cache the parsed result."""
+        input_data = {
             "username": username,
             "maxPosts": limit,
             "fetchPosts": True
-        })
+        }
+        if since_id:
+            input_data["lastPostId"] = since_id
+        results = await self._run_actor(input_data)
         
-        if not results:
+        if not since_id and not results:
             raise ApifyError(f"No posts found for username: {username}")
             
-        # Get the profile data from the first result
-        profile_data = results[0]['account']
-        author = UserProfile(
-            username=profile_data['username'],
-            display_name=profile_data['display_name'],
-            bio=profile_data.get('note', '').replace('<p>', '').replace('</p>', ''),
-            followers_count=profile_data['followers_count'],
-            following_count=profile_data['following_count'],
-            posts_count=profile_data['statuses_count'],
-            created_at=datetime.fromisoformat(profile_data['created_at']),
-            is_verified=profile_data['verified']
-        )
+        post_list = self._parse_post_list(results, since_id)
+        if not since_id:
+            self.cache.set(key, post_list)
+        if self.index is not None and post_list.posts:
+            await self.index.add_posts(username, post_list.posts)
+        return post_list
             
-        posts = []
-        for post_data in results:
-            post = Post(
-                id=post_data['id'],
-                content=post_data['content'],
-                user=author,
-                created_at=datetime.fromisoformat(post_data['created_at']),
-                likes_count=post_data['favourites_count'],
-                replies_count=post_data['replies_count'],
-                reposts_count=post_data['reblogs_count'],
-                is_repost=post_data['reblog'] is not None,
-                original_post=None  # We'll handle this if needed
-            )
-            posts.append(post)
+    async def stream_user_posts(self, username: str, limit: int = 20,
+                                since_id: Optional[str] = None) -> AsyncIterator[Post]:
+        """Yield a user's recent posts as the actor's dataset is paged in.
+        
+        Takes the same arguments as ``get_user_posts``, but never holds the
+        whole result in memory, so callers can filter and send from the
+        first page and large ``limit`` values stay cheap. Streamed posts
+        bypass the response cache and are written to the index in batches.
+        Callers that stop early should wrap the stream in
+        ``contextlib.aclosing`` so the last batch is written straight away.
+        """
+        if not since_id:
+            key = self._cache_key(username, True, max(5, limit))
+            await self.cache.load(key)
+            cached = self.cache.get(key)
+            if cached is not None:
+                for post in cached.posts:
+                    yield post
+                return
+        
+        input_data = {
+            "username": username,
+            "maxPosts": limit,
+            "fetchPosts": True
+        }
+        if since_id:
+            input_data["lastPostId"] = since_id
+        since_key = post_id_key(since_id) if since_id else None
+        
+        authors: Dict[str, UserProfile] = {}
+        pending: List[Post] = []
+        try:
+            async for item in self._iterate_actor(input_data):
+                try:
+                    post = self.parser.parse_item(item, authors)
+                except MalformedItemError as e:
+                    self.malformed_items += 1
+                    logger.warning(f"Skipping malformed dataset item for {username}: {e}")
+                    continue
+                # Drop anything the actor returned at or before the cursor
+                if since_key is not None and post_id_key(post.id) <= since_key:
+                    continue
+                if self.index is not None:
+                    pending.append(post)
+                    if len(pending) >= self.index_write_batch:
+                        await self.index.add_posts(username, pending)
+                        pending = []
+                yield post
+        finally:
+            # Also runs when the caller stops early
+            if pending:
+                await self.index.add_posts(username, pending)
+        
+        if not authors and not since_id:
+            raise ApifyError(f"No posts found for username: {username}")
+            
+    async def get_posts_for_users(self, usernames: List[str], limit: int = 20) -> Dict[str, PostList]:
+        """Get up to ``limit`` recent posts for each of several users with a single actor run.
+        
+        Users already in the cache are served from it; the rest are packed
+        into one run and the dataset is split back out per account. Users
+        the actor returned nothing for get an empty PostList.
+        """
+        results: Dict[str, PostList] = {}
+        missing = []
+        for username in dict.fromkeys(u.lower() for u in usernames):
+            key = self._cache_key(username, True, max(5, limit))
+            await self.cache.load(key)
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[username] = cached
+            else:
+                missing.append(username)
+                
+        if missing:
+            key = ("batch", tuple(sorted(missing)), max(5, limit))
+            fetched = await self.inflight.do(key, lambda: self._fetch_posts_for_users(missing, limit))
+            results.update(fetched)
+            
+        return results
+            
+    async def _fetch_posts_for_users(self, usernames: List[str], limit: int) -> Dict[str, PostList]:
+        """Run the actor once for many users and cache each user's posts."""
+        results = await self._run_actor({
+            "usernames": usernames,
+            "maxPosts": limit,
+            "fetchPosts": True
+        })
+        
+        # Split the combined dataset back out per account
+        posts_by_user: Dict[str, List[Post]] = {username: [] for username in usernames}
+        for post in self._parse_items(results):
+            posts_by_user.setdefault(post.user.username.lower(), []).append(post)
+            
+        post_lists = {}
+        for username, posts in posts_by_user.items():
+            post_list = self._post_list(posts)
+            if posts:
+                self.cache.set(self._cache_key(username, True, max(5, limit)), post_list)
+            post_lists[username] = post_list
+            
+        if self.index is not None:
+            # One transaction for the whole run
+            await self.index.add_post_lists({
+                username: post_list.posts
+                for username, post_list in post_lists.items() if post_list.posts
+            })
+        return post_lists
+            
+    async def refresh_accounts(self, usernames: List[str], limit: int = 20) -> Dict[str, PostList]:
+        """Fetch fresh posts for several accounts in one run and index them.
+        
+        Unlike ``get_posts_for_users`` this skips reading the response
+        cache, and it records in the index that each account's latest posts
+        are complete as of now. Cached entries are only replaced once fresh
+        results arrive, so if the run fails or is shed they can still be
+        served stale.
+        """
+        usernames = list(dict.fromkeys(u.lower() for u in usernames))
+        fetched_at = datetime.now(timezone.utc)
+        key = ("batch", tuple(sorted(usernames)), max(5, limit))
+        post_lists = await self.inflight.do(key, lambda: self._fetch_posts_for_users(usernames, limit))
+        
+        if self.index is not None:
+            for username, post_list in post_lists.items():
+                if post_list.posts:
+                    await self.index.record_coverage(
+                        username, self._covered_from(post_list, limit), fetched_at
+                    )
+        return post_lists
+            
+    def _revalidate(self, key: Hashable, refresh: Callable[[], Awaitable[Any]]) -> None:
+        """Run ``refresh`` in the background unless it is already running for ``key``."""
+        if key in self._revalidating:
+            return
+        task = asyncio.ensure_future(refresh())
+        self._revalidating[key] = task
+        task.add_done_callback(lambda t: self._revalidated(key, t))
+            
+    def _revalidated(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished background refresh, logging it if it failed."""
+        if self._revalidating.get(key) is task:
+            del self._revalidating[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background refresh of {key} failed: {task.exception()}")
+            
+    @staticmethod
+    def _fetched_at(age: float) -> datetime:
+        """Wall-clock time of a response that is ``age`` seconds old."""
+        return datetime.now(timezone.utc) - timedelta(seconds=age)
+            
+    async def serve_user_profile(self, username: str) -> Served:
+        """Get a user profile, answering at once from a stale cache entry.
+        
+        Within the TTL this is ``get_user_profile``. Past it, but within
+        the cache's stale window, the old profile is returned with its
+        ``as_of`` time and a single background refresh replaces it.
+        """
+        key = self._cache_key(username, False, 0)
+        await self.cache.load(key)
+        entry = self.cache.peek(key)
+        if entry is not None and not entry.fresh:
+            self.stale_served += 1
+            self._revalidate(key, lambda: self.get_user_profile(username))
+            return Served(entry.value, as_of=self._fetched_at(entry.age))
+        return Served(await self.get_user_profile(username))
+            
+    async def serve_user_posts(self, username: str, limit: int = 5) -> Served:
+        """Get a user's newest ``limit`` posts, answering at once from stale data.
+        
+        Works like ``serve_user_profile`` on top of ``search_posts``: with
+        an index the stale answer comes from it and the refresh fetches
+        what is new, otherwise from the response cache.
+        """
+        if self.index is None:
+            key = self._cache_key(username, True, max(5, limit))
+            await self.cache.load(key)
+            entry = self.cache.peek(key)
+            if entry is not None and not entry.fresh:
+                self.stale_served += 1
+                self._revalidate(key, lambda: self.get_user_posts(username, limit))
+                post_list = entry.value
+                return Served(
+                    PostList(posts=post_list.posts[:limit], next_cursor=post_list.next_cursor),
+                    as_of=self._fetched_at(entry.age)
+                )
+            return Served(await self.search_posts(username, limit=limit))
+        
+        coverage = await self.index.get_coverage(username)
+        if coverage is not None and coverage.covers(None, limit):
+            age = (datetime.now(timezone.utc) - coverage.covered_until).total_seconds()
+            if self.config.cache_ttl < age <= self.config.cache_ttl + self.cache.stale_ttl:
+                self.stale_served += 1
+                self._revalidate(("index", username.lower()),
+                                 lambda: self._refresh_index(username, None, limit))
+                posts = await self.index.search(username, None, None, limit)
+                return Served(
+                    PostList(posts=posts, next_cursor=posts[0].id if posts else None),
+                    as_of=coverage.covered_until
+                )
+        return Served(await self.search_posts(username, limit=limit))
+            
+    async def search_posts(self, username: str, since: Optional[datetime] = None,
+                           query: Optional[str] = None, limit: Optional[int] = None) -> PostList:
+        """Get a user's posts since a time, optionally matching a keyword query.
+        
+        With a local index the answer comes from it, after fetching only the
+        part of the range the index does not cover yet. Without one the
+        latest posts are fetched and filtered. Posts are newest first, at
+        most ``limit`` of them.
+        """
+        matcher = compile_query(query) if query else None
+        if self.index is None:
+            post_list = await self.get_user_posts(username, limit or 20)
+            posts = [post for post in post_list.posts if since is None or post.created_at >= since]
+            if matcher is not None:
+                posts = matcher.filter(posts)
+            posts = posts[:limit] if limit is not None else posts
+            return PostList(posts=posts, next_cursor=post_list.next_cursor)
+        
+        # Only an unfiltered query is satisfied by simply having enough posts
+        await self._refresh_index(username, since, None if matcher else limit)
+        posts = await self.index.search(username, since, matcher, limit)
+        return PostList(posts=posts, next_cursor=posts[0].id if posts else None)
+            
+    async def _refresh_index(self, username: str, since: Optional[datetime],
+                             limit: Optional[int] = None) -> None:
+        """Fetch whatever part of ``since``..now (or the newest ``limit`` posts) the index is missing."""
+        coverage = await self.index.get_coverage(username)
+        now = datetime.now(timezone.utc)
+        fetch_limit = limit if since is None and limit else self.index_fetch_limit
+        
+        if coverage is not None and coverage.covers(since, limit):
+            if now - coverage.covered_until <= timedelta(seconds=self.config.cache_ttl):
+                # Recent enough to answer locally
+                return
+            if coverage.newest_id:
+                # Only posts newer than the index are missing
+                try:
+                    post_list = await self.get_user_posts(username, fetch_limit, since_id=coverage.newest_id)
+                except ApifyBusyError:
+                    # What the index already has is better than nothing
+                    self.stale_served += 1
+                    logger.info(f"Apify busy, answering from the index for {username}")
+                    return
+                complete = len(post_list.posts) < max(5, fetch_limit)
+                covered_from = coverage.covered_until if complete else self._oldest(post_list)
+                await self.index.record_coverage(username, covered_from, now)
+                return
+        
+        # The older end of the range is missing, so fetch as far back as we can
+        post_list = await self.get_user_posts(username, fetch_limit)
+        await self.index.record_coverage(username, self._covered_from(post_list, fetch_limit), now)
+            
+    @staticmethod
+    def _oldest(post_list: PostList) -> datetime:
+        """Creation time of the oldest post in a list."""
+        return min(post.created_at for post in post_list.posts)
+            
+    @classmethod
+    def _covered_from(cls, post_list: PostList, limit: int) -> datetime:
+        """Start of the range a fetch of the latest ``limit`` posts is complete for."""
+        if len(post_list.posts) < max(5, limit):
+            # The actor ran out of posts, so this is the account's whole history
+            return BEGINNING_OF_TIME
+        return cls._oldest(post_list)
+            
+    def _parse_items(self, results: List[Dict[str, Any]]) -> List[Post]:
+        """Parse dataset items, logging and skipping any that are malformed.
+        
+        Raises ApifyError only when there were items and none could be parsed.
+        """
+        parsed = self.parser.parse_items(results)
+        for error in parsed.errors:
+            logger.warning(f"Skipping malformed dataset {error}")
+        self.malformed_items += len(parsed.errors)
+        if parsed.errors and not parsed.posts:
+            raise ApifyError(f"Every dataset item was malformed, e.g. {parsed.errors[0]}")
+        return parsed.posts
+            
+    def _parse_post_list(self, results: List[Dict[str, Any]],
+                         since_id: Optional[str] = None) -> PostList:
+        """Convert dataset items for a single account into a PostList.
+        
+        With ``since_id`` anything the actor returned at or before the
+        cursor is dropped.
+        """
+        posts = self._parse_items(results)
+        if since_id:
+            since_key = post_id_key(since_id)
+            posts = [post for post in posts if post_id_key(post.id) > since_key]
+        return self._post_list(posts, since_id)
+            
+    @staticmethod
+    def _post_list(posts: List[Post], since_id: Optional[str] = None) -> PostList:
+        """Wrap parsed posts in a PostList.
+        
+        ``next_cursor`` is the newest post ID seen, falling back to
+        ``since_id`` when there is nothing new.
+        """
+        if not posts:
+            return PostList(posts=[], next_cursor=since_id, previous_cursor=since_id)
             
+        newest_id = max((post.id for post in posts), key=post_id_key)
         return PostList(
             posts=posts,
-            next_cursor=None,  # Apify doesn't use cursors
-            previous_cursor=None
+            next_cursor=newest_id,
+            previous_cursor=since_id
         )
             
     async def get_post(self, post_id: str) -> Post:
@@ -10,17 +10,49 @@ class ApifyConfig:
     actor_id: str = "muhammetakkurtt/truth-social-scraper"
     base_url: str = "https://api.apify.com/v2/"
     timeout: int = 30
+    cache_ttl: int = 300
+    cache_max_entries: int = 256
+    # How long expired responses may still be served while Apify is busy
+    cache_stale_ttl: int = 3600
+    max_concurrent_runs: int = 4
+    max_queued_runs: int = 32
+    # Compute units the bot may spend per hour; None means unlimited
+    hourly_compute_budget: Optional[float] = None
+
+    @property
+    def api_url(self) -> str:
+        """Server root for the Apify client, which appends the ``/v2`` itself."""
+        url = self.base_url.rstrip('/')
+        if url.endswith('/v2'):
+            url = url[:-len('/v2')]
+        return url
 
     @classmethod
-    def from_env(cls) -> Optional['ApifyConfig']:
-        """Create configuration from environment variables."""
+    def from_env(cls, require_token: bool = True) -> Optional['ApifyConfig']:
+        """Create configuration from environment variables.
+        
+        Returns None when APIFY_API_TOKEN is unset, unless ``require_token``
+        is False, in which case the other settings are still loaded.
+        """
         load_dotenv()
         
         api_token = os.getenv("APIFY_API_TOKEN")
         
-        if not api_token:
+        if not api_token and require_token:
             return None
             
         return cls(
-            api_token=api_token
-        ) 
\ No newline at end of file
+            api_token=api_token,
+            actor_id=os.getenv("APIFY_ACTOR_ID", "muhammetakkurtt/truth-social-scraper"),
+            base_url=os.getenv("APIFY_BASE_URL", "https://api.apify.com/v2/"),
+            cache_ttl=int(os.getenv("APIFY_CACHE_DURATION", "300")),
+            cache_max_entries=int(os.getenv("APIFY_CACHE_MAX_ENTRIES", "256")),
+            cache_stale_ttl=int(os.getenv("APIFY_STALE_CACHE_DURATION", "3600")),
+            max_concurrent_runs=int(os.getenv("APIFY_MAX_CONCURRENT_RUNS", "4")),
+            max_queued_runs=int(os.getenv("APIFY_MAX_QUEUED_RUNS", "32")),
+            hourly_compute_budget=parse_budget(os.getenv("APIFY_HOURLY_COMPUTE_UNITS"))
+        )
+
+def parse_budget(value: Optional[str]) -> Optional[float]:
+    """Parse an hourly compute-unit budget; unset or empty means unlimited."""
+    return float(value) if value else None
@@ -0,0 +1,7 @@
+class ApifyError(Exception):
+    """Base exception for Apify API errors."""
+    pass
+
+class ApifyBusyError(ApifyError):
+    """No actor run was started because the bot is at its Apify limits."""
+    pass
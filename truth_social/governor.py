@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Hashable, Optional, Tuple
+
+from .errors import ApifyBusyError
+
+# Who the current actor runs are for, e.g. the guild a command came from.
+# Set once per command or background task; runs without one share a queue.
+current_tenant: ContextVar[Optional[Hashable]] = ContextVar("current_tenant", default=None)
+
+# Window compute-unit spend is totalled over
+SPEND_WINDOW = 3600.0
+
+@dataclass
+class GovernorStats:
+    """Snapshot of actor run governor metrics."""
+    running: int = 0
+    queued: int = 0
+    runs: int = 0
+    shed: int = 0
+    compute_units_last_hour: float = 0.0
+
+class RunSlot:
+    """A held actor run slot; ``charge`` records what the run cost."""
+
+    def __init__(self):
+        self.compute_units: Optional[float] = None
+
+    def charge(self, run: Optional[Dict[str, Any]]) -> None:
+        """Take the compute units a finished run reports in its stats."""
+        stats = (run or {}).get("stats") or {}
+        if stats.get("computeUnits") is not None:
+            self.compute_units = float(stats["computeUnits"])
+
+class ApifyGovernor:
+    """Caps concurrent actor runs, queues the rest fairly and tracks compute spend.
+
+    At most ``max_concurrent`` runs are in flight. Further requests wait in
+    a queue per tenant, and freed slots are handed out round-robin across
+    tenants, so one busy guild cannot starve the others. Once
+    ``max_queued`` requests are waiting, or ``hourly_budget`` compute units
+    have been spent in the last hour, new requests are shed with
+    ApifyBusyError so callers can fall back to stale data. Runs that do
+    not report their cost are charged ``default_run_cost``.
+    """
+
+    def __init__(self, max_concurrent: int = 4, max_queued: int = 32,
+                 hourly_budget: Optional[float] = None, default_run_cost: float = 0.01,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.hourly_budget = hourly_budget
+        self.default_run_cost = default_run_cost
+        self._clock = clock
+        self._running = 0
+        self._queued = 0
+        self._queues: "OrderedDict[Hashable, Deque[asyncio.Future]]" = OrderedDict()
+        self._spend: Deque[Tuple[float, float]] = deque()
+        self._spent = 0.0
+        self._stats = GovernorStats()
+
+    def spent_last_hour(self) -> float:
+        """Compute units charged over the last hour."""
+        cutoff = self._clock() - SPEND_WINDOW
+        while self._spend and self._spend[0][0] <= cutoff:
+            self._spent -= self._spend.popleft()[1]
+        return max(0.0, self._spent)
+
+    def _shed(self, reason: str) -> ApifyBusyError:
+        self._stats.shed += 1
+        return ApifyBusyError(f"Apify is busy ({reason}), please try again shortly")
+
+    async def acquire(self, tenant: Optional[Hashable] = None) -> None:
+        """Wait for a run slot, or raise ApifyBusyError if the request is shed."""
+        if self.hourly_budget is not None and self.spent_last_hour() >= self.hourly_budget:
+            raise self._shed("hourly compute budget used up")
+        if self._running < self.max_concurrent and not self._queued:
+            self._running += 1
+            return
+        if self._queued >= self.max_queued:
+            raise self._shed("too many runs queued")
+
+        tenant = tenant if tenant is not None else current_tenant.get()
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._queues.setdefault(tenant, deque())
+        queue.append(waiter)
+        self._queued += 1
+        try:
+            # release() hands its slot straight to us
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot arrived as we were cancelled; pass it on
+                self._hand_off()
+            elif waiter in queue:
+                queue.remove(waiter)
+                self._queued -= 1
+                if not queue and self._queues.get(tenant) is queue:
+                    del self._queues[tenant]
+            raise
+
+    def release(self, compute_units: Optional[float] = None) -> None:
+        """Give back a slot and charge the run that held it."""
+        cost = self.default_run_cost if compute_units is None else compute_units
+        self._spend.append((self._clock(), cost))
+        self._spent += cost
+        self._stats.runs += 1
+        self._hand_off()
+
+    def _hand_off(self) -> None:
+        """Pass a freed slot to the next tenant in turn, or free it."""
+        while self._queues:
+            tenant, queue = next(iter(self._queues.items()))
+            waiter = queue.popleft()
+            self._queued -= 1
+            if queue:
+                # Back of the line until every other tenant has had a turn
+                self._queues.move_to_end(tenant)
+            else:
+                del self._queues[tenant]
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._running -= 1
+
+    @asynccontextmanager
+    async def slot(self, tenant: Optional[Hashable] = None) -> AsyncIterator[RunSlot]:
+        """Hold a run slot for the duration of the block."""
+        await self.acquire(tenant)
+        run_slot = RunSlot()
+        try:
+            yield run_slot
+        finally:
+            self.release(run_slot.compute_units)
+
+    def stats(self) -> GovernorStats:
+        """Return a snapshot of the governor counters."""
+        return GovernorStats(
+            running=self._running,
+            queued=self._queued,
+            runs=self._stats.runs,
+            shed=self._stats.shed,
+            compute_units_last_hour=self.spent_last_hour()
+        )
@@ -0,0 +1,380 @@
+import functools
+import json
+import sqlite3
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from .matcher import KeywordMatcher
+from .models import Post, UserProfile
+from .sqlite_worker import AsyncSQLiteWorker, SQLiteDatabase
+from .store import dump_profile, load_profile
+
+# covered_from for an account whose whole history has been fetched
+BEGINNING_OF_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+# The trigram tokenizer can only look up terms of at least this many characters
+_MIN_FTS_TERM = 3
+
+def _timestamp(value: datetime) -> str:
+    """Format a datetime as fixed-width UTC ISO text, which sorts chronologically."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec='microseconds')
+
+def _create_posts(cursor):
+    """v1: posts, their authors and what time range has been fetched."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS posts (
+            id TEXT PRIMARY KEY,
+            username TEXT NOT NULL COLLATE NOCASE,
+            created_at TEXT NOT NULL,
+            content TEXT NOT NULL,
+            likes_count INTEGER NOT NULL,
+            replies_count INTEGER NOT NULL,
+            reposts_count INTEGER NOT NULL,
+            is_repost INTEGER NOT NULL
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_posts_username_created
+        ON posts (username, created_at)
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS authors (
+            username TEXT PRIMARY KEY COLLATE NOCASE,
+            profile TEXT NOT NULL
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS post_coverage (
+            username TEXT PRIMARY KEY COLLATE NOCASE,
+            covered_from TEXT NOT NULL,
+            covered_until TEXT NOT NULL
+        )
+    """)
+
+def _create_posts_fts(cursor):
+    """v2: trigram full-text index over post content, kept in sync by triggers."""
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+                content, content='posts', tokenize='trigram'
+            )
+        """)
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5 (or older than 3.34); searches scan instead
+        return
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+            INSERT INTO posts_fts (rowid, content) VALUES (new.rowid, new.content);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+            INSERT INTO posts_fts (posts_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF content ON posts BEGIN
+            INSERT INTO posts_fts (posts_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+            INSERT INTO posts_fts (rowid, content) VALUES (new.rowid, new.content);
+        END
+    """)
+
+def _add_author_updated_at(cursor):
+    """v3: when each author profile was last refreshed."""
+    cursor.execute("PRAGMA table_info(authors)")
+    if "updated_at" not in [col[1] for col in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE authors ADD COLUMN updated_at TEXT")
+
+# Applied in order; an index at user_version N has run the first N entries
+MIGRATIONS = [
+    _create_posts,
+    _create_posts_fts,
+    _add_author_updated_at,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+@dataclass
+class Coverage:
+    """The time range for which an account's posts are all in the index."""
+    username: str
+    covered_from: datetime
+    covered_until: datetime
+    newest_id: Optional[str] = None
+    post_count: int = 0
+
+    def covers(self, since: Optional[datetime], limit: Optional[int] = None) -> bool:
+        """Whether the index holds every post from ``since`` up to ``covered_until``.
+
+        With ``limit`` it is also enough to hold the newest ``limit`` posts.
+        """
+        if since is None and self.covered_from == BEGINNING_OF_TIME:
+            return True
+        if since is not None and self.covered_from <= since:
+            return True
+        return limit is not None and self.post_count >= limit
+
+class PostIndex(SQLiteDatabase):
+    """Local store of fetched posts with a full-text index over their content.
+
+    Posts are keyed by ID, so storing a post again just refreshes its
+    counters. Alongside the posts, each account records the time range
+    its posts are known to be complete for, so callers can tell which
+    part of a query has to go to the network.
+    """
+
+    migrations = MIGRATIONS
+
+    def __init__(self, db_path: str = "data/posts.db"):
+        super().__init__(db_path)
+
+    def _init_db(self):
+        """Run any pending migrations and note whether full-text search is available."""
+        super()._init_db()
+        self.fts = self._get_connection().execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'posts_fts'"
+        ).fetchone() is not None
+
+    def add_posts(self, username: str, posts: List[Post]) -> int:
+        """Insert or refresh posts for one account in a single transaction.
+
+        Returns the number of posts written.
+        """
+        return self.add_post_lists({username: posts})
+
+    def add_post_lists(self, posts_by_user: Dict[str, List[Post]]) -> int:
+        """Insert or refresh posts for many accounts in a single transaction.
+
+        Each account's author profile is refreshed from its posts. Returns
+        the number of posts written.
+        """
+        now = _timestamp(datetime.now(timezone.utc))
+        rows = []
+        authors = []
+        for username, posts in posts_by_user.items():
+            rows.extend(
+                (post.id, username, _timestamp(post.created_at), post.content,
+                 post.likes_count, post.replies_count, post.reposts_count,
+                 int(post.is_repost))
+                for post in posts
+            )
+            author = next((post.user for post in posts if isinstance(post.user, UserProfile)), None)
+            if author is not None:
+                authors.append((username, json.dumps(dump_profile(author)), now))
+
+        conn = self._get_connection()
+        with conn:
+            conn.executemany("""
+                INSERT INTO posts
+                (id, username, created_at, content, likes_count, replies_count,
+                 reposts_count, is_repost)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    content = excluded.content,
+                    likes_count = excluded.likes_count,
+                    replies_count = excluded.replies_count,
+                    reposts_count = excluded.reposts_count
+            """, rows)
+            self._upsert_authors(conn, authors)
+        return len(rows)
+
+    @staticmethod
+    def _upsert_authors(conn, authors: List[tuple]):
+        """Store (username, profile JSON, updated_at) rows."""
+        conn.executemany("""
+            INSERT INTO authors (username, profile, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (username) DO UPDATE SET
+                profile = excluded.profile,
+                updated_at = excluded.updated_at
+        """, authors)
+
+    def add_author(self, username: str, profile: UserProfile):
+        """Store a freshly fetched profile."""
+        conn = self._get_connection()
+        with conn:
+            now = _timestamp(datetime.now(timezone.utc))
+            self._upsert_authors(conn, [(username, json.dumps(dump_profile(profile)), now)])
+
+    def get_author(self, username: str, max_age: Optional[float] = None) -> Optional[UserProfile]:
+        """Get the stored profile for an account.
+
+        With ``max_age`` (seconds) profiles refreshed longer ago than that
+        are treated as missing.
+        """
+        row = self._get_connection().execute(
+            "SELECT profile, updated_at FROM authors WHERE username = ?", (username,)
+        ).fetchone()
+        if row is None:
+            return None
+        if max_age is not None:
+            if row['updated_at'] is None:
+                return None
+            age = datetime.now(timezone.utc) - datetime.fromisoformat(row['updated_at'])
+            if age.total_seconds() > max_age:
+                return None
+        return self._load_profile(row['profile'])
+
+    @staticmethod
+    def _load_profile(text: str) -> Optional[UserProfile]:
+        """Rebuild a stored profile, or None if it no longer fits the model.
+
+        Fields the model has since dropped are ignored; a profile missing a
+        field the model now needs is treated as not stored, so it gets
+        fetched again.
+        """
+        try:
+            data = json.loads(text)
+            known = {field.name for field in fields(UserProfile)}
+            return load_profile({name: value for name, value in data.items() if name in known})
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def record_coverage(self, username: str, covered_from: datetime, covered_until: datetime):
+        """Record that every post in a time range has been fetched.
+
+        A range that overlaps or touches the stored one is merged into it;
+        otherwise it replaces it, since the gap in between is unknown.
+        """
+        existing = self.get_coverage(username)
+        if (existing is not None
+                and covered_from <= existing.covered_until
+                and covered_until >= existing.covered_from):
+            covered_from = min(covered_from, existing.covered_from)
+            covered_until = max(covered_until, existing.covered_until)
+        conn = self._get_connection()
+        conn.execute("""
+            INSERT INTO post_coverage (username, covered_from, covered_until)
+            VALUES (?, ?, ?)
+            ON CONFLICT (username) DO UPDATE SET
+                covered_from = excluded.covered_from,
+                covered_until = excluded.covered_until
+        """, (username, _timestamp(covered_from), _timestamp(covered_until)))
+        conn.commit()
+
+    def get_coverage(self, username: str) -> Optional[Coverage]:
+        """Get the indexed time range for an account, with its newest post ID."""
+        row = self._get_connection().execute("""
+            SELECT c.username, c.covered_from, c.covered_until, (
+                SELECT id FROM posts p
+                WHERE p.username = c.username
+                ORDER BY p.created_at DESC
+                LIMIT 1
+            ) AS newest_id, (
+                SELECT COUNT(*) FROM posts p
+                WHERE p.username = c.username AND p.created_at >= c.covered_from
+            ) AS post_count
+            FROM post_coverage c
+            WHERE c.username = ?
+        """, (username,)).fetchone()
+        if row is None:
+            return None
+        return Coverage(
+            username=row['username'],
+            covered_from=datetime.fromisoformat(row['covered_from']),
+            covered_until=datetime.fromisoformat(row['covered_until']),
+            newest_id=row['newest_id'],
+            post_count=row['post_count']
+        )
+
+    @staticmethod
+    def _fts_query(matcher: Optional[KeywordMatcher]) -> Optional[str]:
+        """Build an FTS5 query that finds a superset of the matcher's hits.
+
+        Phrases become an AND of their words, since the text may separate
+        them with any whitespace. Returns None when some term is too short
+        for the index to look up.
+        """
+        if matcher is None or not matcher.include:
+            return None
+        alternatives = []
+        for term in matcher.include:
+            words = [word for word in term.split() if len(word) >= _MIN_FTS_TERM]
+            if not words:
+                return None
+            quoted = ['"' + word.replace('"', '""') + '"' for word in words]
+            alternatives.append("(" + " AND ".join(quoted) + ")")
+        return " OR ".join(alternatives)
+
+    def search(self, username: str, since: Optional[datetime] = None,
+               matcher: Optional[KeywordMatcher] = None,
+               limit: Optional[int] = None) -> List[Post]:
+        """Get an account's indexed posts, newest first.
+
+        Candidates are narrowed with the full-text index where possible and
+        then checked with the matcher, so results match its semantics exactly.
+        """
+        clauses = ["p.username = ?"]
+        params: List[Any] = [username]
+        if since is not None:
+            clauses.append("p.created_at >= ?")
+            params.append(_timestamp(since))
+
+        source = "posts p"
+        fts_query = self._fts_query(matcher) if self.fts else None
+        if fts_query is not None:
+            source = "posts_fts f JOIN posts p ON p.rowid = f.rowid"
+            clauses.append("posts_fts MATCH ?")
+            params.append(fts_query)
+
+        rows = self._get_connection().execute(f"""
+            SELECT p.* FROM {source}
+            WHERE {" AND ".join(clauses)}
+            ORDER BY p.created_at DESC
+        """, params).fetchall()
+
+        author = self.get_author(username) if rows else None
+        posts = [
+            Post(
+                id=row['id'],
+                content=row['content'],
+                created_at=datetime.fromisoformat(row['created_at']),
+                likes_count=row['likes_count'],
+                replies_count=row['replies_count'],
+                reposts_count=row['reposts_count'],
+                is_repost=bool(row['is_repost']),
+                user=author
+            )
+            for row in rows
+        ]
+        if matcher is not None:
+            posts = matcher.filter(posts)
+        return posts[:limit] if limit is not None else posts
+
+class AsyncPostIndex(AsyncSQLiteWorker):
+    """Asyncio facade over PostIndex, run on one dedicated worker thread."""
+
+    def __init__(self, db_path: str = "data/posts.db"):
+        self.db_path = db_path
+        super().__init__(functools.partial(PostIndex, db_path), thread_name_prefix="post-index")
+
+    async def add_posts(self, username: str, posts: List[Post]) -> int:
+        """Insert or refresh posts for one account in a single transaction."""
+        return await self._run("add_posts", username, posts)
+
+    async def add_post_lists(self, posts_by_user: Dict[str, List[Post]]) -> int:
+        """Insert or refresh posts for many accounts in a single transaction."""
+        return await self._run("add_post_lists", posts_by_user)
+
+    async def add_author(self, username: str, profile: UserProfile):
+        """Store a freshly fetched profile."""
+        await self._run("add_author", username, profile)
+
+    async def get_author(self, username: str, max_age: Optional[float] = None) -> Optional[UserProfile]:
+        """Get the stored profile for an account."""
+        return await self._run("get_author", username, max_age)
+
+    async def record_coverage(self, username: str, covered_from: datetime, covered_until: datetime):
+        """Record that every post in a time range has been fetched."""
+        await self._run("record_coverage", username, covered_from, covered_until)
+
+    async def get_coverage(self, username: str) -> Optional[Coverage]:
+        """Get the indexed time range for an account, with its newest post ID."""
+        return await self._run("get_coverage", username)
+
+    async def search(self, username: str, since: Optional[datetime] = None,
+                     matcher: Optional[KeywordMatcher] = None,
+                     limit: Optional[int] = None) -> List[Post]:
+        """Get an account's indexed posts, newest first."""
+        return await self._run("search", username, since, matcher, limit)
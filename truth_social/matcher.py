@@ -0,0 +1,135 @@
+from functools import lru_cache
+from typing import Iterable, List, Optional, Pattern, Tuple, TypeVar
+import re
+
+T = TypeVar('T')
+
+# Marks the end of a term in the trie
+_END = ''
+
+# Longest query compile_query accepts, keeping the compiled regex small
+MAX_QUERY_LENGTH = 200
+
+def _trie_pattern(root: dict) -> str:
+    """Emit a regex for a trie, sharing common prefixes between terms.
+
+    Nodes are visited children-first from an explicit stack, so long
+    terms cannot exhaust the interpreter's recursion limit.
+    """
+    patterns = {}
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        children = [(token, child) for token, child in node.items() if token != _END]
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for _, child in children)
+            continue
+        branches = [
+            (r"\s+" if token == " " else re.escape(token)) + patterns.pop(id(child))
+            for token, child in children
+        ]
+        if not branches:
+            pattern = ""
+        elif len(branches) == 1 and _END not in node:
+            pattern = branches[0]
+        else:
+            group = "(?:" + "|".join(branches) + ")"
+            # Greedy, so the longest term wins when one is a prefix of another
+            pattern = group + "?" if _END in node else group
+        patterns[id(node)] = pattern
+    return patterns[id(root)]
+
+def _compile(terms: Iterable[str], whole_word: bool) -> Optional[Pattern]:
+    """Compile case-folded terms into a single prefix-trie regex.
+
+    A flat alternation makes the regex engine try every term at every
+    position; with the terms merged into a trie it only follows branches
+    that match the next character, so the cost tracks text length rather
+    than the number of terms.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for token in term:
+            node = node.setdefault(token, {})
+        node[_END] = {}
+    if not trie:
+        return None
+    pattern = _trie_pattern(trie)
+    if whole_word:
+        pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+    return re.compile(pattern)
+
+class KeywordMatcher:
+    """Matches text against a set of keywords and phrases in a single pass.
+
+    All included terms are compiled into one regex, so a check scans the
+    text once however many keywords there are, and the text is case-folded
+    once per check. Text matches when it contains any included term (or
+    there are none) and no excluded term. Whitespace inside a phrase
+    matches any run of whitespace. With ``whole_word`` a term only matches
+    between word boundaries, so "war" does not match "software".
+    """
+
+    def __init__(self, include: Iterable[str] = (), exclude: Iterable[str] = (),
+                 whole_word: bool = False):
+        self.include = self._normalize(include)
+        self.exclude = self._normalize(exclude)
+        self.whole_word = whole_word
+        self._include = _compile(self.include, whole_word)
+        self._exclude = _compile(self.exclude, whole_word)
+
+    @staticmethod
+    def _normalize(terms: Iterable[str]) -> Tuple[str, ...]:
+        """Case-fold terms, collapse inner whitespace and drop blanks."""
+        normalized = (" ".join(term.casefold().split()) for term in terms)
+        return tuple(term for term in normalized if term)
+
+    @classmethod
+    def parse(cls, query: str, whole_word: bool = False) -> 'KeywordMatcher':
+        """Build a matcher from a comma-separated query.
+
+        Each term may be a single word or a phrase, optionally in quotes.
+        A leading ``-`` excludes the term, e.g. ``election, "voter id", -poll``.
+        """
+        include, exclude = [], []
+        for term in query.split(','):
+            term = term.strip()
+            target = include
+            if term.startswith('-'):
+                target = exclude
+                term = term[1:].strip()
+            target.append(term.strip('"\''))
+        return cls(include, exclude, whole_word)
+
+    def matches(self, text: str) -> bool:
+        """Whether the text satisfies the query."""
+        folded = text.casefold()
+        if self._exclude is not None and self._exclude.search(folded):
+            return False
+        return self._include is None or self._include.search(folded) is not None
+
+    def filter(self, posts: Iterable[T]) -> List[T]:
+        """Return the posts whose content matches, in their original order."""
+        return [post for post in posts if self.matches(post.content)]
+
+    def __bool__(self) -> bool:
+        return bool(self.include or self.exclude)
+
+    def __repr__(self) -> str:
+        return (f"KeywordMatcher(include={self.include!r}, exclude={self.exclude!r}, "
+                f"whole_word={self.whole_word!r})")
+
+def compile_query(query: str, whole_word: bool = False) -> KeywordMatcher:
+    """Parse a query into a matcher, reusing it for repeated queries.
+
+    Raises ValueError for queries longer than ``MAX_QUERY_LENGTH``.
+    """
+    if len(query) > MAX_QUERY_LENGTH:
+        raise ValueError(f"Keywords must be at most {MAX_QUERY_LENGTH} characters")
+    return _compile_query(query, whole_word)
+
+@lru_cache(maxsize=256)
+def _compile_query(query: str, whole_word: bool) -> KeywordMatcher:
+    return KeywordMatcher.parse(query, whole_word)
@@ -1,8 +1,15 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-@dataclass
+# Models are slotted: thousands of posts sit in the cache and index per
+# account, and without a per-instance __dict__ each one is a fraction of
+# the size. Profiles are also frozen, which makes it safe to share one
+# between every post by an author. Posts are not: a frozen dataclass
+# sets each field through object.__setattr__, which makes building one
+# several times slower, and posts are built by the thousand.
+
+@dataclass(frozen=True, slots=True)
 class User:
     """Represents a Truth Social user."""
     id: str
@@ -16,7 +23,7 @@ class User:
     total_likes: Optional[int] = None
     total_replies: Optional[int] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserProfile:
     """Represents a Truth Social user profile."""
     username: str
@@ -30,7 +37,7 @@ class UserProfile:
     location: Optional[str] = None
     avatar_url: Optional[str] = None
     
-@dataclass
+@dataclass(slots=True)
 class Post:
     """Represents a Truth Social post."""
     id: str
@@ -43,9 +50,44 @@ class Post:
     user: Optional[Union[User, UserProfile]] = None
     original_post: Optional['Post'] = None
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PostList:
     """Represents a list of posts with pagination info."""
     posts: List[Post]
     next_cursor: Optional[str] = None
-    previous_cursor: Optional[str] = None 
\ No newline at end of file
+    previous_cursor: Optional[str] = None
+
+@dataclass(frozen=True, slots=True)
+class Served:
+    """A response, and when it was fetched if it is past its freshness window."""
+    value: Any
+    as_of: Optional[datetime] = None
+
+    @property
+    def stale(self) -> bool:
+        """Whether the value is being refreshed in the background."""
+        return self.as_of is not None
+
+class ProfileInterner:
+    """Hands out one shared instance per distinct author profile.
+    
+    Every fetch parses the author again; interning means posts from
+    repeated fetches of an unchanged account all point at the same
+    profile. Only the latest profile per account is kept, so the table
+    grows with the number of accounts, not the number of fetches.
+    """
+    
+    def __init__(self):
+        self._profiles: Dict[str, UserProfile] = {}
+        
+    def intern(self, profile: UserProfile) -> UserProfile:
+        """Return the shared instance equal to ``profile``."""
+        key = profile.username.lower()
+        current = self._profiles.get(key)
+        if current == profile:
+            return current
+        self._profiles[key] = profile
+        return profile
+        
+    def __len__(self) -> int:
+        return len(self._profiles)
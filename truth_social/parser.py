@@ -0,0 +1,143 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+import html
+import re
+
+from .models import Post, ProfileInterner, UserProfile
+
+class MalformedItemError(ValueError):
+    """A dataset item is missing a field or has a field of the wrong type."""
+    pass
+
+@lru_cache(maxsize=8192)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, reusing the result for values seen before.
+
+    Account creation times repeat on every item, and ingestion re-fetches
+    the same recent posts every few minutes, so most lookups are hits and
+    equal timestamps share one datetime object.
+    """
+    return datetime.fromisoformat(value)
+
+_PARAGRAPH = re.compile(r"</p>\s*<p[^>]*>", re.IGNORECASE)
+_LINE_BREAK = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]*>")
+
+@lru_cache(maxsize=1024)
+def html_to_text(value: str) -> str:
+    """Convert the small HTML subset Truth Social uses in bios to plain text.
+
+    Paragraphs become blank-line separated, ``<br>`` becomes a newline,
+    other tags are dropped and entities such as ``&amp;`` are decoded.
+    """
+    if "<" not in value and "&" not in value:
+        return value
+    text = _PARAGRAPH.sub("\n\n", value)
+    text = _LINE_BREAK.sub("\n", text)
+    text = _TAG.sub("", text)
+    return html.unescape(text).strip()
+
+def _field_error(where: str, error: Exception) -> MalformedItemError:
+    """Describe a failed lookup or conversion on an item."""
+    if isinstance(error, KeyError):
+        return MalformedItemError(f"{where} is missing {error}")
+    return MalformedItemError(f"{where} has an invalid field: {error}")
+
+def parse_profile(account: Dict[str, Any]) -> UserProfile:
+    """Convert a dataset account record into a UserProfile."""
+    try:
+        return UserProfile(
+            username=account['username'],
+            display_name=account['display_name'],
+            bio=html_to_text(account.get('note') or ''),
+            followers_count=account['followers_count'],
+            following_count=account['following_count'],
+            posts_count=account['statuses_count'],
+            created_at=parse_timestamp(account['created_at']),
+            is_verified=bool(account['verified'])
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise _field_error("account", e) from None
+
+def parse_post(item: Dict[str, Any], author: Optional[UserProfile]) -> Post:
+    """Convert a dataset item into a Post by an already parsed author."""
+    try:
+        # Positional, in field order: this runs for every post fetched
+        return Post(
+            str(item['id']),
+            item['content'] or '',
+            parse_timestamp(item['created_at']),
+            item['favourites_count'],
+            item['replies_count'],
+            item['reblogs_count'],
+            item.get('reblog') is not None,
+            author
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise _field_error("post", e) from None
+
+@dataclass
+class ItemError:
+    """A dataset item that could not be parsed."""
+    index: int
+    item_id: Optional[str]
+    reason: str
+
+    def __str__(self) -> str:
+        label = self.item_id if self.item_id is not None else f"#{self.index}"
+        return f"item {label}: {self.reason}"
+
+@dataclass
+class ParseResult:
+    """Posts parsed from a batch of dataset items, and the items that failed."""
+    posts: List[Post] = field(default_factory=list)
+    errors: List[ItemError] = field(default_factory=list)
+
+class ItemParser:
+    """Converts Apify dataset items into models in a single pass.
+
+    Each account's profile is parsed once per batch and interned, so every
+    post by an account shares one profile. A malformed item is reported in
+    the result instead of failing the rest of the batch.
+    """
+
+    def __init__(self, interner: Optional[ProfileInterner] = None):
+        self.interner = interner if interner is not None else ProfileInterner()
+
+    def profile(self, item: Dict[str, Any]) -> UserProfile:
+        """Parse and intern the author of a dataset item."""
+        try:
+            account = item['account']
+        except (KeyError, TypeError) as e:
+            raise _field_error("item", e) from None
+        return self.interner.intern(parse_profile(account))
+
+    def parse_item(self, item: Dict[str, Any], authors: Dict[str, UserProfile]) -> Post:
+        """Parse one item, reusing profiles already parsed into ``authors``."""
+        try:
+            author = authors.get(item['account']['username'])
+        except (KeyError, TypeError) as e:
+            raise _field_error("item", e) from None
+        if author is None:
+            author = self.profile(item)
+            authors[author.username] = author
+        return parse_post(item, author)
+
+    def parse_items(self, items: Iterable[Dict[str, Any]]) -> ParseResult:
+        """Parse a batch of items, collecting the ones that fail."""
+        result = ParseResult()
+        authors: Dict[str, UserProfile] = {}
+        # Bound once, outside the per-item loop
+        parse_item = self.parse_item
+        append = result.posts.append
+        for index, item in enumerate(items):
+            try:
+                append(parse_item(item, authors))
+            except MalformedItemError as e:
+                item_id = item.get('id') if isinstance(item, dict) else None
+                result.errors.append(ItemError(
+                    index, str(item_id) if item_id is not None else None, str(e)
+                ))
+        return result
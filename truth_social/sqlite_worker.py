@@ -0,0 +1,116 @@
+import asyncio
+import functools
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+# A migration takes a cursor and brings the schema up one version
+Migration = Callable[[sqlite3.Cursor], None]
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """Open a connection with name-addressable rows, in WAL mode for file databases."""
+    connection = sqlite3.connect(db_path)
+    connection.row_factory = sqlite3.Row
+    if db_path != ":memory:":
+        # WAL lets readers run alongside the writer, and NORMAL only
+        # fsyncs at checkpoints, which is safe in WAL mode.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+def migrate(connection: sqlite3.Connection, migrations: List[Migration]) -> None:
+    """Run the migrations a database has not yet applied, tracked in user_version.
+
+    A database at user_version N has run the first N entries; each one is
+    committed along with its version bump.
+    """
+    cursor = connection.cursor()
+    version = cursor.execute("PRAGMA user_version").fetchone()[0]
+    for target, migration in enumerate(migrations[version:], start=version + 1):
+        migration(cursor)
+        cursor.execute(f"PRAGMA user_version = {target}")
+        connection.commit()
+
+class SQLiteDatabase:
+    """Base for a SQLite-backed store with one lazily opened connection.
+
+    Subclasses list their schema steps in ``migrations``; pending ones run
+    when the instance is created. Call ``close()`` (or use the instance as
+    a context manager) to release the connection.
+    """
+
+    migrations: List[Migration] = []
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection: Optional[sqlite3.Connection] = None
+        # Only create directories if not using in-memory database
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the shared database connection, opening it if needed."""
+        if self.connection is None:
+            self.connection = connect(self.db_path)
+        return self.connection
+
+    def _init_db(self):
+        """Bring the schema up to date by running any pending migrations."""
+        migrate(self._get_connection(), self.migrations)
+
+    def close(self):
+        """Close the database connection."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class AsyncSQLiteWorker:
+    """Asyncio facade that runs a store's methods on one dedicated worker thread.
+
+    The event loop never waits on disk I/O or SQLite locks, and the
+    store's connection is only ever touched by that thread. The store is
+    built lazily on the worker, by ``open_store``, on the first call.
+    """
+
+    def __init__(self, open_store: Callable[[], Any], thread_name_prefix: str):
+        self._open_store = open_store
+        self._store: Any = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=thread_name_prefix)
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        """Invoke a store method. Runs on the worker thread."""
+        if self._store is None:
+            self._store = self._open_store()
+        return getattr(self._store, method)(*args, **kwargs)
+
+    async def _run(self, method: str, *args, **kwargs) -> Any:
+        """Queue a store call on the worker thread and await its result."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._call, method, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def _close(self) -> None:
+        """Close the store if it was ever opened. Runs on the worker thread."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    async def close(self):
+        """Finish queued calls, close the database and stop the worker thread."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
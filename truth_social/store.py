@@ -0,0 +1,231 @@
+import functools
+import json
+import logging
+import time
+from concurrent.futures import Future
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, Hashable, Optional, Tuple
+from .models import Post, PostList, UserProfile
+from .sqlite_worker import AsyncSQLiteWorker, SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+# Version of the stored JSON layout. Bump it whenever encode_value's output
+# or the models it rebuilds change shape; rows of any other version are
+# dropped rather than decoded.
+FORMAT_VERSION = 1
+
+def dump_profile(profile: UserProfile) -> Dict[str, Any]:
+    """Serialize a profile to a JSON-ready dict."""
+    data = asdict(profile)
+    data['created_at'] = profile.created_at.isoformat()
+    return data
+
+def load_profile(data: Dict[str, Any]) -> UserProfile:
+    """Rebuild a profile written by ``dump_profile``. Raises if it no longer fits the model."""
+    return UserProfile(**{**data, 'created_at': datetime.fromisoformat(data['created_at'])})
+
+def _dump_post(post: Post, authors: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Serialize a post, moving its author into ``authors`` so each is stored once."""
+    user = None
+    if post.user is not None:
+        if not isinstance(post.user, UserProfile):
+            raise TypeError(f"cannot store author of type {type(post.user).__name__}")
+        user = post.user.username
+        if user not in authors:
+            authors[user] = dump_profile(post.user)
+    return {
+        'id': post.id,
+        'content': post.content,
+        'created_at': post.created_at.isoformat(),
+        'likes_count': post.likes_count,
+        'replies_count': post.replies_count,
+        'reposts_count': post.reposts_count,
+        'is_repost': post.is_repost,
+        'user': user,
+        'original_post': _dump_post(post.original_post, authors) if post.original_post else None
+    }
+
+def _load_post(data: Dict[str, Any], authors: Dict[str, UserProfile]) -> Post:
+    return Post(
+        data['id'],
+        data['content'],
+        datetime.fromisoformat(data['created_at']),
+        data['likes_count'],
+        data['replies_count'],
+        data['reposts_count'],
+        data['is_repost'],
+        authors.get(data['user']) if data['user'] is not None else None,
+        _load_post(data['original_post'], authors) if data['original_post'] else None
+    )
+
+def encode_value(value: Any) -> str:
+    """Serialize a cached UserProfile or PostList to JSON. Raises TypeError for anything else."""
+    if isinstance(value, UserProfile):
+        return json.dumps({'profile': dump_profile(value)})
+    if isinstance(value, PostList):
+        authors: Dict[str, Dict[str, Any]] = {}
+        posts = [_dump_post(post, authors) for post in value.posts]
+        return json.dumps({
+            'posts': posts,
+            'authors': authors,
+            'next_cursor': value.next_cursor,
+            'previous_cursor': value.previous_cursor
+        })
+    raise TypeError(f"cannot store value of type {type(value).__name__}")
+
+def decode_value(text: str) -> Any:
+    """Rebuild a value written by ``encode_value``."""
+    data = json.loads(text)
+    if 'profile' in data:
+        return load_profile(data['profile'])
+    authors = {username: load_profile(profile) for username, profile in data['authors'].items()}
+    return PostList(
+        posts=[_load_post(post, authors) for post in data['posts']],
+        next_cursor=data['next_cursor'],
+        previous_cursor=data['previous_cursor']
+    )
+
+def encode_key(key: Hashable) -> str:
+    """Cache keys are tuples of strings, bools and ints, stored as JSON arrays."""
+    return json.dumps(list(key) if isinstance(key, tuple) else key)
+
+def _create_responses(cursor):
+    """v1: one row per cached response."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            stored_at REAL NOT NULL,
+            discard_at REAL NOT NULL,
+            format INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+def _add_response_format(cursor):
+    """v2: layout version of each row, for tables created before it existed.
+
+    Rows written before versioning count as format 0 and get purged.
+    """
+    cursor.execute("PRAGMA table_info(responses)")
+    if "format" not in [col[1] for col in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE responses ADD COLUMN format INTEGER NOT NULL DEFAULT 0")
+
+# Applied in order; a store at user_version N has run the first N entries
+MIGRATIONS = [
+    _create_responses,
+    _add_response_format,
+]
+
+class ResponseStore(SQLiteDatabase):
+    """SQLite table of cached responses, so a restarted bot starts warm.
+
+    Each row holds a response as JSON with the wall-clock time it was
+    fetched and the time after which it is useless even as a stale
+    answer. Rows past that time are purged whenever the store is opened.
+    """
+
+    migrations = MIGRATIONS
+
+    def __init__(self, db_path: str = "data/cache.db"):
+        super().__init__(db_path)
+
+    def _init_db(self):
+        """Bring the schema up to date and drop rows that have outlived their use."""
+        super()._init_db()
+        self.purge()
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """Get ``(stored_at, value)`` for a key, or None if missing or past its discard time.
+
+        A row that cannot be decoded, or was written in another format, is
+        dropped and treated as missing.
+        """
+        row = self._get_connection().execute(
+            "SELECT value, stored_at, discard_at, format FROM responses WHERE key = ?", (encode_key(key),)
+        ).fetchone()
+        if row is None or row[2] <= time.time():
+            return None
+        try:
+            if row[3] != FORMAT_VERSION:
+                raise ValueError(f"format {row[3]}, expected {FORMAT_VERSION}")
+            return row[1], decode_value(row[0])
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Dropping unreadable cached response for {key!r}: {e}")
+            self.delete(key)
+            return None
+
+    def put(self, key: Hashable, value: Any, stored_at: float, discard_at: float):
+        """Store a response, replacing any earlier one for the key."""
+        conn = self._get_connection()
+        with conn:
+            conn.execute("""
+                INSERT INTO responses (key, value, stored_at, discard_at, format) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = excluded.value,
+                    stored_at = excluded.stored_at,
+                    discard_at = excluded.discard_at,
+                    format = excluded.format
+            """, (encode_key(key), encode_value(value), stored_at, discard_at, FORMAT_VERSION))
+
+    def delete(self, key: Hashable):
+        """Drop a single response if present."""
+        conn = self._get_connection()
+        with conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (encode_key(key),))
+
+    def clear(self):
+        """Drop every response."""
+        conn = self._get_connection()
+        with conn:
+            conn.execute("DELETE FROM responses")
+
+    def purge(self) -> int:
+        """Drop responses past their discard time or in another format. Returns how many were dropped."""
+        conn = self._get_connection()
+        with conn:
+            return conn.execute(
+                "DELETE FROM responses WHERE discard_at <= ? OR format != ?", (time.time(), FORMAT_VERSION)
+            ).rowcount
+
+    def __len__(self) -> int:
+        return self._get_connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+class AsyncResponseStore(AsyncSQLiteWorker):
+    """Asyncio facade over ResponseStore, run on one dedicated worker thread.
+
+    Writes are queued without waiting for them, so storing a response
+    never delays the command that fetched it; the single worker thread
+    keeps them in order.
+    """
+
+    def __init__(self, db_path: str = "data/cache.db"):
+        self.db_path = db_path
+        super().__init__(functools.partial(ResponseStore, db_path), thread_name_prefix="response-store")
+
+    def _submit(self, method: str, *args) -> None:
+        """Queue a ResponseStore call without waiting, logging it if it fails."""
+        future = self._executor.submit(self._call, method, *args)
+        future.add_done_callback(functools.partial(self._log_failure, method))
+
+    @staticmethod
+    def _log_failure(method: str, future: Future) -> None:
+        if future.exception() is not None:
+            logger.warning(f"Response store {method} failed: {future.exception()}")
+
+    async def get(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """Get ``(stored_at, value)`` for a key, or None if missing or past its discard time."""
+        return await self._run("get", key)
+
+    def save(self, key: Hashable, value: Any, stored_at: float, discard_at: float) -> None:
+        """Queue a response to be stored."""
+        self._submit("put", key, value, stored_at, discard_at)
+
+    def delete(self, key: Hashable) -> None:
+        """Queue a response to be dropped."""
+        self._submit("delete", key)
+
+    def clear(self) -> None:
+        """Queue every response to be dropped."""
+        self._submit("clear")